@@ -0,0 +1,276 @@
+"""Кеш ограниченного размера поверх хеш-таблицы с вытеснением."""
+import time
+from typing import Any, Callable, Dict, Optional
+
+from hash_table_chaining import HashTableChaining
+
+POLICIES = ('lru', 'lfu', 'ttl')
+
+
+class _Node:
+    """Запись кеша, одновременно являющаяся узлом двусвязного списка."""
+
+    __slots__ = ('key', 'value', 'prev', 'next', 'freq', 'expires')
+
+    def __init__(self, key: str, value: Any, expires: float):
+        self.key = key
+        self.value = value
+        self.prev: Optional['_Node'] = None
+        self.next: Optional['_Node'] = None
+        self.freq = 1
+        self.expires = expires
+
+
+class _LinkedList:
+    """
+    Интрузивный двусвязный список с фиктивным узлом.
+
+    Узлы хранят ссылки на соседей сами, поэтому удаление произвольного
+    узла выполняется за O(1) без поиска.
+    """
+
+    __slots__ = ('head', 'length')
+
+    def __init__(self):
+        self.head = _Node('', None, 0.0)
+        self.head.prev = self.head.next = self.head
+        self.length = 0
+
+    def push_front(self, node: _Node) -> None:
+        """Добавление узла в начало. Сложность: O(1)"""
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node  # type: ignore
+        self.head.next = node
+        self.length += 1
+
+    def remove(self, node: _Node) -> None:
+        """Исключение узла из списка. Сложность: O(1)"""
+        node.prev.next = node.next  # type: ignore
+        node.next.prev = node.prev  # type: ignore
+        node.prev = node.next = None
+        self.length -= 1
+
+    def back(self) -> Optional[_Node]:
+        """Последний узел или None для пустого списка."""
+        return None if self.length == 0 else self.head.prev
+
+    def __len__(self) -> int:
+        """Количество узлов в списке."""
+        return self.length
+
+
+class _FrequencyList(_LinkedList):
+    """
+    Список записей с одинаковой частотой обращений.
+
+    Непустые списки частот связаны в кольцо по возрастанию частоты,
+    поэтому список минимальной частоты всегда следует за фиктивным.
+    """
+
+    __slots__ = ('freq', 'lower', 'higher')
+
+    def __init__(self, freq: int):
+        super().__init__()
+        self.freq = freq
+        self.lower: '_FrequencyList' = self
+        self.higher: '_FrequencyList' = self
+
+
+class Cache:
+    """
+    Кеш с ограниченной емкостью.
+
+    Поиск записи по ключу выполняет хеш-таблица (по умолчанию
+    HashTableChaining), а порядок вытеснения задают двусвязные списки
+    записей. Все операции выполняются за O(1) в среднем.
+
+    Политики:
+    - 'lru': вытесняется запись, к которой дольше всего не обращались
+    - 'lfu': вытесняется запись с наименьшим числом обращений, среди
+      равных - давно не использованная. Для каждой частоты ведется свой
+      список, а списки упорядочены по частоте в кольце, так что
+      минимальная частота известна за O(1) и после удалений и истечений
+    - 'ttl': запись живет ttl секунд после последней записи; при
+      переполнении вытесняется та, что истечет раньше всех
+
+    При заданном ttl истекшие записи не возвращаются и в политиках
+    'lru' и 'lfu', но удаляются лениво - при обращении или вытеснении.
+    """
+
+    def __init__(self, capacity: int, policy: str = 'lru',
+                 ttl: Optional[float] = None,
+                 table_factory: Callable = HashTableChaining,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            capacity: Максимальное количество записей
+            policy: Политика вытеснения: 'lru', 'lfu' или 'ttl'
+            ttl: Время жизни записи в секундах (обязательно для 'ttl')
+            table_factory: Конструктор хеш-таблицы с методами insert,
+                search и delete
+            clock: Источник времени (подменяется в тестах и бенчмарках)
+        """
+        if capacity < 1:
+            raise ValueError("capacity должен быть положительным")
+        if policy not in POLICIES:
+            raise ValueError(f"Неизвестная политика вытеснения: {policy}")
+        if policy == 'ttl' and ttl is None:
+            raise ValueError("Для политики 'ttl' требуется ttl")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.clock = clock
+        self.table = table_factory()
+
+        self._order = _LinkedList()
+        self._frequencies: Dict[int, _FrequencyList] = {}
+        self._by_freq = _FrequencyList(0)
+        self._count = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expires(self) -> float:
+        """Момент истечения записи, созданной или обновленной сейчас."""
+        if self.ttl is None:
+            return float('inf')
+        return self.clock() + self.ttl
+
+    def _link(self, node: _Node,
+              lower: Optional[_FrequencyList] = None) -> None:
+        """
+        Включение записи в списки политики.
+
+        lower - список частоты ниже node.freq, за которым в кольце
+        встает новый список частоты; по умолчанию начало кольца.
+        """
+        if self.policy != 'lfu':
+            self._order.push_front(node)
+            return
+        bucket = self._frequencies.get(node.freq)
+        if bucket is None:
+            if lower is None:
+                lower = self._by_freq
+            bucket = self._frequencies[node.freq] = _FrequencyList(node.freq)
+            bucket.lower = lower
+            bucket.higher = lower.higher
+            lower.higher.lower = bucket
+            lower.higher = bucket
+        bucket.push_front(node)
+
+    def _release(self, bucket: _FrequencyList) -> None:
+        """Удаление опустевшего списка частоты из кольца."""
+        if not bucket:
+            del self._frequencies[bucket.freq]
+            bucket.lower.higher = bucket.higher
+            bucket.higher.lower = bucket.lower
+
+    def _unlink(self, node: _Node) -> None:
+        """Исключение записи из списков политики."""
+        if self.policy != 'lfu':
+            self._order.remove(node)
+            return
+        bucket = self._frequencies[node.freq]
+        bucket.remove(node)
+        self._release(bucket)
+
+    def _touch(self, node: _Node) -> None:
+        """Учет обращения к записи. Сложность: O(1)"""
+        if self.policy == 'lru':
+            self._order.remove(node)
+            self._order.push_front(node)
+        elif self.policy == 'lfu':
+            bucket = self._frequencies[node.freq]
+            bucket.remove(node)
+            node.freq += 1
+            # Список частоты freq + 1 встает сразу за списком freq
+            self._link(node, bucket)
+            self._release(bucket)
+
+    def _drop(self, node: _Node) -> None:
+        """Удаление записи из таблицы и списков."""
+        self._unlink(node)
+        self.table.delete(node.key)
+        self._count -= 1
+
+    def _victim(self) -> _Node:
+        """Запись, вытесняемая при переполнении. Сложность: O(1)"""
+        if self.policy == 'lfu':
+            return self._by_freq.higher.back()  # type: ignore
+        return self._order.back()  # type: ignore
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Значение по ключу с учетом обращения.
+
+        Сложность: O(1) в среднем
+        """
+        node = self.table.search(key)
+        if node is not None and node.expires <= self.clock():
+            self._drop(node)
+            self.expirations += 1
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Запись значения с вытеснением при переполнении.
+
+        Обновление существующего ключа считается обращением к нему
+        и продлевает срок жизни записи.
+
+        Сложность: O(1) в среднем
+        """
+        node = self.table.search(key)
+        if node is not None:
+            node.value = value
+            node.expires = self._expires()
+            if self.policy == 'ttl':
+                self._order.remove(node)
+                self._order.push_front(node)
+            else:
+                self._touch(node)
+            return
+
+        if self._count >= self.capacity:
+            victim = self._victim()
+            self._drop(victim)
+            if victim.expires <= self.clock():
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+        node = _Node(key, value, self._expires())
+        self.table.insert(key, node)
+        self._link(node)
+        self._count += 1
+
+    def delete(self, key: str) -> None:
+        """Удаление записи. Сложность: O(1) в среднем"""
+        node = self.table.search(key)
+        if node is not None:
+            self._drop(node)
+
+    def stats(self) -> Dict[str, float]:
+        """Счетчики попаданий, промахов, вытеснений и истечений."""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': self.hits / requests if requests else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """Количество записей в кеше (включая еще не удаленные истекшие)."""
+        return self._count
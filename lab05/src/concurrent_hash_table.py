@@ -0,0 +1,256 @@
+"""Потокобезопасный метод цепочек с полосовыми блокировками."""
+import threading
+from typing import Any, Callable, List, Tuple
+
+from hash_functions import djb2_hash
+from hash_table_chaining import MISSING, Bucket, SortedBucket, bucket_get
+
+
+class ConcurrentHashTableChaining:
+    """Метод цепочек с полосовыми (striped) блокировками."""
+
+    def __init__(self, size: int = 16, hash_func: Callable = djb2_hash,
+                 stripes: int = 16,
+                 max_load_factor: float = 0.75,
+                 min_load_factor: float = 0.1,
+                 treeify_threshold: int = 8,
+                 untreeify_threshold: int = 6):
+        """
+        Хеш-таблица методом цепочек для одновременной работы потоков.
+
+        Корзины разбиты на stripes полос: корзина index охраняется
+        блокировкой index % stripes, поэтому записи в разные полосы не
+        мешают друг другу. Корзины никогда не изменяются на месте: запись
+        строит копию корзины и подменяет ссылку в таблице, а таблица
+        вместе с размером публикуется одним кортежем. Поэтому поиск
+        выполняется без блокировок и всегда видит целостную корзину.
+
+        Масштабирование захватывает все полосы по порядку, перестраивает
+        таблицу целиком и публикует новую. Запись, начатая до
+        масштабирования, после захвата своей полосы замечает смену таблицы
+        и повторяется.
+
+        Args:
+            size: Начальный размер хеш-таблицы
+            hash_func: Хеш-функция
+            stripes: Количество блокировок
+            max_load_factor: Порог заполнения для увеличения таблицы
+            min_load_factor: Порог заполнения для уменьшения таблицы,
+                меньший max_load_factor / 2
+            treeify_threshold: Длина цепочки, выше которой корзина
+                становится упорядоченной
+            untreeify_threshold: Длина упорядоченной корзины, ниже которой
+                она снова становится списком
+        """
+        if stripes < 1:
+            raise ValueError("stripes должен быть положительным")
+        # Иначе таблица сразу после удвоения оказывается ниже порога
+        # уменьшения и колеблется между двумя размерами
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("Некорректные пороги коэффициента заполнения")
+        if not 0 <= untreeify_threshold < treeify_threshold:
+            raise ValueError("Некорректные пороги упорядочивания корзин")
+
+        self.hash_func = hash_func
+        self.stripes = stripes
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.treeify_threshold = treeify_threshold
+        self.untreeify_threshold = untreeify_threshold
+
+        self._initial_size = size
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Счетчики элементов по полосам изменяются только под блокировкой
+        # своей полосы, поэтому общий счетчик не становится узким местом
+        self._counts = [0] * stripes
+        self._state: Tuple[List[Bucket], int] = (
+            [[] for _ in range(size)], size)
+
+    @property
+    def size(self) -> int:
+        """Текущий размер таблицы."""
+        return self._state[1]
+
+    @property
+    def table(self) -> List[Bucket]:
+        """Текущий массив корзин (только для чтения)."""
+        return self._state[0]
+
+    def load_factor(self) -> float:
+        """Текущий коэффициент заполнения."""
+        return len(self) / self.size
+
+    def _lock_bucket(self, key: str
+                     ) -> Tuple[Tuple[List[Bucket], int], int, int]:
+        """
+        Захват полосы, которой принадлежит корзина ключа.
+
+        Returns:
+            Опубликованное состояние, индекс корзины и номер полосы
+        """
+        while True:
+            state = self._state
+            index = self.hash_func(key, state[1])
+            stripe = index % self.stripes
+            self._locks[stripe].acquire()
+            if self._state is state:
+                return state, index, stripe
+            # Пока ждали блокировку, таблицу перестроили
+            self._locks[stripe].release()
+
+    def _with_added(self, bucket: Bucket, key: str, value: Any) -> Bucket:
+        """Копия корзины с добавленным отсутствующим ключом."""
+        if type(bucket) is list:
+            new_bucket = bucket + [(key, value)]  # type: ignore
+            if len(new_bucket) > self.treeify_threshold:
+                return SortedBucket(new_bucket)
+            return new_bucket
+        sorted_bucket = bucket.copy()  # type: ignore
+        sorted_bucket.add(key, value)
+        return sorted_bucket
+
+    def _with_replaced(self, bucket: Bucket, key: str,
+                       value: Any) -> Bucket:
+        """Копия корзины с новым значением ключа или None."""
+        if type(bucket) is list:
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    new_bucket = bucket[:]  # type: ignore
+                    new_bucket[i] = (key, value)
+                    return new_bucket
+            return None  # type: ignore
+        if bucket_get(bucket, key) is MISSING:
+            return None  # type: ignore
+        sorted_bucket = bucket.copy()  # type: ignore
+        sorted_bucket.replace(key, value)
+        return sorted_bucket
+
+    def _with_removed(self, bucket: Bucket, key: str) -> Bucket:
+        """Копия корзины без ключа или None, если ключа нет."""
+        if type(bucket) is list:
+            for i, (k, _) in enumerate(bucket):
+                if k == key:
+                    return bucket[:i] + bucket[i + 1:]  # type: ignore
+            return None  # type: ignore
+        if bucket_get(bucket, key) is MISSING:
+            return None  # type: ignore
+        sorted_bucket = bucket.copy()  # type: ignore
+        sorted_bucket.remove(key)
+        if len(sorted_bucket) < self.untreeify_threshold:
+            return sorted_bucket.items()
+        return sorted_bucket
+
+    def insert(self, key: str, value: Any):
+        """
+        Вставка элемента под блокировкой одной полосы.
+
+        Сложность: O(1 + α) в среднем, плюс копирование корзины
+        """
+        state, index, stripe = self._lock_bucket(key)
+        try:
+            table = state[0]
+            bucket = table[index]
+            new_bucket = self._with_replaced(bucket, key, value)
+            if new_bucket is not None:
+                table[index] = new_bucket
+                return
+            table[index] = self._with_added(bucket, key, value)
+            self._counts[stripe] += 1
+        finally:
+            self._locks[stripe].release()
+        self._maybe_resize(state)
+
+    def search(self, key: str) -> Any:
+        """
+        Поиск элемента без блокировок.
+
+        Сложность: O(1 + α) в среднем
+        """
+        table, size = self._state
+        value = bucket_get(table[self.hash_func(key, size)], key)
+        return None if value is MISSING else value
+
+    def delete(self, key: str):
+        """
+        Удаление элемента под блокировкой одной полосы.
+
+        Сложность: O(1 + α) в среднем, плюс копирование корзины
+        """
+        state, index, stripe = self._lock_bucket(key)
+        try:
+            table = state[0]
+            new_bucket = self._with_removed(table[index], key)
+            if new_bucket is None:
+                return
+            table[index] = new_bucket
+            self._counts[stripe] -= 1
+        finally:
+            self._locks[stripe].release()
+        self._maybe_resize(state)
+
+    def _maybe_resize(self, state: Tuple[List[Bucket], int]) -> None:
+        """
+        Проверка порогов заполнения после записи.
+
+        Сумма счетчиков читается без блокировок и может быть неточной,
+        поэтому _resize проверяет пороги повторно под всеми блокировками.
+        """
+        size = state[1]
+        count = sum(self._counts)
+        if count > size * self.max_load_factor:
+            self._resize(state, size * 2)
+        elif (count < size * self.min_load_factor
+              and size // 2 >= self._initial_size):
+            self._resize(state, size // 2)
+
+    def _resize(self, state: Tuple[List[Bucket], int],
+                new_size: int) -> None:
+        """
+        Перестроение таблицы при захваченных всех полосах.
+
+        Блокировки захватываются в порядке номеров, что исключает
+        взаимную блокировку двух масштабирований. Под блокировками
+        счетчики точны, и если порог уже не пересечен (например, таблицу
+        снова заполнили, пока ждали уменьшения), перестроение отменяется.
+
+        Сложность: O(n + new_size)
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            # Таблицу уже перестроил другой поток
+            if self._state is not state:
+                return
+
+            size = state[1]
+            count = sum(self._counts)
+            if new_size > size:
+                if count <= size * self.max_load_factor:
+                    return
+            elif count >= size * self.min_load_factor:
+                return
+
+            hash_func = self.hash_func
+            stripes = self.stripes
+            # Новая таблица еще не опубликована, поэтому ее корзины можно
+            # заполнять на месте
+            table: List[Bucket] = [[] for _ in range(new_size)]
+            counts = [0] * stripes
+            for bucket in state[0]:
+                for key, value in bucket:
+                    index = hash_func(key, new_size)
+                    table[index].append((key, value))  # type: ignore
+                    counts[index % stripes] += 1
+            for index, bucket in enumerate(table):
+                if len(bucket) > self.treeify_threshold:
+                    table[index] = SortedBucket(bucket)
+
+            self._counts = counts
+            self._state = (table, new_size)
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return sum(self._counts)
@@ -0,0 +1,348 @@
+"""Бенчмарк качества и скорости хеш-функций с выводом в JSON."""
+import json
+import platform
+import random
+import string
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from hash_functions import (
+    simple_hash, polynomial_hash, djb2_hash, BATCH_HASH_FUNCTIONS,
+    SipHash, SeededPolynomialHash
+)
+from hash_table_chaining import HashTableChaining
+
+# Функции с ключом получают фиксированные зерна ради воспроизводимости
+HASH_FUNCTIONS: Dict[str, Callable] = {
+    'simple': simple_hash,
+    'polynomial': polynomial_hash,
+    'djb2': djb2_hash,
+    'siphash': SipHash(seed=42),
+    'seeded_polynomial': SeededPolynomialHash(seed=42),
+}
+
+# Пары блоков одинаковой длины с равными полными хешами: для функции
+# h = h * b + c блоки (c1, c2) и (c1 + 1, c2 - b) дают одно состояние,
+# а для суммы кодов достаточно равенства сумм. Любая конкатенация таких
+# блоков снова дает коллизию, что позволяет получить 2^k ключей.
+COLLIDING_BLOCKS = {
+    'simple': ('az', 'by'),
+    'polynomial': ('az', 'b['),
+    'djb2': ('az', 'bY'),
+}
+
+CORPORA = ['urls', 'uuids', 'sequential', 'anagrams']
+
+# Число бит выхода, по которым оценивается лавинный эффект
+AVALANCHE_BITS = 32
+
+
+def generate_corpus(name: str, n: int, seed: int = 42) -> List[str]:
+    """
+    Генерация воспроизводимого набора ключей.
+
+    Args:
+        name: 'urls', 'uuids', 'sequential' или 'anagrams'
+        n: Количество ключей
+        seed: Зерно генератора случайных чисел
+    """
+    rng = random.Random(seed)
+
+    if name == 'urls':
+        hosts = ['example.com', 'api.service.io', 'cdn.static.net',
+                 'shop.store.ru', 'blog.site.org']
+        words = ['users', 'items', 'orders', 'search', 'profile', 'v1',
+                 'v2', 'images', 'posts', 'comments']
+        keys = []
+        for i in range(n):
+            path = '/'.join(rng.choice(words)
+                            for _ in range(rng.randint(1, 4)))
+            keys.append(f"https://{rng.choice(hosts)}/{path}?id={i}")
+        return keys
+
+    if name == 'uuids':
+        return [str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                for _ in range(n)]
+
+    if name == 'sequential':
+        return [f"id_{i:08d}" for i in range(n)]
+
+    if name == 'anagrams':
+        # Перестановки небольшого числа базовых слов: худший случай для
+        # функций, не учитывающих порядок символов
+        keys: List[str] = []
+        seen = set()
+        alphabet = string.ascii_lowercase
+        base_words = [''.join(rng.choice(alphabet) for _ in range(12))
+                      for _ in range(max(1, n // 1000))]
+        while len(keys) < n:
+            letters = list(rng.choice(base_words))
+            rng.shuffle(letters)
+            key = ''.join(letters)
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+        return keys
+
+    raise ValueError(f"Неизвестный набор ключей: {name}")
+
+
+def measure_ns_per_key(hash_func: Callable, keys: List[str],
+                       table_size: int, repeats: int = 3) -> float:
+    """Лучшее из repeats время хеширования одного ключа в наносекундах."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for key in keys:
+            hash_func(key, table_size)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(keys)
+
+
+def measure_batch_ns_per_key(batch_func: Callable, keys: List[str],
+                             table_size: int, repeats: int = 3) -> float:
+    """То же для пакетной версии функции."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        batch_func(keys, table_size)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(keys)
+
+
+def bucket_statistics(hash_func: Callable, keys: List[str],
+                      table_size: int) -> Dict[str, float]:
+    """
+    Равномерность распределения по корзинам.
+
+    Возвращает статистику хи-квадрат, ее отношение к числу степеней
+    свободы (около 1 для равномерного распределения), максимальную длину
+    цепочки и максимальную длину пробы при линейном пробировании в таблице
+    с коэффициентом заполнения около 0.7.
+    """
+    counts = [0] * table_size
+    for key in keys:
+        counts[hash_func(key, table_size)] += 1
+
+    expected = len(keys) / table_size
+    chi_squared = sum((count - expected) ** 2 for count in counts) / expected
+
+    # Линейное пробирование моделируется через "указатель на следующую
+    # свободную ячейку" со сжатием путей, чтобы плохие функции не
+    # превращали замер в O(n^2)
+    probe_size = max(int(len(keys) / 0.7), 1)
+    next_free = list(range(probe_size))
+    max_probe = 0
+    for key in keys:
+        home = hash_func(key, probe_size)
+        index = home
+        while next_free[index] != index:
+            index = next_free[index]
+        cursor = home
+        while next_free[cursor] != index:
+            next_free[cursor], cursor = index, next_free[cursor]
+        next_free[index] = (index + 1) % probe_size
+        max_probe = max(max_probe, (index - home) % probe_size + 1)
+
+    return {
+        'chi_squared': chi_squared,
+        'chi_squared_ratio': chi_squared / max(table_size - 1, 1),
+        'max_chain_length': max(counts),
+        'max_probe_length': max_probe,
+    }
+
+
+def avalanche_statistics(hash_func: Callable, keys: List[str]
+                         ) -> Dict[str, float]:
+    """
+    Лавинный эффект: доля бит выхода, меняющихся при инверсии одного бита
+    одного символа входа.
+
+    Для идеальной функции каждая из вероятностей близка к 0.5.
+    Возвращает среднюю вероятность изменения бита и худшее отклонение
+    отдельного бита выхода от 0.5.
+    """
+    table_size = 1 << AVALANCHE_BITS
+    flips = [0] * AVALANCHE_BITS
+    trials = 0
+
+    for key in keys:
+        if not key:
+            continue
+        original = hash_func(key, table_size)
+        for position in range(len(key)):
+            code = ord(key[position])
+            for bit in range(7):
+                changed = chr(code ^ (1 << bit))
+                mutated = key[:position] + changed + key[position + 1:]
+                diff = original ^ hash_func(mutated, table_size)
+                for out_bit in range(AVALANCHE_BITS):
+                    if diff >> out_bit & 1:
+                        flips[out_bit] += 1
+                trials += 1
+
+    if trials == 0:
+        return {'mean_flip_probability': 0.0, 'worst_bit_bias': 0.0}
+
+    probabilities = [count / trials for count in flips]
+    return {
+        'mean_flip_probability': sum(probabilities) / AVALANCHE_BITS,
+        'worst_bit_bias': max(abs(p - 0.5) for p in probabilities),
+    }
+
+
+def generate_flooding_keys(blocks, n: int) -> List[str]:
+    """
+    Ключи, которые все попадают в одну корзину атакуемой функции.
+
+    Ключ i составляется из блоков по битам числа i.
+    """
+    width = max(1, (n - 1).bit_length())
+    return [''.join(blocks[i >> bit & 1] for bit in range(width))
+            for i in range(n)]
+
+
+def measure_flooding(hash_func: Callable, keys: List[str],
+                     treeify: bool = True) -> Dict[str, float]:
+    """
+    Задержка поиска в таблице методом цепочек, заполненной ключами атаки.
+
+    При treeify=False цепочки никогда не становятся упорядоченными
+    корзинами, что соответствует обычному методу цепочек.
+    """
+    treeify_threshold = 8 if treeify else len(keys) + 1
+    table = HashTableChaining(size=16, hash_func=hash_func,
+                              treeify_threshold=treeify_threshold)
+    for key in keys:
+        table.insert(key, key)
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        table.search(key)
+    lookup_ns = (time.perf_counter_ns() - start) / len(keys)
+
+    return {
+        'lookup_ns': lookup_ns,
+        'max_chain_length': max((len(bucket) for bucket in table.table
+                                 if bucket is not None), default=0),
+    }
+
+
+def run_flooding_benchmark(n: int = 5000, seed: int = 42) -> Dict:
+    """
+    Атака переполнением цепочек: для каждой детерминированной функции
+    ключи подбираются под нее, затем те же ключи вставляются в таблицы
+    с хешами SipHash и затравочным полиномиальным. Для атакуемой функции
+    замеряются и обычные, и упорядоченные корзины.
+    """
+    results: Dict = {}
+    defenders = {
+        'siphash': SipHash(seed=seed),
+        'seeded_polynomial': SeededPolynomialHash(seed=seed),
+    }
+
+    for target, blocks in COLLIDING_BLOCKS.items():
+        keys = generate_flooding_keys(blocks, n)
+        print(f"  Атака на {target}...")
+        entry = {
+            target: measure_flooding(HASH_FUNCTIONS[target], keys,
+                                     treeify=False),
+            f'{target}_treeified': measure_flooding(HASH_FUNCTIONS[target],
+                                                    keys),
+        }
+        for name, hash_func in defenders.items():
+            entry[name] = measure_flooding(hash_func, keys)
+        results[target] = entry
+
+    return results
+
+
+def run_benchmark(n: int = 20000, table_size: int = 1009, seed: int = 42,
+                  avalanche_keys: int = 200,
+                  flooding_keys: int = 5000) -> Dict:
+    """
+    Полный прогон бенчмарка для всех функций и наборов ключей.
+
+    flooding_keys - количество подобранных ключей в атаке переполнением
+    цепочек.
+
+    Returns:
+        Словарь, пригодный для сохранения в JSON
+    """
+    results: Dict = {
+        'meta': {
+            'n': n,
+            'table_size': table_size,
+            'seed': seed,
+            'avalanche_keys': avalanche_keys,
+            'python': platform.python_version(),
+        },
+        'results': {}
+    }
+
+    corpora = {name: generate_corpus(name, n, seed) for name in CORPORA}
+
+    for func_name, hash_func in HASH_FUNCTIONS.items():
+        func_results = results['results'][func_name] = {}
+        batch_func = BATCH_HASH_FUNCTIONS.get(hash_func)
+
+        for corpus_name, keys in corpora.items():
+            print(f"  {func_name} / {corpus_name}...")
+            entry = {
+                'ns_per_key': measure_ns_per_key(hash_func, keys,
+                                                 table_size),
+            }
+            if batch_func is not None:
+                try:
+                    entry['batch_ns_per_key'] = measure_batch_ns_per_key(
+                        batch_func, keys, table_size)
+                except ImportError:
+                    pass
+            entry.update(bucket_statistics(hash_func, keys, table_size))
+            entry.update(avalanche_statistics(hash_func,
+                                              keys[:avalanche_keys]))
+            func_results[corpus_name] = entry
+
+    print("  Атака переполнением цепочек...")
+    results['flooding'] = run_flooding_benchmark(n=flooding_keys,
+                                                 seed=seed)
+
+    return results
+
+
+def save_results(results: Dict, path: str) -> None:
+    """Сохранение результатов в JSON."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def print_summary(results: Dict) -> None:
+    """Краткая таблица результатов."""
+    print(f"\n{'функция':<12} {'набор':<12} {'нс/ключ':>10} "
+          f"{'χ²/df':>8} {'цепочка':>8} {'проба':>8} {'лавина':>8}")
+    print("-" * 72)
+    for func_name, func_results in results['results'].items():
+        for corpus_name, entry in func_results.items():
+            print(f"{func_name:<12} {corpus_name:<12} "
+                  f"{entry['ns_per_key']:>10.1f} "
+                  f"{entry['chi_squared_ratio']:>8.2f} "
+                  f"{entry['max_chain_length']:>8} "
+                  f"{entry['max_probe_length']:>8} "
+                  f"{entry['mean_flip_probability']:>8.3f}")
+
+    print(f"\n{'атакуемая':<12} {'таблица':<20} {'поиск, нс':>12} "
+          f"{'цепочка':>8}")
+    print("-" * 56)
+    for target, entry in results.get('flooding', {}).items():
+        for name, stats in entry.items():
+            print(f"{target:<12} {name:<20} {stats['lookup_ns']:>12.0f} "
+                  f"{stats['max_chain_length']:>8}")
+
+
+if __name__ == "__main__":
+    print("Бенчмарк хеш-функций...")
+    benchmark_results = run_benchmark()
+    print_summary(benchmark_results)
+    save_results(benchmark_results, 'report/hash_benchmark.json')
+    print("\nРезультаты сохранены в report/hash_benchmark.json")
@@ -1,4 +1,23 @@
 """Реализация хэш-функций."""
+import random
+import secrets
+from typing import Callable, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy указан в requirements.txt
+    np = None
+
+# Векторные версии считают в int64, поэтому промежуточное значение
+# h * multiplier + code_point должно помещаться в 2^63
+_INT64_LIMIT = 1 << 63
+_MAX_CODE_POINT = 0x10FFFF
+# Наибольшее число ключей и ячеек int64 в одной матрице кодов (32 МБ)
+_BATCH_ROWS = 1 << 16
+_BATCH_CELLS = 1 << 22
+# Ключи длиннее хешируются скалярной функцией: ширина матрицы и число
+# векторных шагов не зависят от редких очень длинных ключей
+_BATCH_MAX_WIDTH = 1024
 
 
 def simple_hash(key: str, table_size: int) -> int:
@@ -46,3 +65,307 @@ def djb2_hash(key: str, table_size: int) -> int:
     for char in key:
         hash_value = ((hash_value << 5) + hash_value) + ord(char)
     return hash_value % table_size
+
+
+def _fits_int64(table_size: int, multiplier: int) -> bool:
+    """Помещаются ли промежуточные значения в int64."""
+    return (table_size - 1) * multiplier + _MAX_CODE_POINT < _INT64_LIMIT
+
+
+def _encode_keys(keys: Sequence[str], lengths):
+    """
+    Кодирование строк в матрицу кодов символов.
+
+    Строки дополняются нулями до длины самой длинной строки в части
+    пакета (см. _hash_in_chunks).
+
+    Args:
+        keys: Строки.
+        lengths: Длины строк (массив int64).
+
+    Returns:
+        (codes, lengths): матрица int64 размера (n, max_len) и длины строк
+    """
+    width = max(int(lengths.max()), 1)
+    codes = np.array(keys, dtype=f'<U{width}').view(np.uint32)
+    return codes.reshape(len(keys), width).astype(np.int64), lengths
+
+
+def _hash_in_chunks(keys: Sequence[str], kernel: Callable,
+                    scalar: Callable[[str], int]):
+    """
+    Применение векторного ядра к пакету по частям.
+
+    Часть пакета набирается, пока матрица кодов (строк * длина самой
+    длинной строки части) не превышает _BATCH_CELLS ячеек, поэтому память
+    не зависит от того, в какую часть попал длинный ключ. Ключи длиннее
+    _BATCH_MAX_WIDTH хешируются функцией scalar и в матрицу не попадают.
+    """
+    if np is None:
+        raise ImportError("Для пакетного хеширования требуется numpy")
+    n = len(keys)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = np.fromiter((len(key) for key in keys), dtype=np.int64,
+                          count=n)
+    long_indices = np.flatnonzero(lengths > _BATCH_MAX_WIDTH).tolist()
+    lengths[long_indices] = 0
+    widths = np.maximum(lengths, 1)
+
+    parts = []
+    start = 0
+    while start < n:
+        # Наибольший префикс из не более _BATCH_ROWS ключей, для которого
+        # строк * текущая ширина укладывается в бюджет (произведение
+        # не убывает, поэтому подходит двоичный поиск)
+        window = np.maximum.accumulate(widths[start:start + _BATCH_ROWS])
+        cells = np.arange(1, len(window) + 1) * window
+        end = start + max(int(np.searchsorted(cells, _BATCH_CELLS,
+                                              side='right')), 1)
+        chunk = list(keys[start:end])
+        for index in long_indices:
+            if start <= index < end:
+                chunk[index - start] = ''
+        parts.append(kernel(*_encode_keys(chunk, lengths[start:end])))
+        start = end
+
+    result = np.concatenate(parts)
+    for index in long_indices:
+        result[index] = scalar(keys[index])
+    return result
+
+
+def simple_hash_batch(keys: Sequence[str], table_size: int):
+    """
+    Пакетная версия simple_hash на NumPy.
+
+    Коды символов суммируются по строкам матрицы; дополняющие нули на
+    сумму не влияют. Результат совпадает с simple_hash для каждого ключа.
+
+    Сложность: O(n * max_len) векторных операций
+    """
+    if np is not None and not _fits_int64(table_size, 1):
+        return np.array([simple_hash(key, table_size) for key in keys],
+                        dtype=object)
+
+    def kernel(codes, lengths):
+        return codes.sum(axis=1) % table_size
+
+    return _hash_in_chunks(keys, kernel,
+                           lambda key: simple_hash(key, table_size))
+
+
+def polynomial_hash_batch(keys: Sequence[str], table_size: int,
+                          base: int = 31):
+    """
+    Пакетная версия polynomial_hash на NumPy.
+
+    Цикл идет по позициям символов, а не по ключам: на каждом шаге
+    обновляются хеши всех строк, длина которых больше текущей позиции.
+    Результат совпадает с polynomial_hash для каждого ключа.
+
+    Сложность: O(max_len) векторных операций над n ключами
+    """
+    if np is not None and not _fits_int64(table_size, base):
+        return np.array([polynomial_hash(key, table_size, base)
+                         for key in keys], dtype=object)
+
+    def kernel(codes, lengths):
+        hashes = np.zeros(len(codes), dtype=np.int64)
+        for position in range(codes.shape[1]):
+            updated = (hashes * base + codes[:, position]) % table_size
+            hashes = np.where(lengths > position, updated, hashes)
+        return hashes
+
+    return _hash_in_chunks(keys, kernel,
+                           lambda key: polynomial_hash(key, table_size, base))
+
+
+def djb2_hash_batch(keys: Sequence[str], table_size: int):
+    """
+    Пакетная версия djb2_hash на NumPy.
+
+    Скалярная версия берет остаток только в конце, но так как
+    (h * 33 + c) mod m = ((h mod m) * 33 + c) mod m, остаток можно брать
+    на каждом шаге и оставаться в int64. Результат совпадает с djb2_hash
+    для каждого ключа.
+
+    Сложность: O(max_len) векторных операций над n ключами
+    """
+    if np is not None and not _fits_int64(table_size, 33):
+        return np.array([djb2_hash(key, table_size) for key in keys],
+                        dtype=object)
+
+    def kernel(codes, lengths):
+        hashes = np.full(len(codes), 5381 % table_size, dtype=np.int64)
+        for position in range(codes.shape[1]):
+            updated = (hashes * 33 + codes[:, position]) % table_size
+            hashes = np.where(lengths > position, updated, hashes)
+        return hashes
+
+    return _hash_in_chunks(keys, kernel,
+                           lambda key: djb2_hash(key, table_size))
+
+
+_MASK64 = (1 << 64) - 1
+# Простой модуль для затравочной полиномиальной функции
+_SEEDED_MODULUS = (1 << 61) - 1
+
+
+def _rotl64(value: int, shift: int) -> int:
+    """Циклический сдвиг 64-битного числа влево."""
+    return ((value << shift) | (value >> (64 - shift))) & _MASK64
+
+
+def siphash24(data: bytes, k0: int, k1: int) -> int:
+    """
+    SipHash-2-4: криптографически стойкая функция с 128-битным ключом.
+
+    Не зная ключа (k0, k1), нельзя заранее подобрать множество ключей
+    с одинаковым хешем, поэтому атака переполнением цепочек невозможна.
+
+    Сложность: O(len(data))
+    """
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sip_round():
+        nonlocal v0, v1, v2, v3
+        v0 = (v0 + v1) & _MASK64
+        v1 = _rotl64(v1, 13) ^ v0
+        v0 = _rotl64(v0, 32)
+        v2 = (v2 + v3) & _MASK64
+        v3 = _rotl64(v3, 16) ^ v2
+        v0 = (v0 + v3) & _MASK64
+        v3 = _rotl64(v3, 21) ^ v0
+        v2 = (v2 + v1) & _MASK64
+        v1 = _rotl64(v1, 17) ^ v2
+        v2 = _rotl64(v2, 32)
+
+    length = len(data)
+    end = length - length % 8
+    for offset in range(0, end, 8):
+        block = int.from_bytes(data[offset:offset + 8], 'little')
+        v3 ^= block
+        sip_round()
+        sip_round()
+        v0 ^= block
+
+    block = ((length & 0xff) << 56) | int.from_bytes(data[end:], 'little')
+    v3 ^= block
+    sip_round()
+    sip_round()
+    v0 ^= block
+
+    v2 ^= 0xff
+    for _ in range(4):
+        sip_round()
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+class SipHash:
+    """
+    Хеш-функция SipHash-2-4 с ключом, выбираемым при создании.
+
+    Экземпляр вызывается как обычная хеш-функция (key, table_size),
+    поэтому передается в таблицы через hash_func. Каждой таблице стоит
+    создавать свой экземпляр, чтобы у таблиц были разные ключи.
+
+    Качество распределения: Очень высокое, устойчива к подбору коллизий
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: 128-битный ключ. По умолчанию выбирается случайно
+                из криптографически стойкого источника.
+        """
+        if seed is None:
+            seed = secrets.randbits(128)
+        self.k0 = seed & _MASK64
+        self.k1 = (seed >> 64) & _MASK64
+
+    def __call__(self, key: str, table_size: int) -> int:
+        """Индекс ключа в таблице размера table_size."""
+        return siphash24(key.encode('utf-8'), self.k0, self.k1) % table_size
+
+
+class SeededPolynomialHash:
+    """
+    Полиномиальная хеш-функция со случайным основанием и начальным
+    значением по модулю простого числа 2^61 - 1.
+
+    Для фиксированной пары строк одинаковой длины вероятность коллизии по
+    выбору основания не превышает длина / 2^61, поэтому заранее
+    подготовленные ключи не попадают в одну цепочку. Быстрее SipHash,
+    но не является криптографически стойкой.
+
+    Качество распределения: Высокое
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Зерно для выбора основания. По умолчанию основание
+                выбирается случайно из криптографически стойкого источника.
+        """
+        rng = (random.Random(seed) if seed is not None
+               else random.SystemRandom())
+        self.base = rng.randrange(1 << 20, _SEEDED_MODULUS - 1)
+        self.offset = rng.randrange(_SEEDED_MODULUS)
+
+    def __call__(self, key: str, table_size: int) -> int:
+        """Индекс ключа в таблице размера table_size."""
+        base = self.base
+        hash_value = self.offset
+        for char in key:
+            hash_value = (hash_value * base + ord(char)) % _SEEDED_MODULUS
+        return hash_value % table_size
+
+
+def keyed_hash(method: str = "siphash",
+               seed: Optional[int] = None) -> Callable[[str, int], int]:
+    """
+    Создание хеш-функции с ключом для одной таблицы.
+
+    Args:
+        method: "siphash" или "seeded_polynomial"
+        seed: Ключ/зерно. По умолчанию выбирается случайно.
+
+    Пример:
+        table = HashTableChaining(hash_func=keyed_hash())
+    """
+    if method == "siphash":
+        return SipHash(seed)
+    if method == "seeded_polynomial":
+        return SeededPolynomialHash(seed)
+    raise ValueError(f"Неизвестный метод хеширования с ключом: {method}")
+
+
+# Соответствие скалярных функций их векторным версиям
+BATCH_HASH_FUNCTIONS = {
+    simple_hash: simple_hash_batch,
+    polynomial_hash: polynomial_hash_batch,
+    djb2_hash: djb2_hash_batch,
+}
+
+
+def hash_many(hash_func: Callable, keys: Iterable[str],
+              table_size: int) -> List[int]:
+    """
+    Хеши набора ключей за один проход.
+
+    Используется пакетными операциями хеш-таблиц. Для функций из этого
+    модуля при наличии numpy вычисление векторизуется.
+
+    Сложность: O(суммарной длины ключей)
+    """
+    batch_func = BATCH_HASH_FUNCTIONS.get(hash_func)
+    if batch_func is not None and np is not None:
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        return batch_func(keys, table_size).tolist()
+    return [hash_func(key, table_size) for key in keys]
@@ -1,22 +1,324 @@
 """Метод цепочек с динамическим масштабированием."""
-from typing import Any, Callable, List, Tuple
-from hash_functions import djb2_hash
+import sys
+from bisect import bisect_left
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
+from hash_functions import djb2_hash, hash_many
+from memory_usage import build_report, objects_size
+
+
+# Маркер отсутствия ключа, отличимый от значения None
+MISSING = object()
+
+
+class SortedBucket:
+    """
+    Корзина, упорядоченная по ключам.
+
+    Ключи и значения хранятся в двух параллельных массивах, поиск ведется
+    бинарным поиском. В такую корзину превращается слишком длинная
+    цепочка, чтобы даже при сильном перекосе распределения поиск
+    оставался O(log k).
+    """
+
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        """Построение корзины из пар (ключ, значение) с разными ключами."""
+        pairs = sorted(items, key=lambda item: item[0])
+        self.keys: List[str] = [key for key, _ in pairs]
+        self.values: List[Any] = [value for _, value in pairs]
+
+    def _index(self, key: str) -> int:
+        """Позиция ключа или -1. Сложность: O(log k)"""
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return index
+        return -1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Значение по ключу. Сложность: O(log k)"""
+        index = self._index(key)
+        return self.values[index] if index >= 0 else default
+
+    def replace(self, key: str, value: Any) -> bool:
+        """Замена значения существующего ключа. Сложность: O(log k)"""
+        index = self._index(key)
+        if index < 0:
+            return False
+        self.values[index] = value
+        return True
+
+    def add(self, key: str, value: Any) -> None:
+        """
+        Добавление отсутствующего ключа.
+
+        Сложность: O(log k) сравнений и O(k) на сдвиг массива
+        """
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.values.insert(index, value)
+
+    def remove(self, key: str) -> bool:
+        """Удаление ключа. Сложность: O(log k) сравнений"""
+        index = self._index(key)
+        if index < 0:
+            return False
+        del self.keys[index]
+        del self.values[index]
+        return True
+
+    def copy(self) -> 'SortedBucket':
+        """Независимая копия корзины. Сложность: O(k)"""
+        bucket = SortedBucket()
+        bucket.keys = self.keys[:]
+        bucket.values = self.values[:]
+        return bucket
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Пары (ключ, значение) в порядке возрастания ключей."""
+        return list(zip(self.keys, self.values))
+
+    def __len__(self) -> int:
+        """Количество элементов в корзине."""
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Итерация по парам (ключ, значение)."""
+        return zip(self.keys, self.values)
+
+
+# Пустая корзина хранится как None: список создается при первой вставке,
+# поэтому выделение таблицы не создает size объектов сразу
+Bucket = Union[List[Tuple[str, Any]], SortedBucket, None]
+
+
+def bucket_get(bucket: Bucket, key: str) -> Any:
+    """Значение по ключу в корзине или MISSING."""
+    if type(bucket) is list:
+        for k, v in bucket:
+            if k == key:
+                return v
+        return MISSING
+    if bucket is None:
+        return MISSING
+    return bucket.get(key, MISSING)  # type: ignore
+
+
+def _bucket_replace(bucket: Bucket, key: str, value: Any) -> bool:
+    """Замена значения существующего ключа в корзине."""
+    if type(bucket) is list:
+        for i, (k, v) in enumerate(bucket):
+            if k == key:
+                bucket[i] = (key, value)  # type: ignore
+                return True
+        return False
+    if bucket is None:
+        return False
+    return bucket.replace(key, value)  # type: ignore
+
+
+def _bucket_remove(bucket: Bucket, key: str) -> bool:
+    """Удаление ключа из корзины."""
+    if type(bucket) is list:
+        for i, (k, v) in enumerate(bucket):
+            if k == key:
+                del bucket[i]  # type: ignore
+                return True
+        return False
+    if bucket is None:
+        return False
+    return bucket.remove(key)  # type: ignore
 
 
 class HashTableChaining:
     """Метод цепочек."""
 
-    def __init__(self, size: int = 10, hash_func: Callable = djb2_hash):
+    def __init__(self, size: int = 10, hash_func: Callable = djb2_hash,
+                 max_load_factor: float = 0.75,
+                 min_load_factor: float = 0.1,
+                 rehash_step: int = 4,
+                 treeify_threshold: int = 8,
+                 untreeify_threshold: int = 6):
         """
         Хеш-таблица методом цепочек.
 
+        Таблица увеличивается вдвое, когда коэффициент заполнения превышает
+        max_load_factor, и уменьшается вдвое (но не меньше начального
+        размера), когда он опускается ниже min_load_factor. Перехеширование
+        выполняется инкрементально: каждая операция переносит не менее
+        rehash_step корзин из старой таблицы в новую. Шаг увеличивается
+        настолько, чтобы перенос гарантированно завершился раньше, чем
+        будет достигнут следующий порог, поэтому ни одна вставка не платит
+        за перестроение всей таблицы целиком. Корзины новой таблицы
+        создаются лениво, при первой вставке в них.
+
+        Цепочка длиннее treeify_threshold превращается в SortedBucket
+        с бинарным поиском, а короче untreeify_threshold - обратно в список.
+
         Args:
-            size: Размер хеш-таблицы
-            hash_func: Хеш-функция. По умолчанию используется djb2_hash
+            size: Начальный размер хеш-таблицы
+            hash_func: Хеш-функция. По умолчанию используется djb2_hash.
+                Для защиты от подбора коллизий передайте keyed_hash()
+            max_load_factor: Порог заполнения для увеличения таблицы
+            min_load_factor: Порог заполнения для уменьшения таблицы,
+                меньший max_load_factor / 2
+            rehash_step: Количество корзин, переносимых за одну операцию
+            treeify_threshold: Длина цепочки, выше которой корзина
+                становится упорядоченной
+            untreeify_threshold: Длина упорядоченной корзины, ниже которой
+                она снова становится списком
         """
+        # После удвоения заполнение падает до max_load_factor / 2; при
+        # min_load_factor не меньше этого значения таблица сразу
+        # уменьшалась бы обратно и колебалась между двумя размерами
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("Некорректные пороги коэффициента заполнения")
+        if rehash_step < 1:
+            raise ValueError("rehash_step должен быть положительным")
+        if not 0 <= untreeify_threshold < treeify_threshold:
+            raise ValueError("Некорректные пороги упорядочивания корзин")
+
         self.size = size
-        self.table: List[List[Tuple[str, Any]]] = [[] for _ in range(size)]
+        self.table: List[Bucket] = [None] * size
         self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.rehash_step = rehash_step
+        self.treeify_threshold = treeify_threshold
+        self.untreeify_threshold = untreeify_threshold
+        self.count = 0
+
+        self._initial_size = size
+        self._old_table: Optional[List[Bucket]] = None
+        self._old_size = 0
+        self._rehash_index = 0
+        self._rehash_batch = rehash_step
+
+    def is_rehashing(self) -> bool:
+        """Идет ли перенос элементов из старой таблицы."""
+        return self._old_table is not None
+
+    def load_factor(self) -> float:
+        """Текущий коэффициент заполнения относительно новой таблицы."""
+        return self.count / self.size
+
+    def _add(self, table: List[Bucket], index: int, key: str,
+             value: Any) -> None:
+        """
+        Добавление отсутствующего ключа в корзину с упорядочиванием
+        слишком длинной цепочки.
+        """
+        bucket = table[index]
+        if type(bucket) is list:
+            bucket.append((key, value))  # type: ignore
+            if len(bucket) > self.treeify_threshold:
+                table[index] = SortedBucket(bucket)
+        elif bucket is None:
+            table[index] = [(key, value)]
+        else:
+            bucket.add(key, value)  # type: ignore
+
+    def _remove(self, table: List[Bucket], index: int, key: str) -> bool:
+        """
+        Удаление ключа из корзины с возвратом короткой упорядоченной
+        корзины к списку.
+        """
+        bucket = table[index]
+        if not _bucket_remove(bucket, key):
+            return False
+        if (type(bucket) is SortedBucket
+                and len(bucket) < self.untreeify_threshold):
+            table[index] = bucket.items()  # type: ignore
+        return True
+
+    def _start_resize(self, new_size: int) -> None:
+        """
+        Начало перехеширования в таблицу размера new_size.
+
+        Шаг переноса выбирается так, чтобы все old_size корзин были
+        перенесены за число операций, меньшее расстояния от текущего
+        количества элементов до ближайшего порога новой таблицы: каждая
+        операция меняет count не более чем на единицу, поэтому к началу
+        следующего масштабирования старая таблица уже пуста. Вызов
+        _finish_rehash остается страховкой и в этом случае ничего не делает.
+
+        Сложность: O(new_size) на массив ссылок без создания корзин
+        """
+        self._finish_rehash()
+
+        grow_at = new_size * self.max_load_factor
+        headroom = grow_at - self.count
+        if new_size // 2 >= self._initial_size:
+            headroom = min(headroom,
+                           self.count - new_size * self.min_load_factor)
+        operations = max(int(headroom), 1)
+
+        self._old_table = self.table
+        self._old_size = self.size
+        self._rehash_index = 0
+        self._rehash_batch = max(self.rehash_step,
+                                 -(-self.size // operations))
+        self.size = new_size
+        self.table = [None] * new_size
+
+    def _rehash_steps(self, steps: int) -> None:
+        """
+        Перенос до steps корзин старой таблицы в новую.
+
+        Сложность: O(steps * (1 + α))
+        """
+        old_table = self._old_table
+        if old_table is None:
+            return
+
+        table = self.table
+        size = self.size
+        hash_func = self.hash_func
+        add = self._add
+        index = self._rehash_index
+        end = min(index + steps, self._old_size)
+
+        while index < end:
+            bucket = old_table[index]
+            if bucket is not None:
+                for key, value in bucket:
+                    add(table, hash_func(key, size), key, value)
+                old_table[index] = None
+            index += 1
+
+        self._rehash_index = index
+        if index >= self._old_size:
+            self._old_table = None
+            self._old_size = 0
+            self._rehash_index = 0
+
+    def _finish_rehash(self) -> None:
+        """Немедленное завершение текущего перехеширования."""
+        if self._old_table is not None:
+            self._rehash_steps(self._old_size)
+
+    def _maybe_resize(self) -> None:
+        """
+        Проверка порогов заполнения и запуск масштабирования.
+
+        Сложность: O(1) амортизированно
+        """
+        if self.count > self.size * self.max_load_factor:
+            self._start_resize(self.size * 2)
+        elif (self.count < self.size * self.min_load_factor
+              and self.size // 2 >= self._initial_size):
+            self._start_resize(self.size // 2)
+
+    def _old_bucket(self, key: str) -> Optional[Bucket]:
+        """Корзина старой таблицы для ключа, если она еще не перенесена."""
+        if self._old_table is None:
+            return None
+        index = self.hash_func(key, self._old_size)
+        if index < self._rehash_index:
+            return None
+        return self._old_table[index]
 
     def insert(self, key: str, value: Any):
         """
@@ -24,14 +326,21 @@ class HashTableChaining:
 
         Сложность:
         - Средний случай: O(1 + α)
-        - Худший случай: O(n)
+        - Худший случай: O(log n) сравнений благодаря упорядоченным корзинам
         """
+        if self._old_table is not None:
+            self._rehash_steps(self._rehash_batch)
+
+        old_bucket = self._old_bucket(key)
+        if old_bucket is not None and _bucket_replace(old_bucket, key, value):
+            return
+
         index = self.hash_func(key, self.size)
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                self.table[index][i] = (key, value)
-                return
-        self.table[index].append((key, value))
+        if _bucket_replace(self.table[index], key, value):
+            return
+        self._add(self.table, index, key, value)
+        self.count += 1
+        self._maybe_resize()
 
     def search(self, key: str) -> Any:
         """
@@ -39,13 +348,19 @@ class HashTableChaining:
 
         Сложность:
         - Средний случай: O(1 + α)
-        - Худший случай: O(n)
+        - Худший случай: O(log n) благодаря упорядоченным корзинам
         """
-        index = self.hash_func(key, self.size)
-        for k, v in self.table[index]:
-            if k == key:
-                return v
-        return None
+        if self._old_table is not None:
+            self._rehash_steps(self._rehash_batch)
+
+        old_bucket = self._old_bucket(key)
+        if old_bucket is not None:
+            value = bucket_get(old_bucket, key)
+            if value is not MISSING:
+                return value
+
+        value = bucket_get(self.table[self.hash_func(key, self.size)], key)
+        return None if value is MISSING else value
 
     def delete(self, key: str):
         """
@@ -53,10 +368,132 @@ class HashTableChaining:
 
         Сложность:
         - Средний случай: O(1 + α)
-        - Худший случай: O(n)
+        - Худший случай: O(log n) сравнений благодаря упорядоченным корзинам
         """
-        index = self.hash_func(key, self.size)
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                del self.table[index][i]
-                return
+        if self._old_table is not None:
+            self._rehash_steps(self._rehash_batch)
+
+        old_bucket = self._old_bucket(key)
+        if old_bucket is not None and _bucket_remove(old_bucket, key):
+            self.count -= 1
+            self._maybe_resize()
+            return
+
+        if self._remove(self.table, self.hash_func(key, self.size), key):
+            self.count -= 1
+            self._maybe_resize()
+
+    def insert_many(self, items: Iterable[Tuple[str, Any]]):
+        """
+        Пакетная вставка пар (ключ, значение).
+
+        Таблица сразу увеличивается под размер пакета (без пошагового
+        перехеширования), а индексы всех ключей вычисляются одним проходом.
+
+        Сложность: O(k * (1 + α)) для пакета из k элементов
+        """
+        items = list(items)
+        self._finish_rehash()
+
+        needed = self.count + len(items)
+        if needed > self.size * self.max_load_factor:
+            new_size = self.size
+            while needed > new_size * self.max_load_factor:
+                new_size *= 2
+            self._start_resize(new_size)
+            self._finish_rehash()
+
+        table = self.table
+        add = self._add
+        indices = hash_many(self.hash_func, [key for key, _ in items],
+                            self.size)
+        for (key, value), index in zip(items, indices):
+            if not _bucket_replace(table[index], key, value):
+                add(table, index, key, value)
+                self.count += 1
+
+    def search_many(self, keys: Iterable[str]) -> List[Any]:
+        """
+        Пакетный поиск. Возвращает значения в порядке ключей.
+
+        Сложность: O(k * (1 + α)) для пакета из k ключей
+        """
+        keys = list(keys)
+        self._finish_rehash()
+
+        table = self.table
+        indices = hash_many(self.hash_func, keys, self.size)
+        results = []
+        for key, index in zip(keys, indices):
+            value = bucket_get(table[index], key)
+            results.append(None if value is MISSING else value)
+        return results
+
+    def delete_many(self, keys: Iterable[str]):
+        """
+        Пакетное удаление.
+
+        Сложность: O(k * (1 + α)) для пакета из k ключей
+        """
+        keys = list(keys)
+        self._finish_rehash()
+
+        table = self.table
+        remove = self._remove
+        indices = hash_many(self.hash_func, keys, self.size)
+        for key, index in zip(keys, indices):
+            if remove(table, index, key):
+                self.count -= 1
+        self._maybe_resize()
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Оценка занимаемой памяти в байтах через sys.getsizeof.
+
+        Части отчета:
+        - table_bytes: массив ссылок на корзины (вместе со старой
+          таблицей во время перехеширования)
+        - bucket_bytes: объекты корзин (списки и SortedBucket с массивами)
+        - entry_bytes: кортежи (ключ, значение) в обычных цепочках
+        - key_bytes, value_bytes: сами объекты ключей и значений
+
+        Сложность: O(n + size)
+        """
+        tables = [self.table]
+        if self._old_table is not None:
+            tables.append(self._old_table)
+
+        table_bytes = 0
+        bucket_bytes = 0
+        entry_bytes = 0
+        keys = []
+        values = []
+        for table in tables:
+            table_bytes += sys.getsizeof(table)
+            for bucket in table:
+                if bucket is None:
+                    continue
+                bucket_bytes += sys.getsizeof(bucket)
+                if type(bucket) is list:
+                    entry_bytes += sum(sys.getsizeof(item)
+                                       for item in bucket)
+                else:
+                    sorted_bucket: SortedBucket = bucket  # type: ignore
+                    bucket_bytes += (sys.getsizeof(sorted_bucket.keys)
+                                     + sys.getsizeof(sorted_bucket.values))
+                for key, value in bucket:
+                    keys.append(key)
+                    values.append(value)
+
+        return build_report(
+            self.count,
+            table_bytes=table_bytes,
+            bucket_bytes=bucket_bytes,
+            entry_bytes=entry_bytes,
+            key_bytes=objects_size(keys),
+            value_bytes=objects_size(values),
+        )
+
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
@@ -1,104 +1,734 @@
 """Метод открытой адресации."""
-from typing import Any, Callable, Optional, List, Tuple
-from hash_functions import djb2_hash
+import sys
+from array import array
+from itertools import islice
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple, Union
+)
+from hash_functions import djb2_hash, hash_many
+from memory_usage import build_report, objects_size
+
+
+class _Deleted:
+    """Маркер удаленной ячейки, не совпадающий ни с одним ключом."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "DELETED"
+
+
+DELETED = _Deleted()
+
+# Модуль для вычисления "полного" хеша, который кешируется в компактной
+# и файловой (MappedHashTable) таблицах и не зависит от их текущего
+# размера. Простое число, при котором векторные версии хеш-функций еще
+# укладываются в int64. EMPTY_HASH - хеш пустой ячейки.
+HASH_MODULUS = (1 << 55) - 55
+EMPTY_HASH = -1
+
+
+def linear_probing(key: str, size: int, hash_func: Callable,
+                   home: Optional[int] = None) -> Iterator[int]:
+    """
+    Линейное пробирование: h, h + 1, h + 2, ...
+
+    home - заранее вычисленный hash_func(key, size), если он известен.
+    Сложность одного шага: O(1)
+    """
+    index = hash_func(key, size) if home is None else home
+    for _ in range(size):
+        yield index
+        index += 1
+        if index == size:
+            index = 0
+
+
+def double_probing(key: str, size: int, hash_func: Callable,
+                   home: Optional[int] = None) -> Iterator[int]:
+    """
+    Двойное хеширование: h1, h1 + h2, h1 + 2 * h2, ...
+
+    Шаг h2 взаимно прост с простым размером таблицы, поэтому обходятся
+    все ячейки; HashTableOpenAddressing выбирает для этого метода простые
+    размеры. Второй хеш вычисляется один раз на операцию.
+    Сложность одного шага: O(1)
+    """
+    index = hash_func(key, size) if home is None else home
+    step = 1 + (hash_func(key, size - 1) % (size - 1))
+    for _ in range(size):
+        yield index
+        index = (index + step) % size
+
+
+def quadratic_probing(key: str, size: int, hash_func: Callable,
+                      home: Optional[int] = None) -> Iterator[int]:
+    """
+    Квадратичное (треугольное) пробирование: h, h + 1, h + 3, h + 6, ...
+
+    Обходит все ячейки только при размере таблицы, равном степени двойки,
+    поэтому HashTableOpenAddressing округляет размер для этого метода.
+    Сложность одного шага: O(1)
+    """
+    index = hash_func(key, size) if home is None else home
+    for i in range(1, size + 1):
+        yield index
+        index = (index + i) % size
+
+
+def _next_power_of_two(size: int) -> int:
+    """Наименьшая степень двойки, не меньшая size."""
+    return 1 << max(size - 1, 0).bit_length()
+
+
+def _is_prime(n: int) -> bool:
+    """Проверка простоты перебором делителей. Сложность: O(sqrt(n))"""
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    divisor = 3
+    while divisor * divisor <= n:
+        if n % divisor == 0:
+            return False
+        divisor += 2
+    return True
+
+
+def _next_prime(size: int) -> int:
+    """Наименьшее простое число, не меньшее size (и не меньшее 3)."""
+    candidate = max(size, 3)
+    while not _is_prime(candidate):
+        candidate += 1
+    return candidate
+
+
+# Пользовательская стратегия: (key, size, hash_func) -> итератор индексов
+ProbeStrategy = Callable[[str, int, Callable], Iterator[int]]
+
+# Robin Hood использует линейную последовательность проб, так как
+# удаление со сдвигом назад опирается на соседство ячеек
+PROBE_STRATEGIES: Dict[str, ProbeStrategy] = {
+    "linear": linear_probing,
+    "double": double_probing,
+    "quadratic": quadratic_probing,
+    "robin_hood": linear_probing,
+}
 
 
 class HashTableOpenAddressing:
     """Метод открытой адресации."""
 
-    def __init__(self, size: int = 10, probe_method: str = "linear",
-                 hash_func: Callable = djb2_hash):
+    def __init__(self, size: int = 10,
+                 probe_method: Union[str, ProbeStrategy] = "linear",
+                 hash_func: Callable = djb2_hash,
+                 max_load_factor: float = 0.7):
         """
         Хеш-таблица с открытой адресацией.
 
+        Таблица увеличивается вдвое (с округлением до допустимого для
+        метода пробирования размера), когда вставка превысила бы
+        max_load_factor. Одиночная и пакетная вставки следуют одному
+        порогу.
+
         Args:
-            size: Размер хеш-таблицы
-            probe_method: Метод пробирования ("linear" или "double")
-            hash_func: Хеш-функция. По умолчанию используется djb2_hash
+            size: Размер хеш-таблицы. Для "quadratic" округляется вверх
+                до степени двойки, для "double" - до простого числа
+            probe_method: Метод пробирования ("linear", "double",
+                "quadratic", "robin_hood") или функция
+                (key, size, hash_func) -> итератор индексов
+            hash_func: Хеш-функция. По умолчанию используется djb2_hash.
+                Для защиты от подбора коллизий передайте keyed_hash()
+            max_load_factor: Максимальная доля занятых ячеек
         """
-        self.size = size
-        self.table: List[Optional[Tuple[str, Any]]] = [None] * size
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor должен быть в интервале (0, 1)")
+        if callable(probe_method):
+            self._strategy = probe_method
+        elif probe_method in PROBE_STRATEGIES:
+            self._strategy = PROBE_STRATEGIES[probe_method]
+        else:
+            raise ValueError("Неизвестный метод пробирования")
+        # Встроенные стратегии принимают заранее вычисленную домашнюю
+        # ячейку, пользовательские вычисляют ее сами
+        self._accepts_home = not callable(probe_method)
+
         self.probe_method = probe_method
         self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self._robin_hood = probe_method == "robin_hood"
+        self._allocate(self._next_valid_size(size))
+
+    def _next_valid_size(self, size: int) -> int:
+        """
+        Наименьший допустимый для метода пробирования размер, не меньший
+        size: степень двойки для квадратичного пробирования и простое
+        число для двойного хеширования (иначе пробы обходят не все ячейки).
+        """
+        if self.probe_method == "quadratic":
+            return _next_power_of_two(size)
+        if self.probe_method == "double":
+            return _next_prime(size)
+        return size
+
+    def _allocate(self, size: int) -> None:
+        """Выделение пустой таблицы заданного размера."""
+        self.size = size
+        self.table: List[Union[None, _Deleted, Tuple[str, Any]]] = (
+            [None] * size)
         self.count = 0
+        # Длина пробы каждого элемента от его "домашней" ячейки
+        self.distances: List[int] = [0] * size if self._robin_hood else []
+
+    def _probes(self, key: str, home: Optional[int] = None) -> Iterator[int]:
+        """
+        Последовательность проб для ключа.
+
+        Сложность: O(1) на каждый шаг
+        """
+        if not self._accepts_home:
+            return self._strategy(key, self.size, self.hash_func)
+        if home is None:
+            home = self.hash_func(key, self.size)
+        return self._strategy(key, self.size, self.hash_func, home)
 
     def _probe_sequence(self, key: str, i: int) -> int:
         """
-        Генерирует последовательность проб в зависимости от метода.
+        Индекс i-й пробы для ключа.
 
-        Сложность: O(1)
+        Сложность: O(i)
         """
-        if self.probe_method == "linear":
-            return (self.hash_func(key, self.size) + i) % self.size
-        elif self.probe_method == "double":
-            h1 = self.hash_func(key, self.size)
-            h2 = 1 + (self.hash_func(key, self.size - 1) % (self.size - 1))
-            return (h1 + i * h2) % self.size
-        else:
-            raise ValueError("Неизвестный метод пробирования")
+        return next(islice(self._probes(key), i, None))
 
     def insert(self, key: str, value: Any) -> None:
         """
         Вставка элемента в хеш-таблицу.
 
+        Сложность:
+        - Средний случай: O(1/(1 - α)), амортизированно
+        - Худший случай: O(n)
+        """
+        if self.count + 1 > self.size * self.max_load_factor:
+            self._resize(self.size * 2)
+        self._insert_hashed(key, value, self.hash_func(key, self.size))
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента в хеш-таблице.
+
         Сложность:
         - Средний случай: O(1/(1 - α))
         - Худший случай: O(n)
         """
-        if self.count >= self.size * 0.9:
-            raise Exception("Хеш-таблица почти заполнена")
+        return self._search_hashed(key, self.hash_func(key, self.size))
 
-        for i in range(self.size):
-            index = self._probe_sequence(key, i)
+    def delete(self, key: str) -> None:
+        """
+        Удаление элемента из хеш-таблицы.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α))
+        - Худший случай: O(n)
+        """
+        self._delete_hashed(key, self.hash_func(key, self.size))
+
+    def insert_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Пакетная вставка пар (ключ, значение).
+
+        Таблица заранее увеличивается под размер пакета, а хеши всех
+        ключей вычисляются одним проходом.
+
+        Сложность: O(k / (1 - α)) для пакета из k элементов
+        """
+        items = list(items)
+        needed = self.count + len(items)
+        if needed > self.size * self.max_load_factor:
+            new_size = self.size
+            while needed > new_size * self.max_load_factor:
+                new_size = self._next_valid_size(new_size * 2)
+            self._resize(new_size)
+
+        homes = hash_many(self.hash_func, [key for key, _ in items],
+                          self.size)
+        insert_hashed = self._insert_hashed
+        for (key, value), home in zip(items, homes):
+            insert_hashed(key, value, home)
+
+    def search_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск. Возвращает значения в порядке ключей.
+
+        Сложность: O(k / (1 - α)) для пакета из k ключей
+        """
+        keys = list(keys)
+        homes = hash_many(self.hash_func, keys, self.size)
+        search_hashed = self._search_hashed
+        return [search_hashed(key, home) for key, home in zip(keys, homes)]
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Пакетное удаление.
+
+        Сложность: O(k / (1 - α)) для пакета из k ключей
+        """
+        keys = list(keys)
+        homes = hash_many(self.hash_func, keys, self.size)
+        delete_hashed = self._delete_hashed
+        for key, home in zip(keys, homes):
+            delete_hashed(key, home)
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Перестроение таблицы с новым размером (округляется до
+        допустимого для метода пробирования).
+
+        Сложность: O(n + new_size)
+        """
+        new_size = self._next_valid_size(new_size)
+        entries = [item for item in self.table
+                   if item is not None and item is not DELETED]
+        self._allocate(new_size)
+        keys = [item[0] for item in entries]  # type: ignore
+        homes = hash_many(self.hash_func, keys, new_size)
+        for (key, value), home in zip(entries, homes):  # type: ignore
+            self._insert_hashed(key, value, home)
+
+    def _insert_hashed(self, key: str, value: Any, home: int) -> None:
+        """Вставка с заранее вычисленной домашней ячейкой."""
+        if self._robin_hood:
+            self._insert_robin_hood(key, value, home)
+            return
+
+        first_deleted = None
+        index = None
+        for index in self._probes(key, home):
             item = self.table[index]
 
-            if item is None or item[0] == "__DELETED__":
+            if item is None:
+                break
+
+            if item is DELETED:
+                if first_deleted is None:
+                    first_deleted = index
+                continue
+
+            if item[0] == key:  # type: ignore
                 self.table[index] = (key, value)
+                return
+        else:
+            if first_deleted is None:
+                raise Exception("Не удалось найти место для вставки")
+
+        if first_deleted is not None:
+            index = first_deleted
+        self.table[index] = (key, value)  # type: ignore
+        self.count += 1
+
+    def _search_hashed(self, key: str, home: int) -> Optional[Any]:
+        """Поиск с заранее вычисленной домашней ячейкой."""
+        if self._robin_hood:
+            index = self._find_robin_hood(key, home)
+            return None if index < 0 else self.table[index][1]  # type: ignore
+
+        for index in self._probes(key, home):
+            item = self.table[index]
+
+            if item is None:
+                return None
+
+            if item is not DELETED and item[0] == key:  # type: ignore
+                return item[1]  # type: ignore
+
+        return None
+
+    def _delete_hashed(self, key: str, home: int) -> None:
+        """Удаление с заранее вычисленной домашней ячейкой."""
+        if self._robin_hood:
+            self._delete_robin_hood(key, home)
+            return
+
+        for index in self._probes(key, home):
+            item = self.table[index]
+
+            if item is None:
+                return
+
+            if item is not DELETED and item[0] == key:  # type: ignore
+                self.table[index] = DELETED
+                self.count -= 1
+                return
+
+    def _insert_robin_hood(self, key: str, value: Any, home: int) -> None:
+        """
+        Вставка Robin Hood: элемент, ушедший дальше от своей ячейки,
+        вытесняет "более богатый" элемент с меньшей длиной пробы.
+
+        Дисперсия длины пробы остается малой даже при высоком
+        заполнении. Сложность: O(1/(1 - α)) в среднем
+        """
+        table = self.table
+        distances = self.distances
+        size = self.size
+        entry: Tuple[str, Any] = (key, value)
+        distance = 0
+
+        for index in self._probes(key, home):
+            item = table[index]
+
+            if item is None:
+                table[index] = entry
+                distances[index] = distance
                 self.count += 1
                 return
 
-            if item[0] == key:
-                self.table[index] = (key, value)
+            if item[0] == entry[0]:  # type: ignore
+                table[index] = entry
                 return
 
+            if distances[index] < distance:
+                table[index], entry = entry, item  # type: ignore
+                distances[index], distance = distance, distances[index]
+
+            distance += 1
+            if distance >= size:
+                break
+
         raise Exception("Не удалось найти место для вставки")
 
-    def search(self, key: str) -> Optional[Any]:
+    def _find_robin_hood(self, key: str, home: int) -> int:
         """
-        Поиск элемента в хеш-таблице.
+        Индекс ключа или -1.
+
+        Поиск останавливается, как только длина пробы текущего элемента
+        меньше пройденного расстояния: дальше ключа быть не может.
+        """
+        table = self.table
+        distances = self.distances
+
+        for distance, index in enumerate(self._probes(key, home)):
+            item = table[index]
+            if item is None or distances[index] < distance:
+                return -1
+            if item[0] == key:  # type: ignore
+                return index
+        return -1
+
+    def _delete_robin_hood(self, key: str, home: int) -> None:
+        """
+        Удаление со сдвигом назад: следующие элементы кластера
+        сдвигаются на одну ячейку к своим домашним позициям, поэтому
+        маркеры удаления не нужны.
+        """
+        index = self._find_robin_hood(key, home)
+        if index < 0:
+            return
+
+        table = self.table
+        distances = self.distances
+        size = self.size
+        following = (index + 1) % size
+
+        while table[following] is not None and distances[following] > 0:
+            table[index] = table[following]
+            distances[index] = distances[following] - 1
+            index = following
+            following = (following + 1) % size
+
+        table[index] = None
+        distances[index] = 0
+        self.count -= 1
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Оценка занимаемой памяти в байтах через sys.getsizeof.
+
+        Части отчета:
+        - table_bytes: массив ячеек (и длины проб для Robin Hood)
+        - entry_bytes: кортежи (ключ, значение)
+        - key_bytes, value_bytes: сами объекты ключей и значений
+
+        Сложность: O(size)
+        """
+        entries: List[Tuple[str, Any]] = [
+            item for item in self.table  # type: ignore
+            if item is not None and item is not DELETED]
+        return build_report(
+            self.count,
+            table_bytes=(sys.getsizeof(self.table)
+                         + sys.getsizeof(self.distances)),
+            entry_bytes=sum(sys.getsizeof(item) for item in entries),
+            key_bytes=objects_size(key for key, _ in entries),
+            value_bytes=objects_size(value for _, value in entries),
+        )
+
+
+class CompactHashTableOpenAddressing:
+    """
+    Открытая адресация на параллельных массивах.
+
+    Хеши, ключи и значения хранятся в трех заранее выделенных массивах.
+    Для каждой ячейки кешируется полный хеш ключа, поэтому при пробировании
+    сначала сравниваются целые числа и только при их совпадении - строки,
+    а при перестроении таблицы хеш-функция повторно не вызывается.
+    Удаленные ячейки помечаются объектом DELETED и периодически
+    вычищаются перестроением таблицы.
+    """
+
+    def __init__(self, size: int = 8, probe_method: str = "linear",
+                 hash_func: Callable = djb2_hash,
+                 max_load_factor: float = 0.7,
+                 tombstone_threshold: float = 0.2):
+        """
+        Компактная хеш-таблица с открытой адресацией.
+
+        Args:
+            size: Начальная емкость (округляется вверх до степени двойки)
+            probe_method: Метод пробирования ("linear" или "double")
+            hash_func: Хеш-функция. По умолчанию используется djb2_hash.
+                Для защиты от подбора коллизий передайте keyed_hash()
+            max_load_factor: Максимальная доля занятых ячеек (вместе с
+                удаленными), при превышении таблица перестраивается
+            tombstone_threshold: Доля удаленных ячеек, при превышении
+                которой таблица уплотняется
+        """
+        if probe_method not in ("linear", "double"):
+            raise ValueError("Неизвестный метод пробирования")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor должен быть в интервале (0, 1)")
+
+        self.probe_method = probe_method
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.tombstone_threshold = tombstone_threshold
+
+        capacity = 8
+        while capacity < size:
+            capacity <<= 1
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Выделение пустых массивов заданной емкости."""
+        self.size = capacity
+        self._mask = capacity - 1
+        self.hashes = array('q', [EMPTY_HASH]) * capacity
+        self.keys: List[Any] = [None] * capacity
+        self.values: List[Any] = [None] * capacity
+        self.count = 0
+        self.tombstones = 0
+
+    def _full_hash(self, key: str) -> int:
+        """Хеш ключа, не зависящий от емкости таблицы."""
+        return self.hash_func(key, HASH_MODULUS)
+
+    def _step(self, key_hash: int) -> int:
+        """
+        Шаг пробирования.
+
+        При емкости, равной степени двойки, нечетный шаг двойного
+        хеширования гарантирует обход всех ячеек.
+        """
+        if self.probe_method == "linear":
+            return 1
+        return ((key_hash >> 20) & self._mask) | 1
+
+    def _find(self, key: str, key_hash: int) -> int:
+        """
+        Индекс ячейки с ключом или -1, если ключа нет.
 
         Сложность:
         - Средний случай: O(1/(1 - α))
         - Худший случай: O(n)
         """
-        for i in range(self.size):
-            index = self._probe_sequence(key, i)
-            item = self.table[index]
+        hashes = self.hashes
+        keys = self.keys
+        mask = self._mask
+        step = self._step(key_hash)
+        index = key_hash & mask
 
-            if item is None:
-                return None
+        for _ in range(self.size):
+            slot_hash = hashes[index]
+            if slot_hash == key_hash:
+                if keys[index] == key:
+                    return index
+            elif slot_hash == EMPTY_HASH and keys[index] is None:
+                return -1
+            index = (index + step) & mask
+        return -1
 
-            if item[0] == key:
-                return item[1]
+    def _place(self, key_hash: int, key: str, value: Any) -> None:
+        """Запись отсутствующего ключа в первую свободную ячейку."""
+        keys = self.keys
+        mask = self._mask
+        step = self._step(key_hash)
+        index = key_hash & mask
 
-        return None
+        while keys[index] is not None and keys[index] is not DELETED:
+            index = (index + step) & mask
+
+        if keys[index] is DELETED:
+            self.tombstones -= 1
+        self.hashes[index] = key_hash
+        keys[index] = key
+        self.values[index] = value
+        self.count += 1
+
+    def _rebuild(self, capacity: int) -> None:
+        """
+        Перестроение таблицы с заданной емкостью без удаленных ячеек.
+
+        Используются закешированные хеши, поэтому хеш-функция не
+        вызывается. Сложность: O(capacity)
+        """
+        old_entries = zip(self.hashes, self.keys, self.values)
+        self._allocate(capacity)
+        for key_hash, key, value in old_entries:
+            if key is not None and key is not DELETED:
+                self._place(key_hash, key, value)
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента в хеш-таблицу.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α)), амортизированно
+        - Худший случай: O(n)
+        """
+        self._insert_hashed(key, value, self._full_hash(key))
+
+    def _insert_hashed(self, key: str, value: Any, key_hash: int) -> None:
+        """Вставка с заранее вычисленным полным хешем."""
+        index = self._find(key, key_hash)
+        if index >= 0:
+            self.values[index] = value
+            return
+
+        if self.count + self.tombstones + 1 > self.size * self.max_load_factor:
+            # Если живых элементов немного, достаточно вычистить удаленные
+            # ячейки; иначе таблица увеличивается вдвое
+            if self.count + 1 > self.size * self.max_load_factor / 2:
+                self._rebuild(self.size * 2)
+            else:
+                self._rebuild(self.size)
+
+        self._place(key_hash, key, value)
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента в хеш-таблице.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α))
+        - Худший случай: O(n)
+        """
+        index = self._find(key, self._full_hash(key))
+        if index < 0:
+            return None
+        return self.values[index]
 
     def delete(self, key: str) -> None:
         """
         Удаление элемента из хеш-таблицы.
 
         Сложность:
-        - Средний случай: O(1/(1 - α))
+        - Средний случай: O(1/(1 - α)), амортизированно
         - Худший случай: O(n)
         """
-        for i in range(self.size):
-            index = self._probe_sequence(key, i)
-            item = self.table[index]
+        self._delete_hashed(key, self._full_hash(key))
 
-            if item is None:
-                return
+    def _delete_hashed(self, key: str, key_hash: int) -> None:
+        """Удаление с заранее вычисленным полным хешем."""
+        index = self._find(key, key_hash)
+        if index < 0:
+            return
 
-            if item[0] == key:
-                self.table[index] = ("__DELETED__", None)
-                self.count -= 1
-                return
+        self.hashes[index] = EMPTY_HASH
+        self.keys[index] = DELETED
+        self.values[index] = None
+        self.count -= 1
+        self.tombstones += 1
+
+        if self.tombstones > self.size * self.tombstone_threshold:
+            self._rebuild(self.size)
+
+    def insert_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Пакетная вставка пар (ключ, значение).
+
+        Емкость заранее увеличивается под размер пакета, а полные хеши
+        всех ключей вычисляются одним проходом.
+
+        Сложность: O(k / (1 - α)) для пакета из k элементов
+        """
+        items = list(items)
+        needed = self.count + len(items)
+        if needed > self.size * self.max_load_factor:
+            capacity = self.size
+            while needed > capacity * self.max_load_factor:
+                capacity <<= 1
+            self._rebuild(capacity)
+
+        key_hashes = hash_many(self.hash_func, [key for key, _ in items],
+                               HASH_MODULUS)
+        insert_hashed = self._insert_hashed
+        for (key, value), key_hash in zip(items, key_hashes):
+            insert_hashed(key, value, key_hash)
+
+    def search_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Пакетный поиск. Возвращает значения в порядке ключей.
+
+        Сложность: O(k / (1 - α)) для пакета из k ключей
+        """
+        keys = list(keys)
+        key_hashes = hash_many(self.hash_func, keys, HASH_MODULUS)
+        find = self._find
+        values = self.values
+        results = []
+        for key, key_hash in zip(keys, key_hashes):
+            index = find(key, key_hash)
+            results.append(values[index] if index >= 0 else None)
+        return results
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Пакетное удаление.
+
+        Сложность: O(k / (1 - α)) для пакета из k ключей, амортизированно
+        """
+        keys = list(keys)
+        key_hashes = hash_many(self.hash_func, keys, HASH_MODULUS)
+        delete_hashed = self._delete_hashed
+        for key, key_hash in zip(keys, key_hashes):
+            delete_hashed(key, key_hash)
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Оценка занимаемой памяти в байтах через sys.getsizeof.
+
+        Части отчета:
+        - table_bytes: массивы хешей, ключей и значений
+        - entry_bytes: всегда 0, отдельных объектов-записей нет
+        - key_bytes, value_bytes: сами объекты ключей и значений
+
+        Сложность: O(size)
+        """
+        live = [index for index, key in enumerate(self.keys)
+                if key is not None and key is not DELETED]
+        return build_report(
+            self.count,
+            table_bytes=(sys.getsizeof(self.hashes)
+                         + sys.getsizeof(self.keys)
+                         + sys.getsizeof(self.values)),
+            entry_bytes=0,
+            key_bytes=objects_size(self.keys[index] for index in live),
+            value_bytes=objects_size(self.values[index] for index in live),
+        )
+
+    def load_factor(self) -> float:
+        """Доля ячеек, занятых живыми элементами."""
+        return self.count / self.size
+
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
@@ -0,0 +1,365 @@
+"""Открытая адресация с хранением в файлах, отображаемых в память."""
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, Callable, Optional, Tuple
+
+from hash_functions import djb2_hash
+from hash_table_open_addressing import EMPTY_HASH, HASH_MODULUS
+
+# Заголовок файла ячеек: сигнатура, емкость, число живых элементов,
+# число удаленных ячеек
+_SLOTS_MAGIC = b'HTSLOT01'
+_SLOTS_HEADER = struct.Struct('<8sQQQ')
+# Ячейка: полный хеш ключа, смещения ключа и значения в куче
+_SLOT = struct.Struct('<qQQ')
+_DELETED_HASH = -2
+
+# Множитель фибоначчиева хеширования: 2^64 / φ
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+_HEAP_MAGIC = b'HTHEAP01'
+# Запись кучи: длина и байты
+_LENGTH = struct.Struct('<I')
+
+
+class MappedHashTable:
+    """
+    Хеш-таблица с открытой адресацией, хранящаяся на диске.
+
+    Таблица состоит из двух файлов:
+    - path + '.slots': массив ячеек фиксированной ширины (полный хеш,
+      смещение ключа, смещение значения), отображенный в память через mmap
+    - path + '.heap': куча переменной длины, в которую только дописываются
+      ключи в UTF-8 и значения, сериализованные pickle
+
+    Открытие существующей таблицы не требует ее перестроения: обращения
+    к ячейкам читают страницы файла по мере надобности, а процессы,
+    открывшие одну таблицу только для чтения, разделяют эти страницы
+    через страничный кеш ОС.
+
+    Пробирование линейное, емкость - степень двойки, как в
+    CompactHashTableOpenAddressing. Хеш-функция должна давать одинаковый
+    результат во всех процессах (djb2_hash или keyed_hash с общим зерном).
+    Значения восстанавливаются через pickle, поэтому открывать следует
+    только файлы из доверенного источника.
+    """
+
+    def __init__(self, path: str, size: int = 8,
+                 hash_func: Callable = djb2_hash,
+                 readonly: bool = False,
+                 max_load_factor: float = 0.7):
+        """
+        Открытие таблицы или создание новой, если файлов еще нет.
+
+        Args:
+            path: Путь к таблице без расширения
+            size: Начальная емкость новой таблицы (округляется вверх
+                до степени двойки)
+            hash_func: Хеш-функция
+            readonly: Открыть существующую таблицу только для чтения
+            max_load_factor: Максимальная доля занятых ячеек (вместе
+                с удаленными), при превышении таблица перестраивается
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor должен быть в интервале (0, 1)")
+
+        self.path = path
+        self.hash_func = hash_func
+        self.readonly = readonly
+        self.max_load_factor = max_load_factor
+
+        self._slots_path = path + '.slots'
+        self._heap_path = path + '.heap'
+
+        if not os.path.exists(self._slots_path):
+            if readonly:
+                raise FileNotFoundError(self._slots_path)
+            capacity = 8
+            while capacity < size:
+                capacity <<= 1
+            self._create(capacity)
+
+        access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+        self._access = access
+        self._slots_file = open(self._slots_path,
+                                'rb' if readonly else 'r+b')
+        self._slots = mmap.mmap(self._slots_file.fileno(), 0, access=access)
+        magic, self.size, self._count, self.tombstones = \
+            _SLOTS_HEADER.unpack_from(self._slots, 0)
+        if magic != _SLOTS_MAGIC:
+            raise ValueError(f"{self._slots_path}: неверный формат файла")
+        self._mask = self.size - 1
+
+        self._heap_file = open(self._heap_path, 'rb' if readonly else 'r+b')
+        if self._heap_file.read(len(_HEAP_MAGIC)) != _HEAP_MAGIC:
+            raise ValueError(f"{self._heap_path}: неверный формат файла")
+        self._heap_end = self._heap_file.seek(0, os.SEEK_END)
+        self._heap: Optional[mmap.mmap] = None
+
+    def _create(self, capacity: int) -> None:
+        """Создание пустых файлов ячеек и кучи."""
+        with open(self._slots_path, 'wb') as file:
+            file.write(self._empty_slots(capacity))
+        with open(self._heap_path, 'wb') as file:
+            file.write(_HEAP_MAGIC)
+
+    @staticmethod
+    def _empty_slots(capacity: int) -> bytearray:
+        """Содержимое файла ячеек пустой таблицы заданной емкости."""
+        data = bytearray(_SLOTS_HEADER.size + capacity * _SLOT.size)
+        _SLOTS_HEADER.pack_into(data, 0, _SLOTS_MAGIC, capacity, 0, 0)
+        empty = _SLOT.pack(EMPTY_HASH, 0, 0)
+        data[_SLOTS_HEADER.size:] = empty * capacity
+        return data
+
+    def _full_hash(self, key: str) -> int:
+        """Хеш ключа, не зависящий от емкости таблицы."""
+        return self.hash_func(key, HASH_MODULUS)
+
+    @staticmethod
+    def _home(key_hash: int, capacity: int) -> int:
+        """
+        Начальная ячейка ключа.
+
+        Берутся старшие биты произведения хеша на множитель Фибоначчи:
+        у последовательных ключей djb2 дает последовательные хеши, и
+        младшие биты без перемешивания образуют длинные кластеры.
+        """
+        shift = 64 - (capacity.bit_length() - 1)
+        return (key_hash * _FIBONACCI & _MASK64) >> shift
+
+    def _slot(self, index: int) -> Tuple[int, int, int]:
+        """Чтение ячейки: (хеш, смещение ключа, смещение значения)."""
+        return _SLOT.unpack_from(self._slots,
+                                 _SLOTS_HEADER.size + index * _SLOT.size)
+
+    def _write_slot(self, index: int, key_hash: int, key_offset: int,
+                    value_offset: int) -> None:
+        """Запись ячейки."""
+        _SLOT.pack_into(self._slots, _SLOTS_HEADER.size + index * _SLOT.size,
+                        key_hash, key_offset, value_offset)
+
+    def _write_header(self) -> None:
+        """Сохранение счетчиков в заголовке файла ячеек."""
+        _SLOTS_HEADER.pack_into(self._slots, 0, _SLOTS_MAGIC, self.size,
+                                self.count, self.tombstones)
+
+    def _check_writable(self) -> None:
+        """Запрет изменения таблицы, открытой только для чтения."""
+        if self.readonly:
+            raise PermissionError("Таблица открыта только для чтения")
+
+    def _read_heap(self, offset: int) -> bytes:
+        """
+        Чтение записи кучи по смещению.
+
+        Отображение кучи создается заново, если запись находится за его
+        концом (куча выросла после отображения).
+        """
+        heap = self._heap
+        if heap is None or offset >= len(heap):
+            if heap is not None:
+                heap.close()
+            heap = self._heap = mmap.mmap(self._heap_file.fileno(), 0,
+                                          access=mmap.ACCESS_READ)
+        (length,) = _LENGTH.unpack_from(heap, offset)
+        start = offset + _LENGTH.size
+        return heap[start:start + length]
+
+    def _append_heap(self, data: bytes) -> int:
+        """Дописывание записи в конец кучи. Возвращает ее смещение."""
+        offset = self._heap_end
+        self._heap_file.seek(offset)
+        self._heap_file.write(_LENGTH.pack(len(data)))
+        self._heap_file.write(data)
+        self._heap_file.flush()
+        self._heap_end = offset + _LENGTH.size + len(data)
+        return offset
+
+    def _find(self, key_bytes: bytes, key_hash: int) -> int:
+        """
+        Индекс ячейки с ключом или -1, если ключа нет.
+
+        Ключ из кучи читается только при совпадении полного хеша.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α))
+        - Худший случай: O(n)
+        """
+        mask = self._mask
+        index = self._home(key_hash, self.size)
+        for _ in range(self.size):
+            slot_hash, key_offset, _ = self._slot(index)
+            if slot_hash == key_hash:
+                if self._read_heap(key_offset) == key_bytes:
+                    return index
+            elif slot_hash == EMPTY_HASH:
+                return -1
+            index = (index + 1) & mask
+        return -1
+
+    def _place(self, key_hash: int, key_offset: int,
+               value_offset: int) -> None:
+        """Запись отсутствующего ключа в первую свободную ячейку."""
+        mask = self._mask
+        index = self._home(key_hash, self.size)
+        slot_hash = self._slot(index)[0]
+        while slot_hash != EMPTY_HASH and slot_hash != _DELETED_HASH:
+            index = (index + 1) & mask
+            slot_hash = self._slot(index)[0]
+        if slot_hash == _DELETED_HASH:
+            self.tombstones -= 1
+        self._write_slot(index, key_hash, key_offset, value_offset)
+        self.count += 1
+
+    def _rebuild(self, capacity: int) -> None:
+        """
+        Перестроение файла ячеек с заданной емкостью без удаленных ячеек.
+
+        Новый файл записывается рядом и атомарно подменяет старый, поэтому
+        процессы, уже отобразившие старый файл, продолжают его читать.
+        Используются сохраненные хеши, куча не читается.
+
+        Сложность: O(capacity)
+        """
+        entries = [self._slot(index) for index in range(self.size)]
+        data = self._empty_slots(capacity)
+        mask = capacity - 1
+        for key_hash, key_offset, value_offset in entries:
+            if key_hash < 0:
+                continue
+            index = self._home(key_hash, capacity)
+            while _SLOT.unpack_from(
+                    data, _SLOTS_HEADER.size + index * _SLOT.size
+            )[0] != EMPTY_HASH:
+                index = (index + 1) & mask
+            _SLOT.pack_into(data, _SLOTS_HEADER.size + index * _SLOT.size,
+                            key_hash, key_offset, value_offset)
+        _SLOTS_HEADER.pack_into(data, 0, _SLOTS_MAGIC, capacity,
+                                self.count, 0)
+
+        temp_path = self._slots_path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        self._slots.close()
+        self._slots_file.close()
+        os.replace(temp_path, self._slots_path)
+
+        self._slots_file = open(self._slots_path, 'r+b')
+        self._slots = mmap.mmap(self._slots_file.fileno(), 0,
+                                access=self._access)
+        self.size = capacity
+        self._mask = mask
+        self.tombstones = 0
+
+    def insert(self, key: str, value: Any) -> None:
+        """
+        Вставка элемента. Ключ и значение дописываются в кучу, при
+        обновлении старое значение остается в куче неиспользуемым.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α)), амортизированно
+        - Худший случай: O(n)
+        """
+        self._check_writable()
+        key_bytes = key.encode('utf-8')
+        key_hash = self._full_hash(key)
+        value_offset = self._append_heap(pickle.dumps(value))
+
+        index = self._find(key_bytes, key_hash)
+        if index >= 0:
+            _, key_offset, _ = self._slot(index)
+            self._write_slot(index, key_hash, key_offset, value_offset)
+            return
+
+        if self.count + self.tombstones + 1 > self.size * self.max_load_factor:
+            if self.count + 1 > self.size * self.max_load_factor / 2:
+                self._rebuild(self.size * 2)
+            else:
+                self._rebuild(self.size)
+
+        self._place(key_hash, self._append_heap(key_bytes), value_offset)
+        self._write_header()
+
+    def search(self, key: str) -> Optional[Any]:
+        """
+        Поиск элемента.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α))
+        - Худший случай: O(n)
+        """
+        index = self._find(key.encode('utf-8'), self._full_hash(key))
+        if index < 0:
+            return None
+        return pickle.loads(self._read_heap(self._slot(index)[2]))
+
+    def delete(self, key: str) -> None:
+        """
+        Удаление элемента. Ячейка помечается удаленной.
+
+        Сложность:
+        - Средний случай: O(1/(1 - α))
+        - Худший случай: O(n)
+        """
+        self._check_writable()
+        index = self._find(key.encode('utf-8'), self._full_hash(key))
+        if index < 0:
+            return
+        self._write_slot(index, _DELETED_HASH, 0, 0)
+        self.count -= 1
+        self.tombstones += 1
+        self._write_header()
+
+    def flush(self) -> None:
+        """Сброс изменений файла ячеек на диск."""
+        if not self.readonly:
+            self._slots.flush()
+            self._heap_file.flush()
+
+    def close(self) -> None:
+        """Закрытие отображений и файлов."""
+        self.flush()
+        if self._heap is not None:
+            self._heap.close()
+            self._heap = None
+        self._slots.close()
+        self._slots_file.close()
+        self._heap_file.close()
+
+    @property
+    def count(self) -> int:
+        """
+        Количество живых элементов.
+
+        Таблица, открытая только для чтения, читает счетчик из заголовка
+        при каждом обращении, поэтому видит записи другого процесса так
+        же, как их видит поиск. После перестроения таблицы писателем
+        читатель остается на старом файле и должен открыть таблицу заново.
+        """
+        if self.readonly:
+            return _SLOTS_HEADER.unpack_from(self._slots, 0)[2]
+        return self._count
+
+    @count.setter
+    def count(self, value: int) -> None:
+        self._count = value
+
+    def load_factor(self) -> float:
+        """Доля ячеек, занятых живыми элементами."""
+        return self.count / self.size
+
+    def __len__(self) -> int:
+        """Количество элементов в таблице."""
+        return self.count
+
+    def __enter__(self) -> 'MappedHashTable':
+        """Использование таблицы в блоке with."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Закрытие таблицы при выходе из блока with."""
+        self.close()
@@ -0,0 +1,49 @@
+"""Оценка объема памяти, занимаемой хеш-таблицами."""
+import sys
+from typing import Any, Dict, Iterable
+
+
+def objects_size(objects: Iterable[Any]) -> int:
+    """
+    Суммарный размер объектов по sys.getsizeof без обхода вложенных.
+
+    Один и тот же объект (например, интернированная строка) учитывается
+    один раз.
+    """
+    seen = set()
+    total = 0
+    for obj in objects:
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+    return total
+
+
+def build_report(count: int, **parts: int) -> Dict[str, float]:
+    """
+    Сборка отчета о памяти из размеров составных частей.
+
+    Args:
+        count: Количество элементов в структуре
+        **parts: Размеры частей в байтах, например table_bytes=...
+
+    Returns:
+        Словарь с частями, общим размером и байтами на элемент
+    """
+    report: Dict[str, float] = dict(parts)
+    total = sum(parts.values())
+    report['total_bytes'] = total
+    report['count'] = count
+    report['bytes_per_entry'] = total / count if count else 0.0
+    return report
+
+
+def dict_memory_report(data: Dict[Any, Any]) -> Dict[str, float]:
+    """Отчет о памяти встроенного dict для сравнения."""
+    return build_report(
+        len(data),
+        table_bytes=sys.getsizeof(data),
+        entry_bytes=0,
+        key_bytes=objects_size(data.keys()),
+        value_bytes=objects_size(data.values()),
+    )
@@ -1,11 +1,25 @@
 """Анализ производительности хеш-таблиц."""
+import os
+import random
+import tempfile
+import threading
 import time
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
+from cache import Cache, POLICIES
+from concurrent_hash_table import ConcurrentHashTableChaining
 from hash_table_chaining import HashTableChaining
-from hash_table_open_addressing import HashTableOpenAddressing
+from mapped_hash_table import MappedHashTable
+from hash_table_open_addressing import (
+    HashTableOpenAddressing, CompactHashTableOpenAddressing, DELETED
+)
 from hash_functions import simple_hash, polynomial_hash, djb2_hash
+from memory_usage import dict_memory_report
+
+PROBE_METHODS = ['linear', 'double', 'quadratic', 'robin_hood']
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+READ_RATIOS = [0.5, 0.9, 0.99]
 
 
 class PerformanceAnalyzer:
@@ -41,7 +55,7 @@ class PerformanceAnalyzer:
         non_empty_buckets = 0
 
         for bucket in table.table:
-            if len(bucket) > 0:
+            if bucket:
                 non_empty_buckets += 1
                 if len(bucket) > 1:
                     collisions += len(bucket) - 1
@@ -58,23 +72,27 @@ class PerformanceAnalyzer:
                                          data_size: int) -> Dict[str, Any]:
         """Подсчет коллизий для открытой адресации."""
         probes_per_insert = []
+        probes_per_search = []
         occupied_cells = 0
 
         test_data = self.generate_collision_test_data(data_size)
 
         for key, value in test_data:
             probe_count = 0
-            for i in range(table.size):
+            search_probes = 0
+            for index in table._probes(key):
                 probe_count += 1
-                index = table._probe_sequence(key, i)
-                if (table.table[index] is None or
-                        table.table[index][0] ==  # type: ignore
-                        "__DELETED__"):
+                cell = table.table[index]
+                if cell is None or cell is DELETED:
                     break
+                if not search_probes and cell[0] == key:  # type: ignore
+                    search_probes = probe_count
             probes_per_insert.append(probe_count)
+            if search_probes:
+                probes_per_search.append(search_probes)
 
         for cell in table.table:
-            if cell is not None and cell[0] != "__DELETED__":
+            if cell is not None and cell is not DELETED:
                 occupied_cells += 1
 
         return {
@@ -82,6 +100,10 @@ class PerformanceAnalyzer:
             else 0,
             'max_probes': max(probes_per_insert) if probes_per_insert
             else 0,
+            'avg_search_probes': np.mean(probes_per_search)
+            if probes_per_search else 0,
+            'search_probe_variance': np.var(probes_per_search)
+            if probes_per_search else 0,
             'occupied_cells': occupied_cells,
             'load_factor': occupied_cells / table.size
         }
@@ -124,7 +146,8 @@ class PerformanceAnalyzer:
 
         table = HashTableOpenAddressing(size=table_size,
                                         probe_method=probe_method,
-                                        hash_func=hash_func)
+                                        hash_func=hash_func,
+                                        max_load_factor=0.9)
         test_data = self.generate_collision_test_data(
             min(data_size, int(table_size * 0.8)))
 
@@ -147,6 +170,8 @@ class PerformanceAnalyzer:
                 'search_time': search_time / len(test_data) * 1000,
                 'avg_probes': collision_stats['avg_probes'],
                 'max_probes': collision_stats['max_probes'],
+                'search_probe_variance':
+                    collision_stats['search_probe_variance'],
                 'load_factor_actual': collision_stats['load_factor'],
                 'successful': True
             }
@@ -160,10 +185,397 @@ class PerformanceAnalyzer:
                 'search_time': float('inf'),
                 'avg_probes': 0,
                 'max_probes': 0,
+                'search_probe_variance': 0,
                 'load_factor_actual': 0,
                 'successful': False
             }
 
+    def measure_insert_latency_growth(self, hash_func, data_size: int = 20000,
+                                      initial_size: int = 16,
+                                      rehash_step: int = 4
+                                      ) -> Dict[str, float]:
+        """
+        Измерение задержек вставки в растущую таблицу методом цепочек.
+
+        Таблица стартует с малого размера и многократно увеличивается,
+        поэтому перцентили отражают стоимость перехеширования.
+        """
+        table = HashTableChaining(size=initial_size, hash_func=hash_func,
+                                  rehash_step=rehash_step)
+        latencies = []
+
+        for i in range(data_size):
+            key = f"key_{i}"
+            start_time = time.perf_counter()
+            table.insert(key, i)
+            latencies.append(time.perf_counter() - start_time)
+
+        latencies_us = np.array(latencies) * 1_000_000
+        return {
+            'p50_us': float(np.percentile(latencies_us, 50)),
+            'p99_us': float(np.percentile(latencies_us, 99)),
+            'max_us': float(latencies_us.max()),
+            'final_size': table.size
+        }
+
+    def run_growth_latency_analysis(self, data_size: int = 20000):
+        """Сравнение инкрементального и полного перехеширования."""
+        print("\nЗадержки вставки при росте таблицы (метод цепочек)...")
+
+        # rehash_step=data_size переносит всю старую таблицу за одну
+        # операцию, что эквивалентно классическому полному перехешированию
+        modes = [('incremental', 4), ('full', data_size)]
+        self.results['growth_latency'] = {}
+        for mode, step in modes:
+            result = self.measure_insert_latency_growth(
+                djb2_hash, data_size, rehash_step=step)
+            self.results['growth_latency'][mode] = result
+            print(f"  {mode}: p50={result['p50_us']:.2f}мкс, "
+                  f"p99={result['p99_us']:.2f}мкс, "
+                  f"max={result['max_us']:.2f}мкс, "
+                  f"размер={result['final_size']}")
+
+    def measure_churn_open_addressing(self, table, live_keys: int = 500,
+                                      cycles: int = 20) -> Dict[str, float]:
+        """
+        Нагрузка вида "вставка/удаление" для открытой адресации.
+
+        На каждом цикле удаляются все живые ключи и вставляются новые,
+        после чего замеряется время поиска по актуальному набору ключей.
+        """
+        keys = [f"key_{i}" for i in range(live_keys)]
+        for key in keys:
+            table.insert(key, key)
+
+        start_time = time.perf_counter()
+        for cycle in range(cycles):
+            new_keys = [f"key_{cycle}_{i}" for i in range(live_keys)]
+            for old_key, new_key in zip(keys, new_keys):
+                table.delete(old_key)
+                table.insert(new_key, new_key)
+            keys = new_keys
+        churn_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for key in keys:
+            table.search(key)
+        search_time = time.perf_counter() - start_time
+
+        return {
+            'churn_time': churn_time / (2 * live_keys * cycles) * 1000,
+            'search_time': search_time / live_keys * 1000,
+            'size': table.size
+        }
+
+    def run_churn_analysis(self, live_keys: int = 500, cycles: int = 20):
+        """Сравнение классической и компактной открытой адресации."""
+        print("\nНагрузка вставка/удаление (открытая адресация)...")
+
+        tables = [
+            ('tuples', HashTableOpenAddressing(size=int(live_keys / 0.7),
+                                               probe_method='linear',
+                                               max_load_factor=0.9)),
+            ('compact', CompactHashTableOpenAddressing(
+                size=int(live_keys / 0.7), probe_method='linear')),
+        ]
+        self.results['churn'] = {}
+        for name, table in tables:
+            result = self.measure_churn_open_addressing(table, live_keys,
+                                                        cycles)
+            self.results['churn'][name] = result
+            print(f"  {name}: операция {result['churn_time']:.4f}мс, "
+                  f"поиск {result['search_time']:.4f}мс, "
+                  f"размер={result['size']}")
+
+    def run_high_load_probe_analysis(self, load_factor: float = 0.85,
+                                     table_size: int = 1021):
+        """
+        Длины проб при высоком заполнении для всех методов пробирования.
+
+        Простой размер нужен двойному хешированию, а квадратичному -
+        степень двойки, до которой таблица округляет размер сама.
+        """
+        print(f"\nДлины проб поиска при LF={load_factor}...")
+        data_size = int(table_size * load_factor)
+        test_data = [(f"key_{i}", i) for i in range(data_size)]
+        self.results['high_load_probes'] = {}
+
+        for probe_method in PROBE_METHODS:
+            table = HashTableOpenAddressing(size=table_size,
+                                            probe_method=probe_method,
+                                            max_load_factor=0.9)
+            for key, value in test_data:
+                table.insert(key, value)
+
+            probes = []
+            for key, value in test_data:
+                for count, index in enumerate(table._probes(key), 1):
+                    if table.table[index][0] == key:  # type: ignore
+                        probes.append(count)
+                        break
+
+            result = {
+                'avg_probes': float(np.mean(probes)),
+                'max_probes': int(max(probes)),
+                'probe_variance': float(np.var(probes))
+            }
+            self.results['high_load_probes'][probe_method] = result
+            print(f"  {probe_method}: среднее={result['avg_probes']:.2f}, "
+                  f"максимум={result['max_probes']}, "
+                  f"дисперсия={result['probe_variance']:.2f}")
+
+    def run_bulk_load_analysis(self, data_size: int = 20000):
+        """Сравнение поэлементной и пакетной загрузки таблиц."""
+        print("\nПакетная загрузка таблиц...")
+        items = [(f"key_{i}", i) for i in range(data_size)]
+        factories = [
+            ('chaining', lambda: HashTableChaining(size=16)),
+            ('open_linear', lambda: HashTableOpenAddressing(size=16)),
+            ('compact', lambda: CompactHashTableOpenAddressing(size=16)),
+        ]
+        self.results['bulk_load'] = {}
+
+        for name, factory in factories:
+            table = factory()
+            start_time = time.perf_counter()
+            for key, value in items:
+                table.insert(key, value)
+            single_time = time.perf_counter() - start_time
+
+            table = factory()
+            start_time = time.perf_counter()
+            table.insert_many(items)
+            batch_time = time.perf_counter() - start_time
+
+            self.results['bulk_load'][name] = {
+                'single_time': single_time,
+                'batch_time': batch_time
+            }
+            print(f"  {name}: insert {single_time:.4f}с, "
+                  f"insert_many {batch_time:.4f}с, "
+                  f"ускорение {single_time / batch_time:.2f}x")
+
+    def run_memory_analysis(self, data_size: int = 10000):
+        """Сравнение байтов на элемент для таблиц и встроенного dict."""
+        print("\nПамять на элемент (байт)...")
+        items = [(f"key_{i}", i) for i in range(data_size)]
+        self.results['memory'] = {}
+
+        for lf in [0.25, 0.5, 0.7]:
+            table_size = int(data_size / lf)
+            tables = [
+                ('chaining', HashTableChaining(size=table_size)),
+                ('open_linear', HashTableOpenAddressing(
+                    size=table_size, max_load_factor=0.9)),
+                ('open_robin_hood', HashTableOpenAddressing(
+                    size=table_size, probe_method='robin_hood',
+                    max_load_factor=0.9)),
+                ('compact', CompactHashTableOpenAddressing(
+                    size=table_size, max_load_factor=0.9)),
+            ]
+            self.results['memory'][lf] = {}
+            for name, table in tables:
+                for key, value in items:
+                    table.insert(key, value)
+                report = table.memory_report()
+                self.results['memory'][lf][name] = report
+                print(f"  LF={lf} {name}: "
+                      f"{report['bytes_per_entry']:.1f} байт/элемент "
+                      f"(фактический LF={table.count / table.size:.2f})")
+
+        report = dict_memory_report(dict(items))
+        self.results['memory']['dict'] = report
+        print(f"  dict: {report['bytes_per_entry']:.1f} байт/элемент")
+
+    def measure_concurrent_throughput(self, table, threads: int,
+                                      read_ratio: float,
+                                      ops_per_thread: int = 5000,
+                                      key_space: int = 2000,
+                                      lock: Optional[Any] = None
+                                      ) -> float:
+        """
+        Пропускная способность (операций в секунду) смешанной нагрузки.
+
+        Каждый поток выполняет ops_per_thread операций над случайными
+        ключами: доля read_ratio приходится на поиск, остальное поровну
+        на вставку и удаление. Если передан lock, каждая операция
+        выполняется под этой общей блокировкой.
+        """
+        keys = [f"key_{i}" for i in range(key_space)]
+        for key in keys[::2]:
+            table.insert(key, key)
+
+        barrier = threading.Barrier(threads + 1)
+
+        def worker(seed: int):
+            rng = random.Random(seed)
+            plan = [(rng.random(), rng.choice(keys))
+                    for _ in range(ops_per_thread)]
+            write_ratio = (1 + read_ratio) / 2
+            barrier.wait()
+            for roll, key in plan:
+                if lock is not None:
+                    lock.acquire()
+                if roll < read_ratio:
+                    table.search(key)
+                elif roll < write_ratio:
+                    table.insert(key, key)
+                else:
+                    table.delete(key)
+                if lock is not None:
+                    lock.release()
+
+        workers = [threading.Thread(target=worker, args=(seed,))
+                   for seed in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start_time = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+
+        return threads * ops_per_thread / elapsed
+
+    def run_concurrency_analysis(self, ops_per_thread: int = 5000):
+        """
+        Масштабирование по числу потоков: таблица с полосовыми
+        блокировками против HashTableChaining под одной общей блокировкой.
+
+        При глобальной блокировке интерпретатора (GIL) потоки не дают
+        прироста скорости, и замер показывает накладные расходы
+        синхронизации. Выигрыш полосовых блокировок проявляется на сборках
+        Python без GIL.
+        """
+        print("\nМногопоточная нагрузка (операций в секунду)...")
+
+        self.results['concurrency'] = {}
+        for read_ratio in READ_RATIOS:
+            result: Dict[str, Dict[int, float]] = {
+                'striped': {}, 'global_lock': {}}
+            for threads in THREAD_COUNTS:
+                result['striped'][threads] = \
+                    self.measure_concurrent_throughput(
+                        ConcurrentHashTableChaining(), threads, read_ratio,
+                        ops_per_thread)
+                result['global_lock'][threads] = \
+                    self.measure_concurrent_throughput(
+                        HashTableChaining(), threads, read_ratio,
+                        ops_per_thread, lock=threading.Lock())
+                print(f"  чтение {read_ratio:.0%}, потоков {threads}: "
+                      f"полосы {result['striped'][threads]:,.0f}, "
+                      f"общая блокировка "
+                      f"{result['global_lock'][threads]:,.0f}")
+            self.results['concurrency'][read_ratio] = result
+
+    def run_persistence_analysis(self, data_size: int = 50000,
+                                 lookups: int = 1000):
+        """
+        Время готовности таблицы к работе: построение
+        CompactHashTableOpenAddressing в памяти против открытия заранее
+        записанной MappedHashTable только для чтения.
+        """
+        print("\nОткрытие таблицы с диска против построения в памяти...")
+
+        items = [(f"key_{i}", i) for i in range(data_size)]
+        probe_keys = [key for key, _ in items[::max(1, data_size // lookups)]]
+
+        start_time = time.perf_counter()
+        table = CompactHashTableOpenAddressing()
+        table.insert_many(items)
+        build_time = time.perf_counter() - start_time
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table')
+            with MappedHashTable(path, size=int(data_size / 0.7)) as mapped:
+                start_time = time.perf_counter()
+                for key, value in items:
+                    mapped.insert(key, value)
+                write_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            mapped = MappedHashTable(path, readonly=True)
+            open_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for key in probe_keys:
+                mapped.search(key)
+            search_time = time.perf_counter() - start_time
+            mapped.close()
+
+        self.results['persistence'] = {
+            'build_time': build_time * 1000,
+            'write_time': write_time * 1000,
+            'open_time': open_time * 1000,
+            'search_time': search_time / len(probe_keys) * 1000,
+        }
+        print(f"  построение в памяти: {build_time * 1000:.1f}мс")
+        print(f"  запись на диск: {write_time * 1000:.1f}мс")
+        print(f"  открытие с диска: {open_time * 1000:.3f}мс, "
+              f"поиск {search_time / len(probe_keys) * 1000:.4f}мс")
+
+    def generate_zipf_trace(self, length: int, universe: int,
+                            exponent: float = 1.0,
+                            seed: int = 42) -> List[str]:
+        """
+        Последовательность запросов с распределением Ципфа: ключ ранга k
+        запрашивается с вероятностью, пропорциональной 1 / k^exponent.
+        """
+        rng = random.Random(seed)
+        keys = [f"key_{rank}" for rank in range(universe)]
+        rng.shuffle(keys)
+        weights = [1 / (rank + 1) ** exponent for rank in range(universe)]
+        return rng.choices(keys, weights=weights, k=length)
+
+    def measure_cache(self, cache: Cache, trace: List[str]
+                      ) -> Dict[str, float]:
+        """
+        Прогон трассы через кеш: промах сопровождается записью ключа,
+        как при загрузке из медленного источника.
+        """
+        start_time = time.perf_counter()
+        for key in trace:
+            if cache.get(key) is None:
+                cache.put(key, key)
+        elapsed = time.perf_counter() - start_time
+
+        result = cache.stats()
+        result['ops_per_sec'] = len(trace) / elapsed
+        return result
+
+    def run_cache_analysis(self, capacity: int = 1000,
+                           universe: int = 20000,
+                           trace_length: int = 100000):
+        """
+        Доля попаданий и пропускная способность кеша для каждой политики
+        на трассах Ципфа разной асимметрии.
+
+        Для политики 'ttl' время моделируется счетчиком обращений кеша
+        к часам (одно-два на запрос), поэтому результат воспроизводим.
+        """
+        print("\nКеш на трассе Ципфа...")
+
+        self.results['cache'] = {}
+        for exponent in [0.8, 1.0, 1.2]:
+            trace = self.generate_zipf_trace(trace_length, universe,
+                                             exponent)
+            self.results['cache'][exponent] = {}
+            for policy in POLICIES:
+                tick = [0]
+
+                def clock() -> float:
+                    tick[0] += 1
+                    return tick[0]
+
+                ttl = 2 * capacity if policy == 'ttl' else None
+                cache = Cache(capacity, policy, ttl=ttl, clock=clock)
+                result = self.measure_cache(cache, trace)
+                self.results['cache'][exponent][policy] = result
+                print(f"  s={exponent}, {policy}: "
+                      f"попадания {result['hit_ratio']:.3f}, "
+                      f"{result['ops_per_sec']:,.0f} оп/с, "
+                      f"вытеснено {result['evictions']}")
+
     def run_comparative_analysis(self):
         """Проведение сравнительного анализа."""
         print("Запуск сравнительного анализа производительности...")
@@ -188,7 +600,7 @@ class PerformanceAnalyzer:
                           f"Макс. цепочка: {result['max_chain_length']}")
 
         print("\nАнализ открытой адресации...")
-        for probe_method in ['linear', 'double']:
+        for probe_method in PROBE_METHODS:
             for hash_name, hash_func in hash_functions:
                 key = f'open_{probe_method}_{hash_name}'
                 self.results[key] = {}
@@ -201,7 +613,9 @@ class PerformanceAnalyzer:
                     self.results[key][lf] = result
                     if result['successful']:
                         print(f"    ✓ Вставка: {result['insert_time']:.4f}мс, "
-                              f"Средние пробы: {result['avg_probes']:.2f}")
+                              f"Средние пробы: {result['avg_probes']:.2f}, "
+                              f"Дисперсия проб поиска: "
+                              f"{result['search_probe_variance']:.2f}")
                     else:
                         print("    ✗ ПРОВАЛ")
 
@@ -251,7 +665,7 @@ class PerformanceAnalyzer:
         ax.grid(True, alpha=0.3)
 
         ax = axes[1, 0]
-        for probe_method in ['linear', 'double']:
+        for probe_method in PROBE_METHODS:
             for hash_name in ['djb2']:
                 key = f'open_{probe_method}_{hash_name}'
                 times = []
@@ -273,7 +687,7 @@ class PerformanceAnalyzer:
         ax.grid(True, alpha=0.3)
 
         ax = axes[1, 1]
-        for probe_method in ['linear', 'double']:
+        for probe_method in PROBE_METHODS:
             for hash_name in ['djb2']:
                 key = f'open_{probe_method}_{hash_name}'
                 times = []
@@ -340,5 +754,13 @@ class PerformanceAnalyzer:
 if __name__ == "__main__":
     analyzer = PerformanceAnalyzer()
     analyzer.run_comparative_analysis()
+    analyzer.run_growth_latency_analysis()
+    analyzer.run_churn_analysis()
+    analyzer.run_high_load_probe_analysis()
+    analyzer.run_bulk_load_analysis()
+    analyzer.run_memory_analysis()
+    analyzer.run_concurrency_analysis()
+    analyzer.run_persistence_analysis()
+    analyzer.run_cache_analysis()
     analyzer.plot_performance_comparison()
     analyzer.plot_collision_histograms()
@@ -8,6 +8,14 @@ def main():
     analyzer = PerformanceAnalyzer()
 
     analyzer.run_comparative_analysis()
+    analyzer.run_growth_latency_analysis()
+    analyzer.run_churn_analysis()
+    analyzer.run_high_load_probe_analysis()
+    analyzer.run_bulk_load_analysis()
+    analyzer.run_memory_analysis()
+    analyzer.run_concurrency_analysis()
+    analyzer.run_persistence_analysis()
+    analyzer.run_cache_analysis()
 
     print("\nПостроение графиков...")
     analyzer.plot_performance_comparison()
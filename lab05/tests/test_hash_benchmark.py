@@ -0,0 +1,114 @@
+"""Тестирование бенчмарка хеш-функций."""
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from hash_benchmark import (  # type: ignore # noqa: E402
+    CORPORA, generate_corpus, bucket_statistics, run_benchmark, save_results
+    )
+from hash_functions import (  # type: ignore # noqa: E402
+    djb2_hash, polynomial_hash
+    )
+from hash_table_open_addressing import (  # type: ignore # noqa: E402
+    HashTableOpenAddressing
+    )
+
+
+def test_corpus_is_deterministic():
+    """Один и тот же seed дает один и тот же набор ключей."""
+    print("Тестирование генерации наборов ключей...")
+
+    for name in CORPORA:
+        keys = generate_corpus(name, 500, seed=7)
+        assert keys == generate_corpus(name, 500, seed=7)
+        assert len(keys) == 500
+        assert len(set(keys)) == 500
+        if name != 'sequential':
+            assert keys != generate_corpus(name, 500, seed=8)
+        print(f"  ✓ {name}")
+
+    try:
+        generate_corpus('unknown', 10)
+        assert False, "Ожидалась ошибка для неизвестного набора"
+    except ValueError:
+        pass
+
+
+def test_bucket_statistics_by_hand():
+    """Хи-квадрат и длины цепочек на примере, посчитанном вручную."""
+    print("Тестирование статистики корзин...")
+
+    def digit_hash(key: str, table_size: int) -> int:
+        return int(key) % table_size
+
+    # Корзины таблицы из 4 ячеек: [2, 1, 0, 1], ожидается по 1 ключу,
+    # хи-квадрат = (1 + 0 + 1 + 0) / 1 = 2 при 3 степенях свободы.
+    # Линейное пробирование в 5 ячейках: домашние ячейки 0, 0, 1, 3,
+    # ключи занимают ячейки 0, 1, 2, 3 с длинами проб 1, 2, 2, 1
+    stats = bucket_statistics(digit_hash, ["0", "20", "1", "3"], 4)
+    assert stats['chi_squared'] == 2
+    assert stats['chi_squared_ratio'] == 2 / 3
+    assert stats['max_chain_length'] == 2
+    assert stats['max_probe_length'] == 2
+
+    uniform = bucket_statistics(digit_hash, [str(i) for i in range(8)], 4)
+    assert uniform['chi_squared'] == 0
+    assert uniform['max_chain_length'] == 2
+    print("  ✓ Значения совпадают с ручным расчетом")
+
+
+def test_max_probe_matches_real_table():
+    """Моделирование линейного пробирования совпадает с таблицей."""
+    print("Тестирование моделирования длины пробы...")
+
+    for name in ['urls', 'anagrams']:
+        keys = generate_corpus(name, 2000, seed=3)
+        for hash_func in [djb2_hash, polynomial_hash]:
+            stats = bucket_statistics(hash_func, keys, 101)
+
+            probe_size = int(len(keys) / 0.7)
+            table = HashTableOpenAddressing(size=probe_size,
+                                            probe_method="linear",
+                                            hash_func=hash_func,
+                                            max_load_factor=0.9)
+            for key in keys:
+                table.insert(key, None)
+            max_probe = max(
+                (index - hash_func(entry[0], probe_size)) % probe_size + 1
+                for index, entry in enumerate(table.table)
+                if entry is not None)
+
+            assert stats['max_probe_length'] == max_probe
+            print(f"  ✓ {name} / {hash_func.__name__}: {max_probe}")
+
+
+def test_results_json_round_trip():
+    """Результаты бенчмарка сохраняются в JSON без потерь."""
+    print("Тестирование сохранения результатов...")
+
+    results = run_benchmark(n=200, table_size=31, seed=1, avalanche_keys=10,
+                            flooding_keys=200)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.json')
+        save_results(results, path)
+        with open(path, encoding='utf-8') as file:
+            loaded = json.load(file)
+
+    assert loaded == results
+    assert loaded['meta']['n'] == 200
+    assert set(loaded['results']['djb2']) == set(CORPORA)
+    print("  ✓ JSON совпадает с исходным словарем")
+
+
+if __name__ == "__main__":
+    test_corpus_is_deterministic()
+    print()
+    test_bucket_statistics_by_hand()
+    print()
+    test_max_probe_matches_real_table()
+    print()
+    test_results_json_round_trip()
+    print("\nВсе тесты бенчмарка пройдены!")
@@ -1,11 +1,13 @@
 """Тестирование хеш-функций."""
 import sys
 import os
+import tracemalloc
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from hash_functions import (  # type: ignore # noqa: E402
-    simple_hash, polynomial_hash, djb2_hash
+    simple_hash, polynomial_hash, djb2_hash, BATCH_HASH_FUNCTIONS, hash_many,
+    siphash24, SipHash, SeededPolynomialHash, keyed_hash
     )
 
 
@@ -85,10 +87,104 @@ def test_hash_distribution():
             f"максимум {max_cells} в ячейке")
 
 
+def test_batch_hash_functions():
+    """Пакетные версии совпадают со скалярными функциями."""
+    print("Тестирование пакетного хеширования...")
+
+    keys = ["", "a", "ab", "ba", "tail\x00", "привет", "ключ_🙂",
+            "x" * 300] + [f"key_{i}" for i in range(200)]
+
+    for table_size in [1, 10, 1009, 2 ** 31, 2 ** 62]:
+        for hash_func, batch_func in BATCH_HASH_FUNCTIONS.items():
+            expected = [hash_func(key, table_size) for key in keys]
+            assert batch_func(keys, table_size).tolist() == expected
+            assert hash_many(hash_func, iter(keys), table_size) == expected
+            assert batch_func([], table_size).tolist() == []
+    print("  ✓ Результаты совпадают со скалярными версиями")
+
+
+def test_batch_hash_long_key_memory():
+    """Один очень длинный ключ не раздувает матрицу всего пакета."""
+    print("Тестирование пакетного хеширования с длинным ключом...")
+
+    keys = [f"k{i}" for i in range(70000)]
+    keys[12345] = "x" * 2000
+    keys[500] = "y" * 1024
+
+    for hash_func, batch_func in BATCH_HASH_FUNCTIONS.items():
+        tracemalloc.start()
+        result = batch_func(keys, 1009).tolist()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Прежняя версия выделяла 65536 x 2000 x 8 байт, около 1 ГБ
+        assert peak < 64 * 1024 * 1024
+        for index in [0, 500, 12345, 69999]:
+            assert result[index] == hash_func(keys[index], 1009)
+    print("  ✓ Память определяется суммарной длиной ключей")
+
+
+def test_siphash_reference_vectors():
+    """SipHash-2-4 совпадает с эталонными векторами из статьи."""
+    key = bytes(range(16))
+    k0 = int.from_bytes(key[:8], 'little')
+    k1 = int.from_bytes(key[8:], 'little')
+
+    assert siphash24(b"", k0, k1) == 0x726fdb47dd0e0e31
+    assert siphash24(bytes(range(8)), k0, k1) == 0x93f5f5799a932462
+    assert siphash24(bytes(range(15)), k0, k1) == 0xa129ca6149be45e5
+    print("  ✓ Эталонные векторы SipHash-2-4")
+
+
+def test_keyed_hash_functions():
+    """Хеш-функции с ключом детерминированы при одном ключе."""
+    print("Тестирование хеш-функций с ключом...")
+
+    for method in ["siphash", "seeded_polynomial"]:
+        hash_func = keyed_hash(method, seed=7)
+        same_seed = keyed_hash(method, seed=7)
+        other_seed = keyed_hash(method, seed=8)
+        keys = [f"key{i}" for i in range(50)]
+
+        for key in keys:
+            h = hash_func(key, 101)
+            assert 0 <= h < 101
+            assert h == same_seed(key, 101)
+        assert ([hash_func(k, 2 ** 32) for k in keys]
+                != [other_seed(k, 2 ** 32) for k in keys])
+        print(f"  ✓ {method}")
+
+    assert isinstance(keyed_hash(), SipHash)
+    assert (SeededPolynomialHash().base != SeededPolynomialHash().base
+            or SeededPolynomialHash().offset != SeededPolynomialHash().offset)
+
+
+def test_keyed_hash_resists_crafted_collisions():
+    """Ключи, подобранные под djb2, не попадают в одну корзину SipHash."""
+    blocks = ("az", "bY")
+    keys = ["".join(blocks[i >> bit & 1] for bit in range(8))
+            for i in range(256)]
+    table_size = 64
+
+    assert len({djb2_hash(key, table_size) for key in keys}) == 1
+    siphash_buckets = {SipHash(seed=1)(key, table_size) for key in keys}
+    polynomial_buckets = {SeededPolynomialHash(seed=1)(key, table_size)
+                          for key in keys}
+    assert len(siphash_buckets) > table_size // 2
+    assert len(polynomial_buckets) > table_size // 2
+    print("  ✓ Подобранные коллизии не переносятся на функции с ключом")
+
+
 if __name__ == "__main__":
     test_hash_functions_basic()
     print()
     test_hash_collisions()
     print()
     test_hash_distribution()
+    print()
+    test_batch_hash_functions()
+    test_batch_hash_long_key_memory()
+    print()
+    test_siphash_reference_vectors()
+    test_keyed_hash_functions()
+    test_keyed_hash_resists_crafted_collisions()
     print("\nВсе тесты хеш-функций пройдены!")
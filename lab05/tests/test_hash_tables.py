@@ -2,16 +2,25 @@
 """Тестирование хеш-таблиц."""
 import sys
 import os
+import random
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 
 from hash_table_open_addressing import (  # type: ignore # noqa: E402
-    HashTableOpenAddressing
+    HashTableOpenAddressing, CompactHashTableOpenAddressing
     )
 from hash_table_chaining import (  # type: ignore # noqa: E402
-    HashTableChaining
+    HashTableChaining, SortedBucket
     )
+from concurrent_hash_table import (  # type: ignore # noqa: E402
+    ConcurrentHashTableChaining
+    )
+from mapped_hash_table import MappedHashTable  # type: ignore # noqa: E402
+from cache import Cache  # type: ignore # noqa: E402
+from hash_functions import djb2_hash  # type: ignore # noqa: E402
 
 
 def test_chaining():
@@ -63,11 +72,229 @@ def test_chaining_collisions():
     print("✓ Удаление из середины цепочки")
 
 
+def test_chaining_treeify():
+    """Длинные цепочки превращаются в упорядоченные корзины и обратно."""
+    print("Тестирование упорядоченных корзин...")
+
+    def collision_hash(key: str, table_size: int) -> int:
+        return 0
+
+    table = HashTableChaining(size=5, hash_func=collision_hash,
+                              treeify_threshold=8, untreeify_threshold=6)
+    for i in range(8):
+        table.insert(f"key_{i}", i)
+    for i in range(8):
+        assert table.search(f"key_{i}") == i
+    assert not table.is_rehashing()
+    assert type(table.table[0]) is list
+    assert len(table.table[0]) == 8
+
+    for i in range(8, 200):
+        table.insert(f"key_{i}", i)
+    assert isinstance(table.table[0], SortedBucket)
+    assert len(table.table[0]) == 200
+    print("✓ Цепочка стала упорядоченной корзиной")
+
+    table.insert("key_5", -5)
+    for i in range(200):
+        assert table.search(f"key_{i}") == (-5 if i == 5 else i)
+    assert table.search("missing") is None
+    assert len(table) == 200
+
+    for i in range(195):
+        table.delete(f"key_{i}")
+    assert type(table.table[0]) is list
+    assert sorted(k for k, v in table.table[0]) == [
+        f"key_{i}" for i in range(195, 200)]
+    print("✓ Короткая корзина снова стала списком")
+
+
+def test_chaining_resize():
+    """Тестирование инкрементального масштабирования метода цепочек."""
+    print("Тестирование масштабирования...")
+
+    table = HashTableChaining(size=4, rehash_step=1)
+    n = 500
+
+    for i in range(n):
+        table.insert(f"key_{i}", i)
+        assert table.load_factor() <= table.max_load_factor
+    assert table.size > 4
+    assert len(table) == n
+    print(f"✓ Таблица выросла до {table.size} корзин")
+
+    for i in range(n):
+        assert table.search(f"key_{i}") == i
+    print("✓ Все элементы найдены после роста")
+
+    for i in range(n - 10):
+        table.delete(f"key_{i}")
+    while table.is_rehashing():
+        table.search("missing")
+    assert len(table) == 10
+    assert table.size < 1024
+    for i in range(n - 10, n):
+        assert table.search(f"key_{i}") == i
+    assert table.search("key_0") is None
+    print(f"✓ Таблица уменьшилась до {table.size} корзин")
+
+
+def test_chaining_resize_work_per_operation():
+    """Ни одна операция не доводит перехеширование до конца целиком."""
+    print("Тестирование работы на одну операцию...")
+
+    calls = [0]
+
+    def counting_hash(key: str, table_size: int) -> int:
+        calls[0] += 1
+        return djb2_hash(key, table_size)
+
+    table = HashTableChaining(size=4, hash_func=counting_hash,
+                              rehash_step=1)
+    n = 20000
+    worst = 0
+    sizes = set()
+
+    def measure(operation, key):
+        nonlocal worst
+        calls[0] = 0
+        operation(key)
+        worst = max(worst, calls[0])
+        sizes.add(table.size)
+
+    for i in range(n):
+        measure(lambda key: table.insert(key, 0), f"key_{i}")
+        if i % 1000 == 0 and table.is_rehashing():
+            # Корзины новой таблицы создаются только при вставке в них
+            assert table.table.count(None) >= table.size - table.count
+    for i in range(n):
+        measure(table.delete, f"key_{i}")
+
+    assert len(table) == 0
+    assert max(sizes) >= 16384 and min(sizes) == 4
+    # Без ограничения шага переход через порог переносил бы тысячи ключей
+    assert worst <= 64
+    print(f"✓ Не более {worst} вызовов хеш-функции на операцию")
+
+
+def test_chaining_rejects_oscillating_thresholds():
+    """Пороги, при которых таблица колебалась бы между размерами."""
+    for min_load, max_load in [(0.5, 0.75), (0.375, 0.75), (0.8, 0.75)]:
+        try:
+            HashTableChaining(size=8, min_load_factor=min_load,
+                              max_load_factor=max_load)
+        except ValueError:
+            pass
+        else:
+            assert False, "Ожидалась ошибка для порогов " \
+                f"{min_load} и {max_load}"
+
+    table = HashTableChaining(size=8, min_load_factor=0.35,
+                              max_load_factor=0.75)
+    sizes = []
+    for i in range(2000):
+        table.insert(f"key_{i}", i)
+        if not sizes or sizes[-1] != table.size:
+            sizes.append(table.size)
+    assert sizes == sorted(sizes)
+    print(f"✓ Пороги проверяются, размеров таблицы: {len(sizes)}")
+
+
+def test_chaining_update_during_rehash():
+    """Обновление и удаление ключей, еще не перенесенных в новую таблицу."""
+    table = HashTableChaining(size=8, rehash_step=1)
+    for i in range(7):
+        table.insert(f"key_{i}", i)
+    assert table.is_rehashing()
+
+    for i in range(7):
+        table.insert(f"key_{i}", i * 10)
+    assert len(table) == 7
+    for i in range(7):
+        assert table.search(f"key_{i}") == i * 10
+
+    table.delete("key_3")
+    assert table.search("key_3") is None
+    assert len(table) == 6
+    print("✓ Обновление во время перехеширования")
+
+
+def test_concurrent_chaining():
+    """Тестирование таблицы с полосовыми блокировками."""
+    print("Тестирование многопоточной таблицы...")
+
+    table = ConcurrentHashTableChaining(size=8, stripes=4)
+    stable = [f"stable_{i}" for i in range(200)]
+    for key in stable:
+        table.insert(key, key)
+
+    missed = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            for key in stable:
+                if table.search(key) != key:
+                    missed.append(key)
+
+    def writer(thread_id):
+        for i in range(500):
+            table.insert(f"w{thread_id}_{i}", i)
+        for i in range(0, 500, 2):
+            table.delete(f"w{thread_id}_{i}")
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(t,)) for t in range(8)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert not missed
+    assert len(table) == 200 + 8 * 250
+    assert table.size > 8
+    for t in range(8):
+        assert table.search(f"w{t}_0") is None
+        assert table.search(f"w{t}_1") == 1
+    print("✓ Конкурентные вставки, удаления и масштабирование")
+
+    for key in stable:
+        table.delete(key)
+    for t in range(8):
+        for i in range(1, 500, 2):
+            table.delete(f"w{t}_{i}")
+    assert len(table) == 0
+    assert table.size == 8
+    print("✓ Уменьшение таблицы после удаления всех элементов")
+
+    # Решение о масштабировании, принятое по устаревшему счетчику,
+    # отменяется: таблица успела снова заполниться
+    table = ConcurrentHashTableChaining(size=8, stripes=4)
+    for i in range(40):
+        table.insert(f"key_{i}", i)
+    size = table.size
+    table._resize(table._state, size // 2)
+    table._resize(table._state, size * 2)
+    assert table.size == size
+    assert all(table.search(f"key_{i}") == i for i in range(40))
+    print("✓ Пороги проверяются повторно под блокировками")
+
+    try:
+        ConcurrentHashTableChaining(min_load_factor=0.4, max_load_factor=0.75)
+    except ValueError:
+        pass
+    else:
+        assert False, "Ожидалась ошибка для колеблющихся порогов"
+
+
 def test_open_addressing():
     """Тестирование открытой адресации."""
     print("Тестирование открытой адресации...")
 
-    for probe_method in ["linear", "double"]:
+    for probe_method in ["linear", "double", "quadratic", "robin_hood"]:
         print(f"Метод пробирования: {probe_method}")
         table = HashTableOpenAddressing(size=5, probe_method=probe_method)
 
@@ -89,6 +316,387 @@ def test_open_addressing():
         print("  ✓ Поиск несуществующего элемента\n")
 
 
+def test_robin_hood_backward_shift():
+    """Удаление со сдвигом назад в Robin Hood хешировании."""
+    print("Тестирование Robin Hood...")
+
+    def collision_hash(key: str, table_size: int) -> int:
+        return 0 if key.startswith("a") else 1
+
+    table = HashTableOpenAddressing(size=8, probe_method="robin_hood",
+                                    hash_func=collision_hash)
+    for key in ["a1", "b1", "a2", "b2", "a3"]:
+        table.insert(key, key.upper())
+
+    assert max(table.distances) == 3
+    for key in ["a1", "b1", "a2", "b2", "a3"]:
+        assert table.search(key) == key.upper()
+    print("  ✓ Вставка с вытеснением")
+
+    table.delete("a1")
+    assert "DELETED" not in map(repr, table.table)
+    for key in ["b1", "a2", "b2", "a3"]:
+        assert table.search(key) == key.upper()
+    assert table.search("a1") is None
+    assert table.count == 4
+    print("  ✓ Удаление без маркеров")
+
+    for key in ["b1", "a2", "b2", "a3"]:
+        table.delete(key)
+    assert table.table == [None] * 8
+    assert table.distances == [0] * 8
+
+
+def test_quadratic_probing_rounds_size():
+    """Квадратичное пробирование обходит все ячейки при любом размере."""
+    table = HashTableOpenAddressing(size=10, probe_method="quadratic",
+                                    hash_func=lambda key, size: 0)
+    assert table.size == 16
+    keys = [f"key_{i}" for i in range(14)]
+    for i, key in enumerate(keys):
+        table.insert(key, i)
+    for i, key in enumerate(keys):
+        assert table.search(key) == i
+    print("✓ Квадратичное пробирование при размере не степени двойки")
+
+
+def test_custom_probe_strategy():
+    """Пользовательская стратегия пробирования."""
+    def reverse_probing(key, size, hash_func):
+        index = hash_func(key, size)
+        for _ in range(size):
+            yield index
+            index = (index - 1) % size
+
+    table = HashTableOpenAddressing(size=7, probe_method=reverse_probing)
+    for i in range(6):
+        table.insert(f"key_{i}", i)
+    for i in range(6):
+        assert table.search(f"key_{i}") == i
+
+    try:
+        HashTableOpenAddressing(size=7, probe_method="cubic")
+    except ValueError:
+        pass
+    else:
+        assert False, "Ожидалась ошибка для неизвестного метода"
+    print("✓ Пользовательская стратегия пробирования")
+
+
+def test_open_addressing_deleted_key_name():
+    """Ключ "__DELETED__" не путается с маркером удаления."""
+    table = HashTableOpenAddressing(size=10)
+    table.insert("__DELETED__", 1)
+    table.insert("apple", 2)
+    assert table.search("__DELETED__") == 1
+
+    table.delete("apple")
+    table.insert("__DELETED__", 3)
+    assert table.search("__DELETED__") == 3
+    assert table.count == 1
+    print("✓ Маркер удаления не конфликтует с ключами")
+
+
+def test_compact_open_addressing():
+    """Тестирование компактной открытой адресации."""
+    print("Тестирование компактной открытой адресации...")
+
+    for probe_method in ["linear", "double"]:
+        table = CompactHashTableOpenAddressing(size=4,
+                                               probe_method=probe_method)
+        n = 300
+        for i in range(n):
+            table.insert(f"key_{i}", i)
+        assert len(table) == n
+        assert table.load_factor() <= table.max_load_factor
+        for i in range(n):
+            assert table.search(f"key_{i}") == i
+        print(f"  ✓ {probe_method}: автоматический рост до {table.size}")
+
+        table.insert("key_0", -1)
+        assert table.search("key_0") == -1
+        assert len(table) == n
+
+        table.delete("key_1")
+        assert table.search("key_1") is None
+        assert table.search("key_2") == 2
+        assert table.search("missing") is None
+
+
+def test_compact_tombstone_compaction():
+    """Удаленные ячейки вычищаются при циклах вставки/удаления."""
+    table = CompactHashTableOpenAddressing(size=64)
+    keys = [f"key_{i}" for i in range(30)]
+    for key in keys:
+        table.insert(key, key)
+
+    for cycle in range(50):
+        new_keys = [f"key_{cycle}_{i}" for i in range(30)]
+        for old_key, new_key in zip(keys, new_keys):
+            table.delete(old_key)
+            table.insert(new_key, new_key)
+            assert table.tombstones <= table.size * table.tombstone_threshold
+        keys = new_keys
+
+    assert table.size == 64
+    assert len(table) == 30
+    for key in keys:
+        assert table.search(key) == key
+    print("✓ Уплотнение удаленных ячеек")
+
+
+def test_batch_operations():
+    """Тестирование пакетных операций во всех таблицах."""
+    print("Тестирование пакетных операций...")
+
+    items = [(f"key_{i}", i) for i in range(1000)]
+    keys = [key for key, _ in items]
+    tables = [
+        HashTableChaining(size=4),
+        HashTableOpenAddressing(size=5, probe_method="linear"),
+        HashTableOpenAddressing(size=8, probe_method="quadratic"),
+        HashTableOpenAddressing(size=5, probe_method="robin_hood"),
+        CompactHashTableOpenAddressing(size=4),
+    ]
+
+    for table in tables:
+        table.insert("key_0", -1)
+        table.insert_many(items)
+        assert table.count == len(items)
+        assert table.search_many(keys) == list(range(1000))
+        assert table.search("key_0") == 0
+
+        table.delete_many(keys[:900] + ["missing"])
+        assert table.count == 100
+        expected = [None] * 900 + list(range(900, 1000)) + [None]
+        assert table.search_many(keys + ["missing"]) == expected
+        print(f"  ✓ {type(table).__name__}")
+
+
+def test_open_addressing_growth_sizes():
+    """Пакетный рост сохраняет допустимый для пробирования размер."""
+    print("Тестирование размеров при росте открытой адресации...")
+
+    def is_prime(n):
+        return n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+    items = [(f"key_{i}", i) for i in range(300)]
+    for probe_method, valid in [
+            ("double", is_prime),
+            ("quadratic", lambda n: n & (n - 1) == 0)]:
+        table = HashTableOpenAddressing(size=10, probe_method=probe_method)
+        assert valid(table.size)
+        table.insert_many(items)
+        assert valid(table.size)
+        assert table.search_many(key for key, _ in items) == list(range(300))
+
+        # Пробы обходят все ячейки после роста
+        for key in ["a", "b", "key_7"]:
+            assert sorted(table._probes(key)) == list(range(table.size))
+        print(f"  ✓ {probe_method}: размер {table.size}")
+
+
+def test_open_addressing_single_insert_growth():
+    """Одиночная и пакетная вставки следуют одному порогу заполнения."""
+    print("Тестирование роста при одиночной вставке...")
+
+    for probe_method in ["linear", "double", "quadratic", "robin_hood"]:
+        single = HashTableOpenAddressing(size=8, probe_method=probe_method)
+        batch = HashTableOpenAddressing(size=8, probe_method=probe_method)
+        items = [(f"key_{i}", i) for i in range(500)]
+        for key, value in items:
+            single.insert(key, value)
+            assert single.count <= single.size * single.max_load_factor
+        batch.insert_many(items)
+        assert batch.count <= batch.size * batch.max_load_factor
+
+        # Таблица, заполненная пакетом, принимает и одиночные вставки
+        for i in range(500, 1000):
+            batch.insert(f"key_{i}", i)
+        assert all(single.search(f"key_{i}") == i for i in range(500))
+        assert all(batch.search(f"key_{i}") == i for i in range(1000))
+        print(f"  ✓ {probe_method}: размеры {single.size} и {batch.size}")
+
+    try:
+        HashTableOpenAddressing(max_load_factor=1.0)
+    except ValueError:
+        pass
+    else:
+        assert False, "Ожидалась ошибка для max_load_factor=1"
+
+
+def test_memory_report():
+    """Отчет о памяти для всех таблиц."""
+    print("Тестирование отчета о памяти...")
+
+    def collision_hash(key: str, table_size: int) -> int:
+        return 0
+
+    tables = [
+        HashTableChaining(size=16),
+        HashTableChaining(size=16, hash_func=collision_hash),
+        HashTableOpenAddressing(size=64),
+        HashTableOpenAddressing(size=64, probe_method="robin_hood"),
+        CompactHashTableOpenAddressing(size=64),
+    ]
+    for table in tables:
+        empty = table.memory_report()
+        assert empty['count'] == 0
+        assert empty['bytes_per_entry'] == 0
+
+        for i in range(20):
+            table.insert(f"key_{i}", i)
+        report = table.memory_report()
+        parts = [value for name, value in report.items()
+                 if name.endswith('_bytes') and name != 'total_bytes']
+        assert report['count'] == 20
+        assert report['total_bytes'] == sum(parts)
+        assert report['key_bytes'] > 0
+        assert report['total_bytes'] > empty['total_bytes']
+        assert report['bytes_per_entry'] == report['total_bytes'] / 20
+        print(f"  ✓ {type(table).__name__}: "
+              f"{report['bytes_per_entry']:.0f} байт/элемент")
+
+
+def test_mapped_hash_table():
+    """Тестирование таблицы, хранящейся на диске."""
+    print("Тестирование таблицы в файлах...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'table')
+
+        with MappedHashTable(path) as table:
+            for i in range(100):
+                table.insert(f"key_{i}", {"n": i})
+            table.insert("key_5", "updated")
+            table.delete("key_7")
+            table.delete("missing")
+            assert table.size > 8
+            assert len(table) == 99
+        print("✓ Вставка, обновление, удаление и рост таблицы")
+
+        first = MappedHashTable(path, readonly=True)
+        second = MappedHashTable(path, readonly=True)
+        assert len(first) == 99
+        assert first.search("key_5") == "updated"
+        assert first.search("key_7") is None
+        assert second.search("key_42") == {"n": 42}
+        try:
+            first.insert("key_1", 1)
+            assert False, "Ожидалось PermissionError"
+        except PermissionError:
+            pass
+        first.close()
+        second.close()
+        print("✓ Повторное открытие только для чтения")
+
+        reader = MappedHashTable(path, readonly=True)
+        with MappedHashTable(path) as table:
+            size = table.size
+            table.insert("key_100", 100)
+            table.delete("key_0")
+            table.insert("key_101", 101)
+            assert table.size == size
+            assert table.search("key_100") == 100
+            assert len(table) == 100
+            table.flush()
+            # Читатель видит новые записи и актуальный счетчик
+            assert reader.search("key_101") == 101
+            assert len(reader) == 100
+            assert reader.load_factor() == 100 / size
+        reader.close()
+        print("✓ Дозапись в существующую таблицу")
+
+
+def test_cache_policies():
+    """Тестирование кеша с вытеснением."""
+    print("Тестирование кеша...")
+
+    lru = Cache(2, 'lru')
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert len(lru) == 2
+    print("✓ LRU вытесняет давно не использованную запись")
+
+    lfu = Cache(2, 'lfu')
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.put("c", 3)
+    assert lfu.get("b") is None
+    assert lfu.get("a") == 1
+    lfu.delete("c")
+    lfu.put("d", 4)
+    lfu.put("e", 5)
+    assert lfu.get("d") is None and lfu.get("e") == 5
+    print("✓ LFU вытесняет редко используемую запись")
+
+    now = [0.0]
+    ttl = Cache(3, 'ttl', ttl=10, clock=lambda: now[0])
+    ttl.put("a", 1)
+    now[0] = 5
+    ttl.put("b", 2)
+    now[0] = 12
+    assert ttl.get("a") is None
+    assert ttl.get("b") == 2
+    assert len(ttl) == 1
+    print("✓ TTL удаляет истекшие записи")
+
+    stats = lru.stats()
+    assert stats['hits'] == 3 and stats['misses'] == 1
+    assert stats['evictions'] == 1
+    assert ttl.stats()['expirations'] == 1
+    print("✓ Счетчики попаданий, промахов и вытеснений")
+
+
+def test_lfu_cache_against_reference():
+    """LFU совпадает с переборной моделью при удалениях и истечениях."""
+    rng = random.Random(5)
+    now = [0.0]
+    cache = Cache(8, 'lfu', ttl=50, clock=lambda: now[0])
+    # ключ -> [значение, частота, момент последнего обращения, истечение];
+    # истекшие записи, как и в кеше, занимают место до обращения к ним
+    model = {}
+
+    for step in range(5000):
+        now[0] = step
+        key = f"k{rng.randrange(20)}"
+        action = rng.random()
+        if action < 0.5:
+            entry = model.get(key)
+            if entry is not None and entry[3] <= step:
+                del model[key]
+                entry = None
+            expected = None if entry is None else entry[0]
+            assert cache.get(key) == expected
+            if entry is not None:
+                entry[1] += 1
+                entry[2] = step
+        elif action < 0.9:
+            if key in model:
+                model[key][0] = step
+                model[key][1] += 1
+                model[key][2] = step
+                model[key][3] = step + 50
+            else:
+                if len(model) >= 8:
+                    victim = min(model, key=lambda k: model[k][1:3])
+                    del model[victim]
+                model[key] = [step, 1, step, step + 50]
+            cache.put(key, step)
+        else:
+            model.pop(key, None)
+            cache.delete(key)
+        assert len(cache) == len(model)
+    print("✓ LFU совпадает с эталонной моделью")
+
+
 def test_both_methods_comparison():
     """Сравниваем работу обоих методов на одинаковых данных."""
     print("Сравнение методов...")
@@ -120,6 +728,26 @@ if __name__ == "__main__":
     print()
     test_chaining_collisions()
     print()
+    test_chaining_treeify()
+    test_chaining_resize()
+    test_chaining_resize_work_per_operation()
+    test_chaining_rejects_oscillating_thresholds()
+    test_chaining_update_during_rehash()
+    test_concurrent_chaining()
+    print()
     test_open_addressing()
+    test_robin_hood_backward_shift()
+    test_quadratic_probing_rounds_size()
+    test_custom_probe_strategy()
+    test_open_addressing_deleted_key_name()
+    test_compact_open_addressing()
+    test_compact_tombstone_compaction()
+    test_batch_operations()
+    test_open_addressing_growth_sizes()
+    test_open_addressing_single_insert_growth()
+    test_memory_report()
+    test_mapped_hash_table()
+    test_cache_policies()
+    test_lfu_cache_against_reference()
     test_both_methods_comparison()
     print("\nВсе тесты пройдены!")
@@ -2,6 +2,7 @@
 import time
 import random
 import matplotlib.pyplot as plt
+from avl_tree import AVLTree
 from binary_search_tree import BinarySearchTree
 
 
@@ -62,6 +63,52 @@ def analyze_trees():
     return results
 
 
+def measure_insert_time(tree: BinarySearchTree, values: list) -> float:
+    """Измерение времени вставки всех значений в дерево."""
+    start_time = time.perf_counter()
+    for value in values:
+        tree.insert(value)
+    return time.perf_counter() - start_time
+
+
+def analyze_balancing():
+    """
+    Сравнение BST и АВЛ-дерева на отсортированной и случайной вставке.
+    """
+    sizes = [100, 500, 1000, 2000, 5000]
+
+    print("\nСравнение BST и АВЛ-дерева")
+    print("=" * 80)
+    print("Вход       | Размер | Высота BST | Высота АВЛ | Вставка BST "
+          "| Вставка АВЛ | Поиск BST | Поиск АВЛ")
+    print("-" * 105)
+
+    results = []
+
+    for order in ('sorted', 'random'):
+        for size in sizes:
+            values = list(range(size))
+            if order == 'random':
+                random.shuffle(values)
+            test_values = random.sample(values, min(100, size))
+
+            row = {'order': order, 'size': size}
+            for name, tree in (('bst', BinarySearchTree()),
+                               ('avl', AVLTree())):
+                row[f'{name}_insert'] = measure_insert_time(tree, values)
+                row[f'{name}_search'] = measure_search_time(
+                    tree, test_values, num_searches=100)
+                row[f'{name}_height'] = tree.height(tree.root)
+            results.append(row)
+
+            print(f"{order:10} | {size:6} | {row['bst_height']:10} | "
+                  f"{row['avl_height']:10} | {row['bst_insert']:11.4f} | "
+                  f"{row['avl_insert']:11.4f} | {row['bst_search']:9.4f} | "
+                  f"{row['avl_search']:9.4f}")
+
+    return results
+
+
 def print_analysis(results):
     """Анализ результатов."""
     print("\n=== Анализ результатов ===")
@@ -117,3 +164,4 @@ if __name__ == "__main__":
     results = analyze_trees()
     print_analysis(results)
     plot_results(results)
+    analyze_balancing()
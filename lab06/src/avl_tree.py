@@ -0,0 +1,145 @@
+"""Реализация АВЛ-дерева (самобалансирующегося дерева поиска)."""
+from typing import Any, Optional
+
+from binary_search_tree import BinarySearchTree, TreeNode
+
+
+class AVLNode(TreeNode):
+    """Узел АВЛ-дерева с хранимой высотой поддерева."""
+
+    __slots__ = ('height',)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Инициализация узла с аргументами TreeNode."""
+        super().__init__(*args, **kwargs)
+        self.height = 1
+
+
+class AVLTree(BinarySearchTree):
+    """
+    АВЛ-дерево.
+
+    Высоты поддеревьев любого узла отличаются не больше чем на 1, поэтому
+    высота дерева не превышает 1.44 log2(n + 2) при любом порядке вставки,
+    в том числе отсортированном. Баланс восстанавливается поворотами
+    на обратном пути от измененного узла к корню.
+
+    Интерфейс совпадает с BinarySearchTree: search, find_min, find_max,
+    is_valid_bst, visualize_tree и обходы работают без изменений.
+    """
+
+    node_class = AVLNode
+
+    @staticmethod
+    def _node_height(node: Optional[AVLNode]) -> int:
+        """Хранимая высота поддерева (0 для пустого)."""
+        return node.height if node is not None else 0
+
+    def _update(self, node: AVLNode) -> None:
+        """Пересчет высоты и размера узла по потомкам."""
+        node.height = 1 + max(self._node_height(node.left),
+                              self._node_height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        """Левый поворот вокруг node. Сложность: O(1)."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        """Правый поворот вокруг node. Сложность: O(1)."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """
+        Восстановление баланса узла после изменения одного из поддеревьев.
+
+        Сложность: O(1).
+
+        Returns:
+            Новый корень поддерева.
+        """
+        self._update(node)
+        balance = self._node_height(node.left) - self._node_height(node.right)
+
+        if balance > 1:
+            left = node.left
+            if self._node_height(left.left) < self._node_height(left.right):
+                node.left = self._rotate_left(left)
+            return self._rotate_right(node)
+        if balance < -1:
+            right = node.right
+            if self._node_height(right.right) < self._node_height(right.left):
+                node.right = self._rotate_right(right)
+            return self._rotate_left(node)
+        return node
+
+    def insert(self, value: Any) -> None:
+        """
+        Вставка элемента в дерево.
+
+        Сложность: O(log n) в худшем случае.
+        """
+        self._insert(value, None, False)
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Сохранение значения value по ключу key.
+
+        Сложность: O(log n) в худшем случае.
+        """
+        self._insert(key, value, True)
+
+    def _insert(self, value: Any, data: Any, replace: bool) -> None:
+        self.root = self._insert_recursive(self.root, value, data, replace,
+                                           self._sort_key(value))
+
+    def _insert_recursive(self, node: Optional[AVLNode], value: Any,
+                          data: Any, replace: bool,
+                          sort_key: Any) -> AVLNode:
+        if node is None:
+            return self.node_class(value, data, sort_key)
+
+        if sort_key < node.sort_key:
+            node.left = self._insert_recursive(node.left, value, data,
+                                               replace, sort_key)
+        elif sort_key > node.sort_key:
+            node.right = self._insert_recursive(node.right, value, data,
+                                                replace, sort_key)
+        else:
+            if replace:
+                node.data = data
+            return node
+
+        return self._rebalance(node)
+
+    def delete(self, value: Any) -> None:
+        """
+        Удаление элемента из дерева.
+
+        Сложность: O(log n) в худшем случае.
+        """
+        self.root = self._delete_recursive(self.root, self._sort_key(value))
+
+    def _delete_recursive(self, node: Optional[TreeNode],
+                          sort_key: Any) -> Optional[TreeNode]:
+        # Удаление выполняет BinarySearchTree; ее рекурсивные вызовы
+        # попадают сюда, поэтому баланс восстанавливается на каждом
+        # уровне пути поиска
+        node = super()._delete_recursive(node, sort_key)
+        if node is None:
+            return None
+        return self._rebalance(node)
+
+    def height(self, node: Optional[TreeNode]) -> int:
+        """Высота дерева/поддерева. Сложность: O(1)."""
+        return self._node_height(node)
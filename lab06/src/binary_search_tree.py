@@ -1,25 +1,62 @@
 """Реализация бинарного дерева поиска."""
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+
+# Маркер "ключ сравнения не передан": None может быть ключом сравнения,
+# который вернула функция key
+_NO_SORT_KEY = object()
 
 
 class TreeNode:
-    """Узел бинарного дерева поиска."""
+    """
+    Узел бинарного дерева поиска с размером поддерева.
+
+    value - ключ узла, data - связанное с ключом значение (в режиме
+    отображения), sort_key - ключ сравнения (value или результат функции
+    key дерева).
+    """
+
+    __slots__ = ('value', 'data', 'sort_key', 'left', 'right', 'size')
 
-    def __init__(self, value: int) -> None:
+    def __init__(self, value: Any, data: Any = None,
+                 sort_key: Any = _NO_SORT_KEY) -> None:
         """Инициализация узла."""
         self.value = value
+        self.data = data
+        self.sort_key = value if sort_key is _NO_SORT_KEY else sort_key
         self.left: Optional[TreeNode] = None
         self.right: Optional[TreeNode] = None
+        self.size = 1
 
 
 class BinarySearchTree:
-    """Бинарное дерево поиска."""
+    """
+    Бинарное дерево поиска.
+
+    Может использоваться как множество (insert, search, delete) и как
+    упорядоченное отображение (put, get, floor_item, ceiling_item,
+    predecessor_item, successor_item, items_range). Ключи - любые
+    сравнимые объекты; функция key задает ключ сравнения, как в sorted.
+    Ключ сравнения вычисляется один раз при вставке и хранится в узле.
+    """
+
+    node_class = TreeNode
+
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Инициализация дерева.
 
-    def __init__(self) -> None:
-        """Инициализация дерева."""
+        Args:
+            key: Функция, вычисляющая ключ сравнения.
+        """
         self.root: Optional[TreeNode] = None
+        self.key = key
+
+    def _sort_key(self, value: Any) -> Any:
+        """Ключ сравнения для value."""
+        return value if self.key is None else self.key(value)
 
-    def insert(self, value: int) -> None:
+    def insert(self, value: Any) -> None:
         """
         Вставка элемента в дерево.
 
@@ -27,30 +64,68 @@ class BinarySearchTree:
           - Средний случай: O(log n)
           - Худший случай: O(n) - вырожденное дерево
         """
-        new_node = TreeNode(value)
+        self._insert(value, None, False)
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Сохранение значения value по ключу key (замена, если ключ уже
+        есть).
+
+        Сложность:
+          - Средний случай: O(log n)
+          - Худший случай: O(n)
+        """
+        self._insert(key, value, True)
+
+    def _insert(self, value: Any, data: Any, replace: bool) -> None:
+        """Вставка ключа с данными; replace - заменить данные дубликата."""
+        sort_key = self._sort_key(value)
+        new_node = self.node_class(value, data, sort_key)
 
         if self.root is None:
             self.root = new_node
             return
 
+        # Размеры поддеревьев на пути увеличиваются только после того,
+        # как стало ясно, что значения в дереве еще нет
+        path = []
         current = self.root
         while current:
-            if value < current.value:
+            path.append(current)
+            if sort_key < current.sort_key:
                 if current.left is None:
                     current.left = new_node
-                    return
+                    break
                 else:
                     current = current.left
-            elif value > current.value:
+            elif sort_key > current.sort_key:
                 if current.right is None:
                     current.right = new_node
-                    return
+                    break
                 else:
                     current = current.right
             else:
+                if replace:
+                    current.data = data
                 return
 
-    def search(self, value: int) -> bool:
+        for node in path:
+            node.size += 1
+
+    def _find_node(self, value: Any) -> Optional[TreeNode]:
+        """Узел с ключом value или None."""
+        sort_key = self._sort_key(value)
+        current = self.root
+        while current:
+            if sort_key == current.sort_key:
+                return current
+            elif sort_key < current.sort_key:
+                current = current.left
+            else:
+                current = current.right
+        return None
+
+    def search(self, value: Any) -> bool:
         """
         Поиск элемента в дереве.
 
@@ -58,17 +133,24 @@ class BinarySearchTree:
           - Средний случай: O(log n)
           - Худший случай: O(n)
         """
-        current = self.root
-        while current:
-            if value == current.value:
-                return True
-            elif value < current.value:
-                current = current.left
-            else:
-                current = current.right
-        return False
+        return self._find_node(value) is not None
+
+    def __contains__(self, value: Any) -> bool:
+        """Проверка наличия ключа (то же, что search)."""
+        return self._find_node(value) is not None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Значение по ключу key или default, если ключа нет.
 
-    def delete(self, value: int) -> None:
+        Сложность:
+          - Средний случай: O(log n)
+          - Худший случай: O(n)
+        """
+        node = self._find_node(key)
+        return default if node is None else node.data
+
+    def delete(self, value: Any) -> None:
         """
         Удаление элемента из дерева.
 
@@ -76,17 +158,17 @@ class BinarySearchTree:
           - Средний случай: O(log n)
           - Худший случай: O(n)
         """
-        self.root = self._delete_recursive(self.root, value)
+        self.root = self._delete_recursive(self.root, self._sort_key(value))
 
     def _delete_recursive(self, node: Optional[TreeNode],
-                          value: int) -> Optional[TreeNode]:
+                          sort_key: Any) -> Optional[TreeNode]:
         if node is None:
             return node
 
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
+        if sort_key < node.sort_key:
+            node.left = self._delete_recursive(node.left, sort_key)
+        elif sort_key > node.sort_key:
+            node.right = self._delete_recursive(node.right, sort_key)
         else:
             if node.left is None:
                 return node.right
@@ -96,12 +178,203 @@ class BinarySearchTree:
             min_node = self.find_min(node.right)
             if min_node is not None:
                 node.value = min_node.value
-            node.right = self._delete_recursive(node.right,
-                                                min_node.value
-                                                if min_node else value)
+                node.data = min_node.data
+                node.sort_key = min_node.sort_key
+            node.right = self._delete_recursive(node.right, node.sort_key)
 
+        node.size = 1 + self._size(node.left) + self._size(node.right)
         return node
 
+    def _nearest(self, value: Any, below: bool,
+                 strict: bool) -> Optional[TreeNode]:
+        """
+        Узел с ближайшим к value ключом снизу (below) или сверху, включая
+        сам value, если strict ложно. None, если такого узла нет.
+        """
+        sort_key = self._sort_key(value)
+        best = None
+        current = self.root
+        while current is not None:
+            if sort_key == current.sort_key and not strict:
+                return current
+            if below:
+                if current.sort_key < sort_key:
+                    best = current
+                    current = current.right
+                else:
+                    current = current.left
+            elif current.sort_key > sort_key:
+                best = current
+                current = current.left
+            else:
+                current = current.right
+        return best
+
+    @staticmethod
+    def _key(node: Optional[TreeNode]) -> Any:
+        """Ключ узла или None."""
+        return None if node is None else node.value
+
+    @staticmethod
+    def _item(node: Optional[TreeNode]) -> Optional[Tuple[Any, Any]]:
+        """Пара (ключ, значение) узла или None."""
+        return None if node is None else (node.value, node.data)
+
+    def floor(self, key: Any) -> Any:
+        """Наибольший ключ, не больший key, или None. Сложность: O(h)."""
+        return self._key(self._nearest(key, below=True, strict=False))
+
+    def ceiling(self, key: Any) -> Any:
+        """Наименьший ключ, не меньший key, или None. Сложность: O(h)."""
+        return self._key(self._nearest(key, below=False, strict=False))
+
+    def predecessor(self, key: Any) -> Any:
+        """Наибольший ключ, меньший key, или None. Сложность: O(h)."""
+        return self._key(self._nearest(key, below=True, strict=True))
+
+    def successor(self, key: Any) -> Any:
+        """Наименьший ключ, больший key, или None. Сложность: O(h)."""
+        return self._key(self._nearest(key, below=False, strict=True))
+
+    def floor_item(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Пара (ключ, значение) для floor(key) или None. Сложность: O(h).
+        """
+        return self._item(self._nearest(key, below=True, strict=False))
+
+    def ceiling_item(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Пара (ключ, значение) для ceiling(key) или None. Сложность: O(h).
+        """
+        return self._item(self._nearest(key, below=False, strict=False))
+
+    def predecessor_item(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Пара (ключ, значение) для predecessor(key) или None.
+        Сложность: O(h).
+        """
+        return self._item(self._nearest(key, below=True, strict=True))
+
+    def successor_item(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Пара (ключ, значение) для successor(key) или None.
+        Сложность: O(h).
+        """
+        return self._item(self._nearest(key, below=False, strict=True))
+
+    @staticmethod
+    def _size(node: Optional[TreeNode]) -> int:
+        """Размер поддерева (0 для пустого)."""
+        return node.size if node is not None else 0
+
+    def __len__(self) -> int:
+        """Количество элементов в дереве. Сложность: O(1)."""
+        return self._size(self.root)
+
+    def select(self, k: int) -> Any:
+        """
+        k-й по возрастанию элемент (нумерация с 0).
+
+        Сложность: O(h), где h - высота дерева.
+
+        Raises:
+            IndexError: Если k вне диапазона [0, n).
+        """
+        if not 0 <= k < len(self):
+            raise IndexError("Индекс вне диапазона")
+        current = self.root
+        while current is not None:
+            left_size = self._size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k > left_size:
+                k -= left_size + 1
+                current = current.right
+            else:
+                return current.value
+        raise IndexError("Индекс вне диапазона")
+
+    def _count_before(self, value: Any, inclusive: bool) -> int:
+        """Количество элементов меньше value (или не больше value)."""
+        sort_key = self._sort_key(value)
+        count = 0
+        current = self.root
+        while current is not None:
+            if sort_key < current.sort_key or (
+                    sort_key == current.sort_key and not inclusive):
+                current = current.left
+            else:
+                count += self._size(current.left) + 1
+                current = current.right
+        return count
+
+    def rank(self, value: Any) -> int:
+        """
+        Количество элементов меньше value.
+
+        Для элемента дерева это его индекс в отсортированном порядке,
+        т.е. select(rank(x)) == x. Сложность: O(h).
+        """
+        return self._count_before(value, inclusive=False)
+
+    def count_range(self, low: Any, high: Any) -> int:
+        """
+        Количество элементов в отрезке [low, high]. Сложность: O(h).
+        """
+        if self._sort_key(high) < self._sort_key(low):
+            return 0
+        return (self._count_before(high, inclusive=True)
+                - self._count_before(low, inclusive=False))
+
+    def _iter_range_nodes(self, low: Any, high: Any) -> Iterator[TreeNode]:
+        """
+        Ленивый обход узлов отрезка [low, high] по возрастанию.
+
+        Посещаются только узлы на границах отрезка и внутри него.
+
+        Сложность: O(h + k), где k - количество выданных узлов.
+        """
+        low_key = self._sort_key(low)
+        high_key = self._sort_key(high)
+        stack = []
+        current = self.root
+        while True:
+            # Спуск к наименьшему узлу поддерева, не меньшему low;
+            # поддеревья левее low пропускаются целиком
+            while current is not None:
+                if current.sort_key < low_key:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.sort_key > high_key:
+                return
+            yield node
+            current = node.right
+
+    def iter_range(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Ленивый обход ключей отрезка [low, high] по возрастанию.
+
+        Сложность: O(h + k), где k - количество выданных элементов.
+        """
+        for node in self._iter_range_nodes(low, high):
+            yield node.value
+
+    def items_range(self, low: Any,
+                    high: Any) -> Iterator[Tuple[Any, Any]]:
+        """
+        Ленивый обход пар (ключ, значение) отрезка [low, high]
+        по возрастанию.
+
+        Сложность: O(h + k), где k - количество выданных элементов.
+        """
+        for node in self._iter_range_nodes(low, high):
+            yield node.value, node.data
+
     def find_min(self, node: Optional[TreeNode]) -> Optional[TreeNode]:
         """
         Поиск минимального элемента в поддереве.
@@ -133,25 +406,40 @@ class BinarySearchTree:
         return current
 
     def height(self, node: Optional[TreeNode]) -> int:
-        """Вычисление высоты дерева/поддерева."""
-        if node is None:
-            return 0
-        return 1 + max(self.height(node.left), self.height(node.right))
+        """
+        Вычисление высоты дерева/поддерева.
+
+        Обход итеративный: высота вырожденного дерева равна n и может
+        превысить предел глубины рекурсии.
+        """
+        result = 0
+        stack = [(node, 1)] if node is not None else []
+        while stack:
+            current, depth = stack.pop()
+            result = max(result, depth)
+            if current.left is not None:
+                stack.append((current.left, depth + 1))
+            if current.right is not None:
+                stack.append((current.right, depth + 1))
+        return result
 
     def is_valid_bst(self) -> bool:
         """Проверка, является ли дерево корректным BST."""
-        return self._is_valid_recursive(self.root, float('-inf'), float('inf'))
+        return self._is_valid_recursive(self.root, None, None)
 
     def _is_valid_recursive(self, node: Optional[TreeNode],
-                            min_val: float, max_val: float) -> bool:
+                            min_node: Optional[TreeNode],
+                            max_node: Optional[TreeNode]) -> bool:
         if node is None:
             return True
 
-        if node.value <= min_val or node.value >= max_val:
+        if min_node is not None and node.sort_key <= min_node.sort_key:
+            return False
+        if max_node is not None and node.sort_key >= max_node.sort_key:
             return False
 
-        left_valid = self._is_valid_recursive(node.left, min_val, node.value)
-        right_valid = self._is_valid_recursive(node.right, node.value, max_val)
+        left_valid = self._is_valid_recursive(node.left, min_node, node)
+        right_valid = self._is_valid_recursive(node.right, node, max_node)
 
         return left_valid and right_valid
 
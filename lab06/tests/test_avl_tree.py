@@ -0,0 +1,113 @@
+"""Тестирование АВЛ-дерева."""
+import math
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from avl_tree import AVLTree  # type: ignore # noqa: E402
+from tree_traversal import in_order_iterative  # type: ignore # noqa: E402
+
+
+class TestAVLTree(unittest.TestCase):
+    """Класс unit-тест."""
+
+    def setUp(self):
+        """Инициализация АВЛ-дерева."""
+        self.tree = AVLTree()
+
+    def assert_balanced(self, node):
+        """Проверка хранимых высот и баланса всех узлов поддерева."""
+        if node is None:
+            return 0
+        left = self.assert_balanced(node.left)
+        right = self.assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        self.assertEqual(node.size, 1 + self._size(node.left)
+                         + self._size(node.right))
+        return node.height
+
+    @staticmethod
+    def _size(node):
+        """Размер поддерева."""
+        return node.size if node is not None else 0
+
+    def test_insert_and_search(self):
+        """Тестирование вставки и поиска."""
+        for value in [5, 3, 7, 3]:
+            self.tree.insert(value)
+
+        self.assertTrue(self.tree.search(5))
+        self.assertTrue(self.tree.search(3))
+        self.assertTrue(self.tree.search(7))
+        self.assertFalse(self.tree.search(10))
+        self.assertEqual(in_order_iterative(self.tree.root), [3, 5, 7])
+
+    def test_sorted_insert_is_balanced(self):
+        """Отсортированная вставка не вырождает дерево."""
+        n = 1000
+        for value in range(n):
+            self.tree.insert(value)
+
+        self.assert_balanced(self.tree.root)
+        self.assertTrue(self.tree.is_valid_bst())
+        self.assertLessEqual(self.tree.height(self.tree.root),
+                             1.44 * math.log2(n + 2))
+        self.assertEqual(self.tree.find_min(self.tree.root).value, 0)
+        self.assertEqual(self.tree.find_max(self.tree.root).value, n - 1)
+        self.assertEqual(self.tree.select(500), 500)
+        self.assertEqual(self.tree.rank(250), 250)
+        self.assertEqual(self.tree.count_range(100, 199), 100)
+
+    def test_delete(self):
+        """Удаление сохраняет порядок и баланс."""
+        rng = random.Random(0)
+        values = list(range(500))
+        rng.shuffle(values)
+        for value in values:
+            self.tree.insert(value)
+
+        removed = set(values[:300])
+        for value in values[:300]:
+            self.tree.delete(value)
+        self.tree.delete(10000)
+
+        self.assert_balanced(self.tree.root)
+        self.assertEqual(in_order_iterative(self.tree.root),
+                         sorted(set(values) - removed))
+        for value in values[:300]:
+            self.assertFalse(self.tree.search(value))
+
+        for value in values[300:]:
+            self.tree.delete(value)
+        self.assertIsNone(self.tree.root)
+        self.assertEqual(self.tree.height(self.tree.root), 0)
+
+    def test_put_get(self):
+        """Режим отображения с отсортированными ключами."""
+        tree = AVLTree(key=lambda key: -key)
+        for key in range(200):
+            tree.put(key, key * key)
+        tree.put(10, -1)
+
+        self.assert_balanced(tree.root)
+        self.assertEqual(len(tree), 200)
+        self.assertEqual(tree.get(10), -1)
+        self.assertEqual(tree.get(199), 199 * 199)
+        self.assertEqual(tree.select(0), 199)
+        self.assertEqual(tree.floor(250), None)
+        self.assertEqual(tree.ceiling(250), 199)
+        self.assertEqual(tree.successor(50), 49)
+        self.assertEqual(tree.ceiling_item(250), (199, 199 * 199))
+        self.assertEqual(tree.successor_item(11), (10, -1))
+        self.assertEqual(list(tree.items_range(12, 10)),
+                         [(12, 144), (11, 121), (10, -1)])
+        tree.delete(100)
+        self.assert_balanced(tree.root)
+        self.assertIsNone(tree.get(100))
+        self.assertEqual(tree.get(101), 101 * 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
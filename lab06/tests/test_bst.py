@@ -3,7 +3,9 @@ import unittest
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from binary_search_tree import BinarySearchTree  # type: ignore # noqa: E402
+from binary_search_tree import (  # type: ignore # noqa: E402
+    BinarySearchTree, TreeNode
+)
 
 
 class TestBinarySearchTree(unittest.TestCase):
@@ -51,6 +53,134 @@ class TestBinarySearchTree(unittest.TestCase):
         self.assertEqual(self.bst.find_min(self.bst.root).value, 1)
         self.assertEqual(self.bst.find_max(self.bst.root).value, 9)
 
+    def assert_sizes(self, node):
+        """Проверка размеров поддеревьев."""
+        if node is None:
+            return 0
+        size = 1 + self.assert_sizes(node.left) + self.assert_sizes(
+            node.right)
+        self.assertEqual(node.size, size)
+        return size
+
+    def test_select_and_rank(self):
+        """Порядковые статистики после вставок и удалений."""
+        for value in [50, 30, 70, 20, 40, 60, 80, 30, 65]:
+            self.bst.insert(value)
+        self.bst.delete(70)
+        self.bst.delete(100)
+        self.assert_sizes(self.bst.root)
+
+        values = [20, 30, 40, 50, 60, 65, 80]
+        self.assertEqual(len(self.bst), len(values))
+        self.assertEqual([self.bst.select(k) for k in range(len(values))],
+                         values)
+        for k, value in enumerate(values):
+            self.assertEqual(self.bst.rank(value), k)
+        self.assertEqual(self.bst.rank(0), 0)
+        self.assertEqual(self.bst.rank(55), 4)
+        self.assertEqual(self.bst.rank(100), 7)
+        with self.assertRaises(IndexError):
+            self.bst.select(7)
+        with self.assertRaises(IndexError):
+            self.bst.select(-1)
+
+    def test_range_queries(self):
+        """Подсчет и ленивый обход элементов отрезка."""
+        values = [8, 3, 10, 1, 6, 14, 4, 7, 13]
+        for value in values:
+            self.bst.insert(value)
+
+        for low, high in [(4, 10), (0, 100), (5, 5), (6, 6), (11, 12),
+                          (10, 4)]:
+            expected = sorted(v for v in values if low <= v <= high)
+            self.assertEqual(list(self.bst.iter_range(low, high)), expected)
+            self.assertEqual(self.bst.count_range(low, high), len(expected))
+
+        iterator = self.bst.iter_range(3, 13)
+        self.assertEqual(next(iterator), 3)
+        self.assertEqual(next(iterator), 4)
+
+    def test_put_get(self):
+        """Режим упорядоченного отображения."""
+        self.bst.put("b", 2)
+        self.bst.put("a", 1)
+        self.bst.put("c", 3)
+        self.bst.put("b", 20)
+        self.bst.insert("d")
+
+        self.assertEqual(len(self.bst), 4)
+        self.assertEqual(self.bst.get("b"), 20)
+        self.assertEqual(self.bst.get("a"), 1)
+        self.assertIsNone(self.bst.get("d"))
+        self.assertIsNone(self.bst.get("z"))
+        self.assertEqual(self.bst.get("z", 0), 0)
+        self.assertIn("c", self.bst)
+        self.assertNotIn("z", self.bst)
+        self.assertTrue(self.bst.is_valid_bst())
+
+        # При удалении узла с двумя потомками данные переезжают вместе
+        # с ключом преемника
+        self.bst.delete("b")
+        self.assertEqual(self.bst.get("c"), 3)
+        self.assertEqual(list(self.bst.iter_range("a", "z")),
+                         ["a", "c", "d"])
+
+    def test_floor_ceiling(self):
+        """Ближайшие ключи снизу и сверху."""
+        for value in [20, 10, 30, 5, 15, 25, 35]:
+            self.bst.insert(value)
+
+        self.assertEqual(self.bst.floor(15), 15)
+        self.assertEqual(self.bst.floor(17), 15)
+        self.assertIsNone(self.bst.floor(4))
+        self.assertEqual(self.bst.ceiling(15), 15)
+        self.assertEqual(self.bst.ceiling(16), 20)
+        self.assertIsNone(self.bst.ceiling(36))
+        self.assertEqual(self.bst.predecessor(15), 10)
+        self.assertEqual(self.bst.predecessor(21), 20)
+        self.assertIsNone(self.bst.predecessor(5))
+        self.assertEqual(self.bst.successor(15), 20)
+        self.assertEqual(self.bst.successor(34), 35)
+        self.assertIsNone(self.bst.successor(35))
+
+    def test_item_queries(self):
+        """Запросы режима отображения возвращают пары (ключ, значение)."""
+        for key in [20, 10, 30, 5, 15, 25, 35]:
+            self.bst.put(key, str(key))
+
+        self.assertEqual(self.bst.floor_item(17), (15, "15"))
+        self.assertEqual(self.bst.floor_item(15), (15, "15"))
+        self.assertIsNone(self.bst.floor_item(4))
+        self.assertEqual(self.bst.ceiling_item(16), (20, "20"))
+        self.assertIsNone(self.bst.ceiling_item(36))
+        self.assertEqual(self.bst.predecessor_item(15), (10, "10"))
+        self.assertIsNone(self.bst.predecessor_item(5))
+        self.assertEqual(self.bst.successor_item(15), (20, "20"))
+        self.assertIsNone(self.bst.successor_item(35))
+        self.assertEqual(list(self.bst.items_range(12, 26)),
+                         [(15, "15"), (20, "20"), (25, "25")])
+        self.assertEqual(list(self.bst.items_range(26, 12)), [])
+
+    def test_none_sort_key(self):
+        """Ключ сравнения None отличается от непереданного."""
+        node = TreeNode("a", 1, None)
+        self.assertIsNone(node.sort_key)
+        self.assertEqual(TreeNode("a").sort_key, "a")
+
+    def test_key_function(self):
+        """Функция key задает порядок и равенство ключей."""
+        bst = BinarySearchTree(key=str.lower)
+        for word in ["banana", "Apple", "cherry"]:
+            bst.put(word, len(word))
+        bst.put("APPLE", 0)
+
+        self.assertEqual(len(bst), 3)
+        self.assertEqual(bst.select(0), "Apple")
+        self.assertEqual(bst.get("apple"), 0)
+        self.assertEqual(bst.ceiling("B"), "banana")
+        self.assertEqual(bst.rank("Cherry"), 2)
+        self.assertTrue(bst.is_valid_bst())
+
 
 if __name__ == '__main__':
     unittest.main()
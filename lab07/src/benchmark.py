@@ -0,0 +1,330 @@
+"""
+Бенчмарк построения кучи и сортировок с прогревом, повторами
+и сравнением с сохраненным базовым прогоном.
+"""
+import argparse
+import csv
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+from heap import Heap
+from heapsort import heapsort
+from perfomance_analysis import mergesort, quicksort
+
+# Поля записи результата в порядке столбцов CSV
+FIELDS = ['case', 'distribution', 'n', 'repeats', 'median', 'p95',
+          'stdev', 'mean', 'min', 'peak_bytes']
+
+# Метрики, по которым ищутся регрессии относительно базового прогона
+COMPARED_METRICS = ['median', 'peak_bytes']
+
+DISTRIBUTIONS = ['random', 'sorted', 'reversed', 'few_unique']
+
+
+def _build_heap(data: List[int]) -> None:
+    """Построение кучи алгоритмом build_heap."""
+    Heap(is_min=True).build_heap(data)
+
+
+def _insert_all(data: List[int]) -> None:
+    """Построение кучи последовательными вставками."""
+    heap = Heap(is_min=True)
+    for value in data:
+        heap.insert(value)
+
+
+CASES: Dict[str, Callable[[List[int]], object]] = {
+    'build_heap': _build_heap,
+    'insert': _insert_all,
+    'heapsort': heapsort,
+    'quicksort': quicksort,
+    'mergesort': mergesort,
+}
+
+
+def generate_input(n: int, distribution: str = 'random',
+                   seed: int = 42) -> List[int]:
+    """
+    Воспроизводимый входной массив.
+
+    Зерно смешивается с n и распределением, поэтому у каждой пары
+    (n, distribution) свой, но всегда одинаковый массив.
+
+    Args:
+        n: Количество элементов.
+        distribution: 'random', 'sorted', 'reversed' или 'few_unique'.
+        seed: Зерно генератора случайных чисел.
+    """
+    rng = random.Random(f"{seed}:{distribution}:{n}")
+
+    if distribution == 'random':
+        return [rng.randint(0, 10 * n) for _ in range(n)]
+    if distribution == 'sorted':
+        return sorted(rng.randint(0, 10 * n) for _ in range(n))
+    if distribution == 'reversed':
+        return sorted((rng.randint(0, 10 * n) for _ in range(n)),
+                      reverse=True)
+    if distribution == 'few_unique':
+        return [rng.randint(0, 9) for _ in range(n)]
+
+    raise ValueError(f"Неизвестное распределение: {distribution}")
+
+
+def summarize(times: Sequence[float]) -> Dict[str, float]:
+    """
+    Медиана, 95-й перцентиль, стандартное отклонение, среднее и минимум.
+    """
+    if len(times) > 1:
+        p95 = statistics.quantiles(times, n=20, method='inclusive')[18]
+        stdev = statistics.stdev(times)
+    else:
+        p95 = times[0]
+        stdev = 0.0
+    return {
+        'median': statistics.median(times),
+        'p95': p95,
+        'stdev': stdev,
+        'mean': statistics.fmean(times),
+        'min': min(times),
+    }
+
+
+def measure_case(func: Callable[[List[int]], object], data: List[int],
+                 repeats: int = 10, warmup: int = 2) -> Dict[str, float]:
+    """
+    Замер одной функции на одном входе.
+
+    Каждый запуск получает свою копию data (heapsort сортирует на месте),
+    копирование не входит в замер. Сборщик мусора на время замера
+    отключается. Пиковая память измеряется отдельным запуском под
+    tracemalloc, чтобы трассировка не искажала время.
+
+    Args:
+        func: Функция, принимающая массив.
+        data: Входной массив.
+        repeats: Количество замеряемых запусков.
+        warmup: Количество незамеряемых прогревочных запусков.
+
+    Returns:
+        Статистика времени в секундах (см. summarize) и peak_bytes.
+    """
+    if repeats < 1:
+        raise ValueError("repeats должен быть положительным")
+
+    for _ in range(warmup):
+        func(data[:])
+
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            array = data[:]
+            start = time.perf_counter()
+            func(array)
+            times.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    array = data[:]
+    tracemalloc.start()
+    func(array)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = summarize(times)
+    result['peak_bytes'] = peak
+    return result
+
+
+def run_benchmark(sizes: Sequence[int] = (1000, 10000, 100000),
+                  cases: Optional[Sequence[str]] = None,
+                  distributions: Sequence[str] = ('random',),
+                  repeats: int = 10, warmup: int = 2,
+                  seed: int = 42) -> Dict:
+    """
+    Полный прогон бенчмарка.
+
+    Returns:
+        Словарь {'meta': параметры прогона, 'results': список записей
+        с полями FIELDS}, пригодный для сохранения в JSON.
+    """
+    if cases is None:
+        cases = list(CASES)
+
+    results: Dict = {
+        'meta': {
+            'sizes': list(sizes),
+            'distributions': list(distributions),
+            'repeats': repeats,
+            'warmup': warmup,
+            'seed': seed,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+        },
+        'results': []
+    }
+
+    for distribution in distributions:
+        for n in sizes:
+            data = generate_input(n, distribution, seed)
+            for case in cases:
+                print(f"  {case} / {distribution} / n={n}...")
+                entry = {'case': case, 'distribution': distribution,
+                         'n': n, 'repeats': repeats}
+                entry.update(measure_case(CASES[case], data, repeats,
+                                          warmup))
+                results['results'].append(entry)
+
+    return results
+
+
+def save_json(results: Dict, path: str) -> None:
+    """Сохранение результатов в JSON."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def save_csv(results: Dict, path: str) -> None:
+    """Сохранение записей результатов в CSV."""
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        for entry in results['results']:
+            writer.writerow({field: entry[field] for field in FIELDS})
+
+
+def load_json(path: str) -> Dict:
+    """Загрузка результатов, сохраненных save_json."""
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compare_with_baseline(results: Dict, baseline: Dict,
+                          threshold: float = 0.10) -> List[Dict]:
+    """
+    Сравнение с базовым прогоном.
+
+    Сравниваются записи с одинаковыми (case, distribution, n) по метрикам
+    COMPARED_METRICS. Рост метрики больше чем в 1 + threshold раз
+    считается регрессией, уменьшение больше чем в 1 - threshold -
+    улучшением.
+
+    Args:
+        results: Текущий прогон.
+        baseline: Базовый прогон.
+        threshold: Допустимое относительное отклонение.
+
+    Returns:
+        Список записей {case, distribution, n, metric, baseline, current,
+        ratio, status}, где status - 'regression', 'improvement' или 'ok'.
+    """
+    reference = {(entry['case'], entry['distribution'], entry['n']): entry
+                 for entry in baseline['results']}
+    comparison = []
+
+    for entry in results['results']:
+        key = (entry['case'], entry['distribution'], entry['n'])
+        base = reference.get(key)
+        if base is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if base[metric] == 0:
+                continue
+            ratio = entry[metric] / base[metric]
+            if ratio > 1 + threshold:
+                status = 'regression'
+            elif ratio < 1 - threshold:
+                status = 'improvement'
+            else:
+                status = 'ok'
+            comparison.append({
+                'case': key[0], 'distribution': key[1], 'n': key[2],
+                'metric': metric, 'baseline': base[metric],
+                'current': entry[metric], 'ratio': ratio,
+                'status': status,
+            })
+
+    return comparison
+
+
+def print_summary(results: Dict) -> None:
+    """Таблица результатов."""
+    print(f"\n{'случай':<11} {'распред.':<11} {'n':>8} {'медиана, мс':>12} "
+          f"{'p95, мс':>10} {'σ, мс':>9} {'пик, КБ':>10}")
+    print("-" * 77)
+    for entry in results['results']:
+        print(f"{entry['case']:<11} {entry['distribution']:<11} "
+              f"{entry['n']:>8} {entry['median'] * 1000:>12.3f} "
+              f"{entry['p95'] * 1000:>10.3f} {entry['stdev'] * 1000:>9.3f} "
+              f"{entry['peak_bytes'] / 1024:>10.1f}")
+
+
+def print_comparison(comparison: List[Dict]) -> None:
+    """Таблица сравнения с базовым прогоном."""
+    print(f"\n{'случай':<11} {'распред.':<11} {'n':>8} {'метрика':<11} "
+          f"{'отношение':>9} статус")
+    print("-" * 65)
+    for row in comparison:
+        print(f"{row['case']:<11} {row['distribution']:<11} {row['n']:>8} "
+              f"{row['metric']:<11} {row['ratio']:>9.3f} {row['status']}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Запуск из командной строки.
+
+    Returns:
+        int: Код возврата: 1, если найдены регрессии, иначе 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000])
+    parser.add_argument('--cases', nargs='+', choices=list(CASES),
+                        default=list(CASES))
+    parser.add_argument('--distributions', nargs='+',
+                        choices=DISTRIBUTIONS, default=['random'])
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', default='report/benchmark.json',
+                        help='файл для результатов в JSON')
+    parser.add_argument('--csv', default='report/benchmark.csv',
+                        help='файл для результатов в CSV')
+    parser.add_argument('--baseline',
+                        help='JSON базового прогона для сравнения')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='допустимое относительное отклонение')
+    args = parser.parse_args(argv)
+
+    print("Бенчмарк кучи и сортировок...")
+    results = run_benchmark(args.sizes, args.cases, args.distributions,
+                            args.repeats, args.warmup, args.seed)
+    print_summary(results)
+    save_json(results, args.json)
+    save_csv(results, args.csv)
+    print(f"\nРезультаты сохранены в {args.json} и {args.csv}")
+
+    if args.baseline:
+        comparison = compare_with_baseline(results, load_json(args.baseline),
+                                           args.threshold)
+        print_comparison(comparison)
+        regressions = [row for row in comparison
+                       if row['status'] == 'regression']
+        if regressions:
+            print(f"\nРегрессий: {len(regressions)} "
+                  f"(порог {args.threshold:.0%})")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Приоритетные очереди для потоков и asyncio с ограниченной емкостью."""
+import asyncio
+import queue
+import threading
+from typing import Any, Optional, Tuple, Union
+
+from priority_queue import PriorityQueue
+
+
+class BlockingPriorityQueue:
+    """
+    Потокобезопасная приоритетная очередь с блокирующими put и get.
+
+    Элементы хранятся в PriorityQueue, доступ к ней защищен одной
+    блокировкой с двумя условиями: "не пусто" и "не полно". При
+    заполненной очереди put ждет освобождения места, что дает
+    производителям обратное давление.
+
+    Исключения совпадают со стандартным модулем queue: queue.Empty
+    и queue.Full при истечении таймаута или без ожидания.
+
+    Attributes:
+        maxsize (int): Максимальный размер, 0 - без ограничения.
+    """
+
+    def __init__(self, is_min: bool = True, maxsize: int = 0) -> None:
+        """
+        Инициализация очереди.
+
+        Args:
+            is_min (bool): True для min-очереди, False для max-очереди.
+            maxsize (int): Максимальное количество элементов, 0 - без
+                ограничения.
+        """
+        self.maxsize = maxsize
+        self._queue = PriorityQueue(is_min=is_min)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def _full(self) -> bool:
+        """Заполнена ли очередь (вызывается под блокировкой)."""
+        return 0 < self.maxsize <= len(self._queue)
+
+    def put(self, item: Any, priority: Union[int, float],
+            block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Добавление элемента. Временная сложность: O(log n).
+
+        Args:
+            item: Элемент.
+            priority: Приоритет элемента.
+            block: Ждать освобождения места в заполненной очереди.
+            timeout: Максимальное время ожидания в секундах.
+
+        Raises:
+            queue.Full: Если место не освободилось.
+        """
+        with self._not_full:
+            if self._full():
+                if not block:
+                    raise queue.Full
+                if not self._not_full.wait_for(lambda: not self._full(),
+                                               timeout):
+                    raise queue.Full
+            self._queue.enqueue(item, priority)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True,
+            timeout: Optional[float] = None
+            ) -> Tuple[Union[int, float], Any]:
+        """
+        Извлечение элемента с наивысшим приоритетом.
+
+        Временная сложность: O(log n).
+
+        Args:
+            block: Ждать появления элемента в пустой очереди.
+            timeout: Максимальное время ожидания в секундах.
+
+        Returns:
+            Кортеж (приоритет, элемент).
+
+        Raises:
+            queue.Empty: Если элемент не появился.
+        """
+        with self._not_empty:
+            if self._queue.is_empty():
+                if not block:
+                    raise queue.Empty
+                if not self._not_empty.wait_for(
+                        lambda: not self._queue.is_empty(), timeout):
+                    raise queue.Empty
+            result = self._queue.dequeue()
+            self._not_full.notify()
+            return result
+
+    def put_nowait(self, item: Any, priority: Union[int, float]) -> None:
+        """Добавление без ожидания."""
+        self.put(item, priority, block=False)
+
+    def get_nowait(self) -> Tuple[Union[int, float], Any]:
+        """Извлечение без ожидания."""
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Текущее количество элементов."""
+        with self._lock:
+            return len(self._queue)
+
+    def empty(self) -> bool:
+        """Пуста ли очередь."""
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        """Заполнена ли очередь."""
+        with self._lock:
+            return self._full()
+
+    def __len__(self) -> int:
+        """Текущее количество элементов."""
+        return self.qsize()
+
+
+class AsyncPriorityQueue:
+    """
+    Приоритетная очередь для asyncio с ограниченной емкостью.
+
+    Корутины put и get приостанавливаются, пока очередь заполнена или
+    пуста, не блокируя цикл событий. Все обращения выполняются в одном
+    потоке цикла событий, поэтому блокировка нужна только для условий
+    ожидания. Для таймаута используйте asyncio.wait_for.
+
+    Attributes:
+        maxsize (int): Максимальный размер, 0 - без ограничения.
+    """
+
+    def __init__(self, is_min: bool = True, maxsize: int = 0) -> None:
+        """
+        Инициализация очереди.
+
+        Args:
+            is_min (bool): True для min-очереди, False для max-очереди.
+            maxsize (int): Максимальное количество элементов, 0 - без
+                ограничения.
+        """
+        self.maxsize = maxsize
+        self._queue = PriorityQueue(is_min=is_min)
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    def full(self) -> bool:
+        """Заполнена ли очередь."""
+        return 0 < self.maxsize <= len(self._queue)
+
+    def empty(self) -> bool:
+        """Пуста ли очередь."""
+        return self._queue.is_empty()
+
+    def qsize(self) -> int:
+        """Текущее количество элементов."""
+        return len(self._queue)
+
+    async def put(self, item: Any, priority: Union[int, float]) -> None:
+        """
+        Добавление элемента с ожиданием свободного места.
+
+        Временная сложность: O(log n).
+        """
+        async with self._not_full:
+            await self._not_full.wait_for(lambda: not self.full())
+            self._queue.enqueue(item, priority)
+            self._not_empty.notify()
+
+    async def get(self) -> Tuple[Union[int, float], Any]:
+        """
+        Извлечение элемента с наивысшим приоритетом с ожиданием
+        появления элемента. Временная сложность: O(log n).
+
+        Returns:
+            Кортеж (приоритет, элемент).
+        """
+        async with self._not_empty:
+            await self._not_empty.wait_for(lambda: not self.empty())
+            result = self._queue.dequeue()
+            self._not_full.notify()
+            return result
+
+    def __len__(self) -> int:
+        """Текущее количество элементов."""
+        return self.qsize()
@@ -0,0 +1,160 @@
+"""Реализация d-арной кучи (min-heap и max-heap) на основе массива."""
+import operator
+from typing import List, Optional, Union
+
+
+class DaryHeap:
+    """
+    d-арная куча (min-heap или max-heap).
+
+    У каждого узла до arity потомков: потомки узла i занимают индексы
+    arity * i + 1 ... arity * i + arity, родитель - (i - 1) // arity.
+    Дерево получается ниже двоичного в log2(arity) раз, поэтому вставка
+    делает меньше шагов всплытия, а потомки одного узла лежат в массиве
+    рядом.
+
+    Функция сравнения выбирается один раз при создании кучи, а всплытие
+    и погружение перемещают "дырку": элементы на пути сдвигаются на одну
+    позицию, а сам элемент записывается один раз в конце.
+
+    Attributes:
+        heap (List): Массив для хранения элементов кучи.
+        is_min (bool): True для min-heap, False для max-heap.
+        arity (int): Количество потомков у узла.
+    """
+
+    def __init__(self, is_min: bool = True, arity: int = 4):
+        """
+        Инициализация кучи.
+
+        Args:
+            is_min (bool): Тип кучи. По умолчанию min-heap.
+            arity (int): Количество потомков у узла (не меньше 2).
+        """
+        if arity < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+        self.heap: List[Union[int, float]] = []
+        self.is_min = is_min
+        self.arity = arity
+        self._before = operator.lt if is_min else operator.gt
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Всплытие элемента. Временная сложность: O(log_d n).
+
+        Args:
+            index: Индекс элемента, который нужно поднять.
+        """
+        heap = self.heap
+        before = self._before
+        arity = self.arity
+        value = heap[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_value = heap[parent]
+            if not before(value, parent_value):
+                break
+            heap[index] = parent_value
+            index = parent
+        heap[index] = value
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Погружение элемента. Временная сложность: O(d log_d n).
+
+        Args:
+            index: Индекс элемента, который нужно опустить.
+        """
+        heap = self.heap
+        before = self._before
+        arity = self.arity
+        size = len(heap)
+        value = heap[index]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            best = first
+            best_value = heap[first]
+            last = first + arity
+            if last > size:
+                last = size
+            child = first + 1
+            while child < last:
+                child_value = heap[child]
+                if before(child_value, best_value):
+                    best = child
+                    best_value = child_value
+                child += 1
+            if not before(best_value, value):
+                break
+            heap[index] = best_value
+            index = best
+        heap[index] = value
+
+    def insert(self, value: Union[int, float]) -> None:
+        """
+        Вставка элемента в кучу. Временная сложность: O(log_d n).
+
+        Args:
+            value: Значение для вставки.
+        """
+        self.heap.append(value)
+        self._sift_up(len(self.heap) - 1)
+
+    def extract(self) -> Union[int, float]:
+        """
+        Извлечение корня кучи. Временная сложность: O(d log_d n).
+
+        Returns:
+            Значение корня.
+
+        Raises:
+            IndexError: Если куча пуста.
+        """
+        if not self.heap:
+            raise IndexError("Извлечение из пустой кучи!")
+        root = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self._sift_down(0)
+        return root
+
+    def peek(self) -> Optional[Union[int, float]]:
+        """
+        Просмотр корня без извлечения. Временная сложность: O(1).
+
+        Returns:
+            Значение корня или None, если куча пуста.
+        """
+        return self.heap[0] if self.heap else None
+
+    def build_heap(self, array: List[Union[int, float]]) -> None:
+        """
+        Построение кучи из произвольного массива. Временная сложность: O(n).
+
+        Args:
+            array: Исходный массив.
+        """
+        self.heap = array[:]
+        for i in range((len(self.heap) - 2) // self.arity, -1, -1):
+            self._sift_down(i)
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов в куче.
+
+        Returns:
+            int: Размер кучи.
+        """
+        return len(self.heap)
+
+    def __str__(self) -> str:
+        """
+        Строковое представление кучи.
+
+        Returns:
+            str: Строка с элементами кучи.
+        """
+        return str(self.heap)
@@ -103,6 +103,27 @@ class Heap:
             self._sift_down(0)
         return root
 
+    def replace(self, value: Union[int, float]) -> Union[int, float]:
+        """
+        Извлечение корня с одновременной вставкой нового значения.
+
+        Новое значение сразу ставится в корень и погружается, поэтому
+        операция выполняет одно погружение вместо извлечения и вставки.
+        Временная сложность: O(log n).
+
+        Args:
+            value: Значение для вставки.
+
+        Returns:
+            Прежнее значение корня.
+        """
+        if not self.heap:
+            raise IndexError("Извлечение из пустой кучи!")
+        root = self.heap[0]
+        self.heap[0] = value
+        self._sift_down(0)
+        return root
+
     def peek(self) -> Optional[Union[int, float]]:
         """
         Просмотр корня без извлечения. Временная сложность: O(1).
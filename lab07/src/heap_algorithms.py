@@ -0,0 +1,114 @@
+"""Потоковые алгоритмы на основе кучи: top-k и k-путевое слияние."""
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from heap import Heap
+
+
+def top_k(iterable: Iterable[Any], k: int,
+          key: Optional[Callable[[Any], Any]] = None,
+          largest: bool = True) -> List[Any]:
+    """
+    k наибольших (или наименьших) элементов потока.
+
+    Хранится куча только из k лучших элементов: при largest=True это
+    min-heap, корень которой - худший из отобранных. Очередной элемент
+    сравнивается с корнем за O(1) и заменяет его за O(log k) только если
+    он лучше, поэтому вход не материализуется целиком.
+
+    Временная сложность: O(n log k). Память: O(k).
+
+    Args:
+        iterable: Поток элементов.
+        k: Количество отбираемых элементов.
+        key: Функция, вычисляющая ключ сравнения.
+        largest: True для наибольших, False для наименьших.
+
+    Returns:
+        List: Отобранные элементы от лучшего к худшему. При равных ключах
+        раньше идет элемент, встретившийся в потоке раньше.
+    """
+    if k <= 0:
+        return []
+    if key is None:
+        def key(value):
+            return value
+
+    # Записи (ключ, порядковый номер, элемент): номер разрешает равенство
+    # ключей в пользу более раннего элемента и избавляет от сравнения
+    # самих элементов. Для наибольших номер берется со знаком минус,
+    # чтобы в min-heap при равных ключах худшим считался поздний элемент.
+    heap = Heap(is_min=largest)
+    sign = -1 if largest else 1
+    iterator = iter(iterable)
+
+    for index, item in zip(range(k), iterator):
+        heap.insert((key(item), sign * index, item))
+
+    if len(heap) == k:
+        worst = heap.heap[0][0]
+        for index, item in enumerate(iterator, k):
+            item_key = key(item)
+            if largest:
+                if not item_key > worst:
+                    continue
+            elif not item_key < worst:
+                continue
+            heap.replace((item_key, sign * index, item))
+            worst = heap.heap[0][0]
+
+    result = []
+    while len(heap) > 0:
+        result.append(heap.extract()[2])
+    result.reverse()
+    return result
+
+
+def k_way_merge(*iterables: Iterable[Any],
+                key: Optional[Callable[[Any], Any]] = None,
+                reverse: bool = False) -> Iterator[Any]:
+    """
+    Ленивое слияние отсортированных потоков.
+
+    В куче хранится по одному текущему элементу из каждого потока.
+    Извлеченный элемент заменяется следующим элементом того же потока,
+    поэтому потоки читаются по мере выдачи результата.
+
+    Временная сложность: O(n log m) для n элементов из m потоков.
+    Память: O(m).
+
+    Args:
+        *iterables: Потоки, отсортированные по key (по убыванию при
+            reverse=True).
+        key: Функция, вычисляющая ключ сравнения.
+        reverse: Потоки отсортированы по убыванию.
+
+    Yields:
+        Элементы в общем порядке сортировки. При равных ключах раньше
+        выдается элемент потока с меньшим номером.
+    """
+    if key is None:
+        def key(value):
+            return value
+
+    heap = Heap(is_min=not reverse)
+    iterators = [iter(iterable) for iterable in iterables]
+    # Номер потока со знаком, обратным направлению кучи, сохраняет
+    # устойчивость и при reverse=True
+    sign = -1 if reverse else 1
+    for index, iterator in enumerate(iterators):
+        for item in iterator:
+            heap.insert((key(item), sign * index, item))
+            break
+
+    while len(heap) > 1:
+        _, signed_index, item = heap.heap[0]
+        yield item
+        for next_item in iterators[sign * signed_index]:
+            heap.replace((key(next_item), signed_index, next_item))
+            break
+        else:
+            heap.extract()
+
+    if len(heap) == 1:
+        _, signed_index, item = heap.extract()
+        yield item
+        yield from iterators[sign * signed_index]
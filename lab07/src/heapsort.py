@@ -1,19 +1,77 @@
 """Реализация сортировки кучей (Heapsort) in-place."""
-from typing import List, Union
-from heap import Heap
+import operator
+from typing import Any, Callable, MutableSequence, Optional
 
 
-def heapsort(array: List[Union[int, float]], ascending: bool = True) -> None:
+def _sift_down(array: MutableSequence, index: int, end: int, value: Any,
+               before: Callable[[Any, Any], bool]) -> None:
+    """
+    Восходящее погружение Флойда.
+
+    Дырка в позиции index сначала спускается до листа вслед за лучшим
+    потомком (одно сравнение на уровень вместо двух), затем value
+    всплывает от листа до своего места. Поскольку корень после обмена
+    почти всегда опускается почти до самого низа, подъем короткий, и
+    общее число сравнений близко к n log n вместо 2 n log n.
+
+    Args:
+        array: Массив, в префиксе [0, end) которого хранится куча.
+        index: Позиция дырки.
+        end: Граница кучи.
+        value: Элемент, который нужно поместить в кучу.
+        before: before(a, b) истинно, если a должен быть выше b.
+    """
+    start = index
+    child = 2 * index + 1
+    while child < end:
+        right = child + 1
+        if right < end and before(array[right], array[child]):
+            child = right
+        array[index] = array[child]
+        index = child
+        child = 2 * index + 1
+
+    while index > start:
+        parent = (index - 1) // 2
+        parent_value = array[parent]
+        if not before(value, parent_value):
+            break
+        array[index] = parent_value
+        index = parent
+    array[index] = value
+
+
+def heapsort(array: MutableSequence, ascending: bool = True,
+             key: Optional[Callable[[Any], Any]] = None) -> None:
     """
     Сортировка кучей (in-place). Временная сложность: O(n log n).
 
+    Куча строится прямо в массиве вызывающего кода, дополнительная
+    память - O(1). Подходит для list, array.array и одномерных массивов
+    NumPy. Сортировка неустойчива.
+
     Args:
         array: Массив для сортировки.
         ascending: True для сортировки по возрастанию, False для убывания.
+        key: Функция, вычисляющая ключ сравнения. Ключи не кешируются
+            (это потребовало бы O(n) памяти) и вычисляются при каждом
+            сравнении.
     """
-    is_min = not ascending
-    heap = Heap(is_min=is_min)
-    heap.build_heap(array)
+    # Для сортировки по возрастанию нужна max-heap: корень уходит в конец
+    if key is None:
+        before = operator.gt if ascending else operator.lt
+    elif ascending:
+        def before(a, b):
+            return key(a) > key(b)
+    else:
+        def before(a, b):
+            return key(a) < key(b)
+
+    n = len(array)
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down(array, i, n, array[i], before)
 
-    for i in range(len(array) - 1, -1, -1):
-        array[i] = heap.extract()
+    for end in range(n - 1, 0, -1):
+        value = array[end]
+        array[end] = array[0]
+        _sift_down(array, 0, end, value, before)
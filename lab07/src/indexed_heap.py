@@ -0,0 +1,239 @@
+"""Индексированная куча с изменением приоритета и удалением по ключу."""
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+Number = Union[int, float]
+
+
+class IndexedHeap:
+    """
+    Индексированная куча (min-heap или max-heap).
+
+    Каждый элемент кучи - уникальный ключ с приоритетом. Словарь
+    positions хранит индекс ключа в массиве кучи, поэтому изменить
+    приоритет или удалить произвольный ключ можно за O(log n) без
+    дубликатов и ленивого удаления устаревших записей.
+
+    Attributes:
+        keys (List): Ключи в порядке массива кучи.
+        priorities (List): Приоритеты, параллельные keys.
+        positions (Dict): Индекс каждого ключа в массиве кучи.
+        is_min (bool): True для min-heap, False для max-heap.
+    """
+
+    def __init__(self, is_min: bool = True):
+        """
+        Инициализация индексированной кучи.
+
+        Args:
+            is_min (bool): Тип кучи. По умолчанию min-heap.
+        """
+        self.keys: List[Hashable] = []
+        self.priorities: List[Number] = []
+        self.positions: Dict[Hashable, int] = {}
+        self.is_min = is_min
+
+    def _compare(self, a: Number, b: Number) -> bool:
+        """
+        Сравнение двух приоритетов в зависимости от типа кучи.
+
+        Returns:
+            bool: True, если a должен находиться выше b.
+        """
+        if self.is_min:
+            return a < b
+        else:
+            return a > b
+
+    def _place(self, index: int, key: Hashable, priority: Number) -> None:
+        """Запись ключа в ячейку массива с обновлением индекса."""
+        self.keys[index] = key
+        self.priorities[index] = priority
+        self.positions[key] = index
+
+    def _sift_up(self, index: int) -> int:
+        """
+        Всплытие элемента. Временная сложность: O(log n).
+
+        Элементы-родители сдвигаются вниз в освободившуюся ячейку, а сам
+        элемент записывается один раз в конечную позицию.
+
+        Returns:
+            int: Итоговый индекс элемента.
+        """
+        key = self.keys[index]
+        priority = self.priorities[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not self._compare(priority, self.priorities[parent]):
+                break
+            self._place(index, self.keys[parent], self.priorities[parent])
+            index = parent
+        self._place(index, key, priority)
+        return index
+
+    def _sift_down(self, index: int) -> int:
+        """
+        Погружение элемента. Временная сложность: O(log n).
+
+        Returns:
+            int: Итоговый индекс элемента.
+        """
+        key = self.keys[index]
+        priority = self.priorities[index]
+        size = len(self.keys)
+        while 2 * index + 1 < size:
+            child = 2 * index + 1
+            right = child + 1
+            if right < size and self._compare(self.priorities[right],
+                                              self.priorities[child]):
+                child = right
+            if not self._compare(self.priorities[child], priority):
+                break
+            self._place(index, self.keys[child], self.priorities[child])
+            index = child
+        self._place(index, key, priority)
+        return index
+
+    def insert(self, key: Hashable, priority: Number) -> None:
+        """
+        Вставка ключа с приоритетом. Временная сложность: O(log n).
+
+        Raises:
+            ValueError: Если ключ уже есть в куче.
+        """
+        if key in self.positions:
+            raise ValueError(f"Ключ {key!r} уже есть в куче")
+        self.keys.append(key)
+        self.priorities.append(priority)
+        self._sift_up(len(self.keys) - 1)
+
+    def _pop_at(self, index: int) -> Tuple[Hashable, Number]:
+        """
+        Удаление элемента по индексу массива. Временная сложность: O(log n).
+
+        На место удаленного встает последний элемент и всплывает или
+        погружается в зависимости от своего приоритета.
+        """
+        key = self.keys[index]
+        priority = self.priorities[index]
+        del self.positions[key]
+
+        last_key = self.keys.pop()
+        last_priority = self.priorities.pop()
+        if index < len(self.keys):
+            self._place(index, last_key, last_priority)
+            if self._sift_up(index) == index:
+                self._sift_down(index)
+        return key, priority
+
+    def extract(self) -> Tuple[Hashable, Number]:
+        """
+        Извлечение корня кучи. Временная сложность: O(log n).
+
+        Returns:
+            Кортеж (ключ, приоритет).
+
+        Raises:
+            IndexError: Если куча пуста.
+        """
+        if not self.keys:
+            raise IndexError("Извлечение из пустой кучи!")
+        return self._pop_at(0)
+
+    def peek(self) -> Optional[Tuple[Hashable, Number]]:
+        """
+        Просмотр корня без извлечения. Временная сложность: O(1).
+
+        Returns:
+            Кортеж (ключ, приоритет) или None, если куча пуста.
+        """
+        if not self.keys:
+            return None
+        return self.keys[0], self.priorities[0]
+
+    def priority(self, key: Hashable) -> Number:
+        """
+        Текущий приоритет ключа. Временная сложность: O(1).
+
+        Raises:
+            KeyError: Если ключа нет в куче.
+        """
+        return self.priorities[self.positions[key]]
+
+    def update(self, key: Hashable, priority: Number) -> None:
+        """
+        Установка нового приоритета ключа в любую сторону.
+
+        Временная сложность: O(log n).
+
+        Raises:
+            KeyError: Если ключа нет в куче.
+        """
+        index = self.positions[key]
+        self.priorities[index] = priority
+        if self._sift_up(index) == index:
+            self._sift_down(index)
+
+    def decrease_key(self, key: Hashable, priority: Number) -> None:
+        """
+        Уменьшение приоритета ключа. Временная сложность: O(log n).
+
+        Raises:
+            KeyError: Если ключа нет в куче.
+            ValueError: Если новый приоритет больше текущего.
+        """
+        if priority > self.priority(key):
+            raise ValueError("Новый приоритет больше текущего")
+        self.update(key, priority)
+
+    def increase_key(self, key: Hashable, priority: Number) -> None:
+        """
+        Увеличение приоритета ключа. Временная сложность: O(log n).
+
+        Raises:
+            KeyError: Если ключа нет в куче.
+            ValueError: Если новый приоритет меньше текущего.
+        """
+        if priority < self.priority(key):
+            raise ValueError("Новый приоритет меньше текущего")
+        self.update(key, priority)
+
+    def remove(self, key: Hashable) -> Number:
+        """
+        Удаление произвольного ключа. Временная сложность: O(log n).
+
+        Returns:
+            Приоритет удаленного ключа.
+
+        Raises:
+            KeyError: Если ключа нет в куче.
+        """
+        return self._pop_at(self.positions[key])[1]
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        Проверка наличия ключа. Временная сложность: O(1).
+        """
+        return key in self.positions
+
+    def __contains__(self, key: Any) -> bool:
+        """Поддержка оператора in."""
+        return key in self.positions
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов в куче.
+
+        Returns:
+            int: Размер кучи.
+        """
+        return len(self.keys)
+
+    def __str__(self) -> str:
+        """
+        Строковое представление кучи.
+
+        Returns:
+            str: Строка с парами (ключ, приоритет) в порядке массива.
+        """
+        return str(list(zip(self.keys, self.priorities)))
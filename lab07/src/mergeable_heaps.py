@@ -0,0 +1,355 @@
+"""Сливаемые кучи: парная (pairing) и левосторонняя (leftist)."""
+import operator
+from typing import List, Optional, Union
+
+
+class _PairingNode:
+    """Узел парной кучи: первый потомок и следующий брат."""
+
+    __slots__ = ('value', 'child', 'sibling')
+
+    def __init__(self, value: Union[int, float]):
+        self.value = value
+        self.child: Optional['_PairingNode'] = None
+        self.sibling: Optional['_PairingNode'] = None
+
+
+class PairingHeap:
+    """
+    Парная куча (min-heap или max-heap).
+
+    Дерево с произвольным числом потомков, хранящееся в представлении
+    "первый потомок - следующий брат". Вставка и слияние выполняются
+    за O(1): корень с худшим значением становится первым потомком
+    другого. Извлечение попарно сливает потомков корня слева направо,
+    а затем результаты справа налево, что дает O(log n) амортизированно.
+
+    Attributes:
+        root: Корень дерева или None для пустой кучи.
+        is_min (bool): True для min-heap, False для max-heap.
+    """
+
+    def __init__(self, is_min: bool = True):
+        """
+        Инициализация кучи.
+
+        Args:
+            is_min (bool): Тип кучи. По умолчанию min-heap.
+        """
+        self.root: Optional[_PairingNode] = None
+        self.is_min = is_min
+        self._before = operator.lt if is_min else operator.gt
+        self._size = 0
+
+    def _link(self, a: Optional[_PairingNode],
+              b: Optional[_PairingNode]) -> Optional[_PairingNode]:
+        """Слияние двух деревьев. Временная сложность: O(1)."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if self._before(b.value, a.value):
+            a, b = b, a
+        b.sibling = a.child
+        a.child = b
+        return a
+
+    def insert(self, value: Union[int, float]) -> None:
+        """
+        Вставка элемента в кучу. Временная сложность: O(1).
+
+        Args:
+            value: Значение для вставки.
+        """
+        self.root = self._link(self.root, _PairingNode(value))
+        self._size += 1
+
+    def extract(self) -> Union[int, float]:
+        """
+        Извлечение корня кучи.
+
+        Временная сложность: O(log n) амортизированно.
+
+        Returns:
+            Значение корня.
+
+        Raises:
+            IndexError: Если куча пуста.
+        """
+        root = self.root
+        if root is None:
+            raise IndexError("Извлечение из пустой кучи!")
+
+        # Первый проход: слияние соседних пар потомков слева направо
+        pairs = []
+        child = root.child
+        while child is not None:
+            first = child
+            second = child.sibling
+            child = second.sibling if second is not None else None
+            first.sibling = None
+            if second is not None:
+                second.sibling = None
+            pairs.append(self._link(first, second))
+
+        # Второй проход: накопительное слияние справа налево
+        merged = None
+        for tree in reversed(pairs):
+            merged = self._link(tree, merged)
+
+        self.root = merged
+        self._size -= 1
+        return root.value
+
+    def peek(self) -> Optional[Union[int, float]]:
+        """
+        Просмотр корня без извлечения. Временная сложность: O(1).
+
+        Returns:
+            Значение корня или None, если куча пуста.
+        """
+        return self.root.value if self.root is not None else None
+
+    def build_heap(self, array: List[Union[int, float]]) -> None:
+        """
+        Построение кучи из произвольного массива. Временная сложность: O(n).
+
+        Args:
+            array: Исходный массив.
+        """
+        self.root = None
+        self._size = 0
+        for value in array:
+            self.insert(value)
+
+    def meld(self, other: 'PairingHeap') -> None:
+        """
+        Перенос всех элементов другой кучи в эту. Временная сложность: O(1).
+
+        Другая куча после слияния становится пустой.
+
+        Raises:
+            ValueError: Если у куч разный тип (min/max).
+        """
+        if other is self:
+            return
+        if other.is_min != self.is_min:
+            raise ValueError("Нельзя слить min-heap и max-heap")
+        self.root = self._link(self.root, other.root)
+        self._size += other._size
+        other.root = None
+        other._size = 0
+
+    def _values(self) -> List[Union[int, float]]:
+        """Элементы в порядке обхода дерева в глубину."""
+        values = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+        return values
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов в куче.
+
+        Returns:
+            int: Размер кучи.
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Строковое представление кучи.
+
+        Returns:
+            str: Строка с элементами кучи в порядке обхода дерева.
+        """
+        return str(self._values())
+
+
+class _LeftistNode:
+    """Узел левосторонней кучи с рангом (длиной правого пути)."""
+
+    __slots__ = ('value', 'left', 'right', 'rank')
+
+    def __init__(self, value: Union[int, float]):
+        self.value = value
+        self.left: Optional['_LeftistNode'] = None
+        self.right: Optional['_LeftistNode'] = None
+        self.rank = 1
+
+
+class LeftistHeap:
+    """
+    Левосторонняя куча (min-heap или max-heap).
+
+    Двоичное дерево, в котором ранг (длина самого правого пути до пустого
+    потомка) левого потомка не меньше ранга правого. Правый путь поэтому
+    содержит O(log n) узлов, и слияние двух куч, спускающееся только по
+    правым путям, выполняется за O(log n) в худшем случае.
+
+    Attributes:
+        root: Корень дерева или None для пустой кучи.
+        is_min (bool): True для min-heap, False для max-heap.
+    """
+
+    def __init__(self, is_min: bool = True):
+        """
+        Инициализация кучи.
+
+        Args:
+            is_min (bool): Тип кучи. По умолчанию min-heap.
+        """
+        self.root: Optional[_LeftistNode] = None
+        self.is_min = is_min
+        self._before = operator.lt if is_min else operator.gt
+        self._size = 0
+
+    def _merge(self, a: Optional[_LeftistNode],
+               b: Optional[_LeftistNode]) -> Optional[_LeftistNode]:
+        """
+        Слияние двух деревьев по правым путям. Временная сложность:
+        O(log n).
+
+        Правые пути проходятся сверху вниз с запоминанием узлов, затем
+        ранги восстанавливаются снизу вверх.
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        before = self._before
+        if before(b.value, a.value):
+            a, b = b, a
+        root = a
+        path = []
+        while True:
+            path.append(a)
+            if a.right is None:
+                a.right = b
+                break
+            if before(b.value, a.right.value):
+                a.right, b = b, a.right
+            a = a.right
+
+        for node in reversed(path):
+            left_rank = node.left.rank if node.left is not None else 0
+            right_rank = node.right.rank if node.right is not None else 0
+            if left_rank < right_rank:
+                node.left, node.right = node.right, node.left
+                left_rank, right_rank = right_rank, left_rank
+            node.rank = right_rank + 1
+        return root
+
+    def insert(self, value: Union[int, float]) -> None:
+        """
+        Вставка элемента в кучу. Временная сложность: O(log n).
+
+        Args:
+            value: Значение для вставки.
+        """
+        self.root = self._merge(self.root, _LeftistNode(value))
+        self._size += 1
+
+    def extract(self) -> Union[int, float]:
+        """
+        Извлечение корня кучи. Временная сложность: O(log n).
+
+        Returns:
+            Значение корня.
+
+        Raises:
+            IndexError: Если куча пуста.
+        """
+        root = self.root
+        if root is None:
+            raise IndexError("Извлечение из пустой кучи!")
+        self.root = self._merge(root.left, root.right)
+        self._size -= 1
+        return root.value
+
+    def peek(self) -> Optional[Union[int, float]]:
+        """
+        Просмотр корня без извлечения. Временная сложность: O(1).
+
+        Returns:
+            Значение корня или None, если куча пуста.
+        """
+        return self.root.value if self.root is not None else None
+
+    def build_heap(self, array: List[Union[int, float]]) -> None:
+        """
+        Построение кучи из произвольного массива. Временная сложность: O(n).
+
+        Одноэлементные кучи сливаются попарно раундами, как при
+        восходящем построении двоичной кучи.
+
+        Args:
+            array: Исходный массив.
+        """
+        trees: List[Optional[_LeftistNode]] = [_LeftistNode(value)
+                                               for value in array]
+        while len(trees) > 1:
+            merged = [self._merge(trees[i], trees[i + 1])
+                      for i in range(0, len(trees) - 1, 2)]
+            if len(trees) % 2:
+                merged.append(trees[-1])
+            trees = merged
+        self.root = trees[0] if trees else None
+        self._size = len(array)
+
+    def meld(self, other: 'LeftistHeap') -> None:
+        """
+        Перенос всех элементов другой кучи в эту. Временная сложность:
+        O(log n).
+
+        Другая куча после слияния становится пустой.
+
+        Raises:
+            ValueError: Если у куч разный тип (min/max).
+        """
+        if other is self:
+            return
+        if other.is_min != self.is_min:
+            raise ValueError("Нельзя слить min-heap и max-heap")
+        self.root = self._merge(self.root, other.root)
+        self._size += other._size
+        other.root = None
+        other._size = 0
+
+    def _values(self) -> List[Union[int, float]]:
+        """Элементы в прямом порядке обхода дерева."""
+        values = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return values
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов в куче.
+
+        Returns:
+            int: Размер кучи.
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Строковое представление кучи.
+
+        Returns:
+            str: Строка с элементами кучи в прямом порядке обхода.
+        """
+        return str(self._values())
@@ -0,0 +1,255 @@
+"""Куча для числовых приоритетов на типизированном массиве."""
+import operator
+from array import array
+from typing import Iterable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy не обязателен
+    np = None
+
+
+def _heapify_numpy(values, is_min: bool) -> None:
+    """
+    Векторизованное построение кучи в массиве NumPy на месте.
+
+    Узлы обрабатываются по уровням снизу вверх, как в алгоритме Флойда,
+    но все узлы одного уровня погружаются одновременно: их поддеревья не
+    пересекаются, поэтому обмены на каждом шаге можно выполнить одной
+    операцией над массивом индексов. Общая работа O(n), количество
+    вызовов NumPy - O(log^2 n).
+
+    Args:
+        values: Одномерный массив NumPy.
+        is_min: True для min-heap, False для max-heap.
+    """
+    n = len(values)
+    if n < 2:
+        return
+    before = np.less if is_min else np.greater
+    last_parent = (n - 2) // 2
+
+    depth = (last_parent + 1).bit_length() - 1
+    for level in range(depth, -1, -1):
+        start = (1 << level) - 1
+        end = min((1 << (level + 1)) - 1, last_parent + 1)
+        nodes = np.arange(start, end, dtype=np.int64)
+
+        while nodes.size:
+            left = 2 * nodes + 1
+            has_left = left < n
+            nodes = nodes[has_left]
+            left = left[has_left]
+            if not nodes.size:
+                break
+
+            best = left.copy()
+            right = left + 1
+            has_right = right < n
+            right = right[has_right]
+            pick_right = before(values[right], values[left[has_right]])
+            best[has_right] = np.where(pick_right, right, left[has_right])
+
+            swap = before(values[best], values[nodes])
+            nodes = nodes[swap]
+            best = best[swap]
+            parents = values[nodes]
+            values[nodes] = values[best]
+            values[best] = parents
+            nodes = best
+
+
+class NumericHeap:
+    """
+    Куча числовых приоритетов (min-heap или max-heap) на array.array.
+
+    Элементы хранятся в типизированном массиве ('d' - float64,
+    'q' - int64 и т.д.) без отдельных объектов Python на каждый элемент:
+    8 байт на элемент вместо указателя и объекта числа в списке. Емкость
+    выделяется заранее и удваивается при заполнении.
+
+    build_heap при наличии NumPy строит кучу векторизованно, без
+    создания объектов Python для элементов.
+
+    Attributes:
+        data (array): Буфер емкостью capacity, куча занимает первые
+            len(heap) элементов.
+        is_min (bool): True для min-heap, False для max-heap.
+        typecode (str): Тип элементов массива.
+    """
+
+    def __init__(self, is_min: bool = True, typecode: str = 'd',
+                 capacity: int = 16):
+        """
+        Инициализация кучи.
+
+        Args:
+            is_min (bool): Тип кучи. По умолчанию min-heap.
+            typecode (str): Код типа array.array.
+            capacity (int): Начальная емкость буфера.
+        """
+        self.is_min = is_min
+        self.typecode = typecode
+        self.data = array(typecode, bytes(array(typecode).itemsize
+                                          * max(capacity, 1)))
+        self._size = 0
+        self._before = operator.lt if is_min else operator.gt
+
+    @property
+    def capacity(self) -> int:
+        """Текущая емкость буфера."""
+        return len(self.data)
+
+    def _grow(self) -> None:
+        """Удвоение емкости буфера. Амортизированно O(1) на вставку."""
+        self.data.frombytes(bytes(len(self.data) * self.data.itemsize))
+
+    def _sift_up(self, index: int, value: Union[int, float]) -> None:
+        """
+        Всплытие значения из дырки index. Временная сложность: O(log n).
+        """
+        data = self.data
+        before = self._before
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_value = data[parent]
+            if not before(value, parent_value):
+                break
+            data[index] = parent_value
+            index = parent
+        data[index] = value
+
+    def _sift_down(self, index: int, value: Union[int, float]) -> None:
+        """
+        Погружение значения из дырки index. Временная сложность: O(log n).
+        """
+        data = self.data
+        before = self._before
+        size = self._size
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and before(data[right], data[child]):
+                child = right
+            child_value = data[child]
+            if not before(child_value, value):
+                break
+            data[index] = child_value
+            index = child
+            child = 2 * index + 1
+        data[index] = value
+
+    def insert(self, value: Union[int, float]) -> None:
+        """
+        Вставка элемента в кучу. Временная сложность: O(log n).
+
+        Args:
+            value: Значение для вставки.
+        """
+        if self._size == len(self.data):
+            self._grow()
+        self._size += 1
+        self._sift_up(self._size - 1, value)
+
+    def extract(self) -> Union[int, float]:
+        """
+        Извлечение корня кучи. Временная сложность: O(log n).
+
+        Returns:
+            Значение корня.
+
+        Raises:
+            IndexError: Если куча пуста.
+        """
+        if self._size == 0:
+            raise IndexError("Извлечение из пустой кучи!")
+        data = self.data
+        root = data[0]
+        self._size -= 1
+        if self._size > 0:
+            self._sift_down(0, data[self._size])
+        return root
+
+    def peek(self) -> Optional[Union[int, float]]:
+        """
+        Просмотр корня без извлечения. Временная сложность: O(1).
+
+        Returns:
+            Значение корня или None, если куча пуста.
+        """
+        return self.data[0] if self._size else None
+
+    def _to_numpy(self, values: Iterable[Union[int, float]]):
+        """
+        Копия values в виде массива NumPy типа кучи с теми же проверками,
+        что выполняет array.array при записи элементов.
+        """
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        source = np.asarray(values)
+        dtype = np.dtype(self.typecode)
+        if source.size and dtype.kind in 'iu':
+            if source.dtype.kind not in 'biu':
+                raise TypeError(
+                    f"Значения типа {source.dtype} нельзя записать "
+                    f"в целочисленную кучу '{self.typecode}'")
+            if not np.can_cast(source.dtype, dtype):
+                info = np.iinfo(dtype)
+                if source.min() < info.min or source.max() > info.max:
+                    raise OverflowError(
+                        f"Значение вне диапазона типа '{self.typecode}'")
+        return source.astype(dtype)
+
+    def build_heap(self, values: Iterable[Union[int, float]]) -> None:
+        """
+        Построение кучи из массива. Временная сложность: O(n).
+
+        Исходный массив не изменяется. Массив NumPy (или любой другой
+        вход при наличии NumPy) приводится к типу кучи и упорядочивается
+        векторизованно, после чего его байты копируются в буфер
+        без промежуточного объекта bytes. Допустимые значения те же, что
+        и у insert: дробные числа не усекаются молча до целых.
+
+        Args:
+            values: Массив NumPy, array.array, список или другой
+                итерируемый объект с числами.
+
+        Raises:
+            TypeError: Если в целочисленную кучу передаются не целые числа.
+            OverflowError: Если целое число не помещается в тип кучи.
+        """
+        if np is not None:
+            buffer = self._to_numpy(values)
+            _heapify_numpy(buffer, self.is_min)
+            self.data = array(self.typecode)
+            self.data.frombytes(memoryview(buffer).cast('B'))
+            self._size = len(self.data)
+        else:
+            self.data = array(self.typecode, values)
+            self._size = len(self.data)
+            for i in range(self._size // 2 - 1, -1, -1):
+                self._sift_down(i, self.data[i])
+        if not self.data:
+            self.data = array(self.typecode, [0])
+
+    def nbytes(self) -> int:
+        """Размер буфера элементов в байтах."""
+        return len(self.data) * self.data.itemsize
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов в куче.
+
+        Returns:
+            int: Размер кучи.
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Строковое представление кучи.
+
+        Returns:
+            str: Строка с элементами кучи.
+        """
+        return str(self.data[:self._size].tolist())
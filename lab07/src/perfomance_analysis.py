@@ -1,12 +1,26 @@
 """Экспериментальное исследование производительности кучи и сортировок."""
+import asyncio
+import threading
 import time
 import random
 import statistics
-from typing import List, Callable, Tuple, Union
+import tracemalloc
+from typing import Dict, List, Callable, Optional, Tuple, Union
 import matplotlib.pyplot as plt
+import numpy as np
 
+from concurrent_priority_queue import (
+    AsyncPriorityQueue, BlockingPriorityQueue
+)
+from dary_heap import DaryHeap
 from heap import Heap
+from heap_algorithms import k_way_merge, top_k
 from heapsort import heapsort
+from indexed_heap import IndexedHeap
+from mergeable_heaps import LeftistHeap, PairingHeap
+from numeric_heap import NumericHeap
+from priority_queue import PriorityQueue
+from timer_scheduler import TimerScheduler
 
 
 def measure_heap_construction(n: int, method: str = 'build_heap') -> float:
@@ -59,6 +73,420 @@ def measure_sorting_time(n: int, sort_func: Callable, **kwargs) -> float:
     return end - start
 
 
+def measure_rescheduling(n: int, updates: int,
+                         method: str = 'indexed') -> Tuple[float, int]:
+    """
+    Замер нагрузки с частым переназначением приоритетов.
+
+    Для n задач updates раз меняется приоритет случайной задачи, затем
+    все задачи извлекаются. Метод 'lazy' добавляет в Heap новую запись
+    и пропускает устаревшие при извлечении, 'indexed' меняет приоритет
+    в IndexedHeap на месте.
+
+    Args:
+        n: Количество задач.
+        updates: Количество изменений приоритета.
+        method: 'lazy' или 'indexed'.
+
+    Returns:
+        (время в секундах, максимальный размер кучи)
+    """
+    rng = random.Random(42)
+    plan = [(rng.randrange(n), rng.random()) for _ in range(updates)]
+    max_size = 0
+
+    start = time.perf_counter()
+
+    if method == 'lazy':
+        heap = Heap(is_min=True)
+        current = [0.0] * n
+        for task in range(n):
+            heap.insert((0.0, task))
+        for task, priority in plan:
+            current[task] = priority
+            heap.insert((priority, task))
+        max_size = len(heap)
+        done = [False] * n
+        while len(heap) > 0:
+            priority, task = heap.extract()
+            if done[task] or priority != current[task]:
+                continue
+            done[task] = True
+    elif method == 'indexed':
+        indexed = IndexedHeap(is_min=True)
+        for task in range(n):
+            indexed.insert(task, 0.0)
+        for task, priority in plan:
+            indexed.update(task, priority)
+        max_size = len(indexed)
+        while len(indexed) > 0:
+            indexed.extract()
+    else:
+        raise ValueError(f"Неизвестный метод: {method}")
+
+    end = time.perf_counter()
+    return end - start, max_size
+
+
+def measure_priority_queue(n: int, distinct: int,
+                           batch: bool = False) -> Tuple[float, float]:
+    """
+    Замер добавления и извлечения n элементов с distinct различными
+    приоритетами.
+
+    Args:
+        n: Количество элементов.
+        distinct: Количество различных приоритетов.
+        batch: Использовать enqueue_many/dequeue_many.
+
+    Returns:
+        (время добавления, время извлечения) в секундах.
+    """
+    rng = random.Random(42)
+    pairs = [(i, rng.randrange(distinct)) for i in range(n)]
+    pq = PriorityQueue(is_min=True)
+
+    start = time.perf_counter()
+    if batch:
+        pq.enqueue_many(pairs)
+    else:
+        for item, priority in pairs:
+            pq.enqueue(item, priority)
+    enqueue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if batch:
+        pq.dequeue_many(n)
+    else:
+        while not pq.is_empty():
+            pq.dequeue()
+    dequeue_time = time.perf_counter() - start
+
+    return enqueue_time, dequeue_time
+
+
+def measure_heap_throughput(heap, n: int, ops: int = 100000,
+                            seed: int = 42) -> Tuple[float, float]:
+    """
+    Пропускная способность кучи размера n.
+
+    Куча заполняется n случайными числами через build_heap, затем
+    замеряются ops вставок и ops извлечений, так что размер кучи во
+    время замера остается около n.
+
+    Returns:
+        (вставок в секунду, извлечений в секунду)
+    """
+    rng = random.Random(seed)
+    heap.build_heap([rng.random() for _ in range(n)])
+    values = [rng.random() for _ in range(ops)]
+
+    start = time.perf_counter()
+    for value in values:
+        heap.insert(value)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        heap.extract()
+    extract_time = time.perf_counter() - start
+
+    return ops / insert_time, ops / extract_time
+
+
+def _meld_binary_heaps(target: Heap, source: Heap) -> None:
+    """Слияние двоичных куч перестроением объединенного массива за O(n)."""
+    target.build_heap(target.heap + source.heap)
+    source.heap = []
+
+
+def measure_mergeable_workload(heap_factory: Callable, meld: Callable,
+                               shards: int = 8, ops: int = 50000,
+                               merge_ratio: float = 0.01,
+                               seed: int = 42) -> float:
+    """
+    Смешанная нагрузка на набор очередей-шардов.
+
+    Каждая операция с вероятностью merge_ratio сливает случайный шард
+    в другой, иначе вставляет элемент (60%) или извлекает корень (40%)
+    случайного шарда.
+
+    Args:
+        heap_factory: Конструктор пустой кучи.
+        meld: Функция слияния meld(target, source).
+        shards: Количество куч.
+        ops: Количество операций.
+        merge_ratio: Доля операций слияния.
+
+    Returns:
+        Время в секундах.
+    """
+    rng = random.Random(seed)
+    plan = [(rng.random(), rng.randrange(shards), rng.randrange(shards),
+             rng.random()) for _ in range(ops)]
+    heaps = [heap_factory() for _ in range(shards)]
+
+    start = time.perf_counter()
+    for roll, i, j, value in plan:
+        if roll < merge_ratio:
+            if i != j:
+                meld(heaps[i], heaps[j])
+        elif roll < merge_ratio + (1 - merge_ratio) * 0.6:
+            heaps[i].insert(value)
+        elif len(heaps[i]) > 0:
+            heaps[i].extract()
+    return time.perf_counter() - start
+
+
+def heapsort_with_heap_copy(array: List[Union[int, float]],
+                            ascending: bool = True) -> None:
+    """
+    Прежняя версия heapsort для сравнения: строит отдельный объект Heap
+    с копией массива и переписывает массив извлечениями из него.
+    """
+    heap = Heap(is_min=not ascending)
+    heap.build_heap(array)
+    for i in range(len(array) - 1, -1, -1):
+        array[i] = heap.extract()
+
+
+def measure_sort_memory(n: int, sort_func: Callable) -> Tuple[float, int]:
+    """
+    Время и пиковое выделение памяти (tracemalloc) при сортировке.
+
+    Returns:
+        (время в секундах, пик памяти в байтах сверх исходного массива)
+    """
+    data = [random.random() for _ in range(n)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    sort_func(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def measure_numeric_build(values: np.ndarray,
+                          numeric: bool) -> Tuple[float, float, float]:
+    """
+    Построение кучи из массива NumPy: Heap из списка чисел Python
+    против NumericHeap с векторизованным build_heap.
+
+    Время замеряется без tracemalloc, память - отдельным запуском.
+
+    Returns:
+        (время в секундах, байт на элемент после построения,
+        пик байт на элемент во время построения)
+    """
+    def build():
+        if numeric:
+            heap = NumericHeap(is_min=True)
+            heap.build_heap(values)
+        else:
+            heap = Heap(is_min=True)
+            heap.build_heap(values.tolist())
+        return heap
+
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    heap = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del heap
+    n = len(values)
+    return elapsed, current / n, peak / n
+
+
+def _wait_percentiles(waits: List[float]) -> Tuple[float, float]:
+    """Медиана и 99-й перцентиль времени ожидания в миллисекундах."""
+    cuts = statistics.quantiles(waits, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+def measure_blocking_queue(producers: int, consumers: int,
+                           items: int = 20000, maxsize: int = 100
+                           ) -> Tuple[float, float, float]:
+    """
+    Производители и потребители в потоках на BlockingPriorityQueue.
+
+    Каждый элемент несет момент постановки в очередь, потребитель
+    вычисляет время его ожидания в очереди.
+
+    Returns:
+        (элементов в секунду, медиана ожидания в мс, p99 ожидания в мс)
+    """
+    pq = BlockingPriorityQueue(is_min=True, maxsize=maxsize)
+    per_producer = items // producers
+    waits: List[List[float]] = [[] for _ in range(consumers)]
+
+    def produce(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(per_producer):
+            pq.put(time.perf_counter(), rng.randrange(10))
+
+    def consume(index: int) -> None:
+        local = waits[index]
+        while True:
+            _, enqueued = pq.get()
+            if enqueued is None:
+                return
+            local.append(time.perf_counter() - enqueued)
+
+    threads = ([threading.Thread(target=produce, args=(i,))
+                for i in range(producers)]
+               + [threading.Thread(target=consume, args=(i,))
+                  for i in range(consumers)])
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    for _ in range(consumers):
+        pq.put(None, float('inf'))
+    for thread in threads[producers:]:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_waits = [wait for local in waits for wait in local]
+    return (len(all_waits) / elapsed,) + _wait_percentiles(all_waits)
+
+
+def measure_async_queue(producers: int, consumers: int,
+                        items: int = 20000, maxsize: int = 100
+                        ) -> Tuple[float, float, float]:
+    """
+    То же для корутин на AsyncPriorityQueue.
+
+    Returns:
+        (элементов в секунду, медиана ожидания в мс, p99 ожидания в мс)
+    """
+    per_producer = items // producers
+    waits: List[float] = []
+
+    async def scenario() -> float:
+        pq = AsyncPriorityQueue(is_min=True, maxsize=maxsize)
+
+        async def produce(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(per_producer):
+                await pq.put(time.perf_counter(), rng.randrange(10))
+
+        async def consume() -> None:
+            while True:
+                _, enqueued = await pq.get()
+                if enqueued is None:
+                    return
+                waits.append(time.perf_counter() - enqueued)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+        await asyncio.gather(*(produce(i) for i in range(producers)))
+        for _ in range(consumers):
+            await pq.put(None, float('inf'))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+    return (len(waits) / elapsed,) + _wait_percentiles(waits)
+
+
+class LazyHeapScheduler:
+    """
+    Планировщик на обычной куче для сравнения с TimerScheduler: отмена
+    только помечает запись, а помеченные записи пропускаются при
+    извлечении.
+    """
+
+    def __init__(self) -> None:
+        self.heap = Heap(is_min=True)
+        self.now = 0.0
+        self._seq = 0
+
+    def schedule(self, delay: float, callback: Callable, *args) -> list:
+        """Планирование; дескриптор - изменяемая запись [отменена]."""
+        self._seq += 1
+        handle = [False]
+        self.heap.insert((self.now + delay, self._seq, handle, callback,
+                          args))
+        return handle
+
+    def cancel(self, handle: list) -> bool:
+        """Ленивая отмена за O(1)."""
+        if handle[0]:
+            return False
+        handle[0] = True
+        return True
+
+    def run_due(self, now: float) -> int:
+        """Запуск задач со сроком не позже now."""
+        self.now = now
+        fired = 0
+        heap = self.heap
+        while len(heap) > 0 and heap.peek()[0] <= now:
+            _, _, handle, callback, args = heap.extract()
+            if handle[0]:
+                continue
+            handle[0] = True
+            callback(*args)
+            fired += 1
+        return fired
+
+    def __len__(self) -> int:
+        """Количество записей в куче, включая отмененные."""
+        return len(self.heap)
+
+
+def measure_scheduler(scheduler, timers: int = 50000,
+                      cancel_ratio: float = 0.9,
+                      seed: int = 42) -> Dict[str, float]:
+    """
+    Нагрузка таймаутов: задачи планируются с задержкой до 1000 единиц
+    (5% - до 10^6), большая часть отменяется до срабатывания, затем
+    время проходит шагами по 1 единице до срабатывания оставшихся.
+
+    Returns:
+        Словарь с числом операций в секунду для schedule и cancel,
+        временем продвижения часов, числом сработавших задач и размером
+        очереди после отмены.
+    """
+    rng = random.Random(seed)
+    delays = [rng.uniform(0, 10 ** 6) if rng.random() < 0.05
+              else rng.uniform(0, 1000) for _ in range(timers)]
+
+    def callback() -> None:
+        pass
+
+    start = time.perf_counter()
+    handles = [scheduler.schedule(delay, callback) for delay in delays]
+    schedule_time = time.perf_counter() - start
+
+    cancelled = rng.sample(handles, int(timers * cancel_ratio))
+    start = time.perf_counter()
+    for handle in cancelled:
+        scheduler.cancel(handle)
+    cancel_time = time.perf_counter() - start
+    size_after_cancel = len(scheduler)
+
+    start = time.perf_counter()
+    fired = 0
+    for step in range(1, 1001):
+        fired += scheduler.run_due(float(step))
+    fired += scheduler.run_due(float(10 ** 6))
+    run_time = time.perf_counter() - start
+
+    return {
+        'schedule': timers / schedule_time,
+        'cancel': len(cancelled) / cancel_time,
+        'run_due': run_time,
+        'fired': fired,
+        'size_after_cancel': size_after_cancel,
+    }
+
+
 def quicksort(arr: List[int]) -> List[int]:
     """Быстрая сортировка (рекурсивная реализация)."""
     if len(arr) <= 1:
@@ -185,6 +613,237 @@ def run_sorting_comparison_experiment() -> Tuple[List[int], List[float],
     return sizes, heapsort_times, quicksort_times, mergesort_times
 
 
+def run_rescheduling_experiment() -> None:
+    """Эксперимент: ленивое удаление против индексированной кучи."""
+    n = 1000
+    print("\nЭксперимент 3: Переназначение приоритетов "
+          f"({n} задач)")
+    print("=" * 70)
+    print(f"{'updates':<10} {'lazy (s)':<12} {'lazy size':<12} "
+          f"{'indexed (s)':<12} {'indexed size':<12}")
+    print("-" * 70)
+
+    for updates in [1000, 5000, 20000, 50000]:
+        lazy_time, lazy_size = measure_rescheduling(n, updates, 'lazy')
+        indexed_time, indexed_size = measure_rescheduling(n, updates,
+                                                          'indexed')
+        print(f"{updates:<10} {lazy_time:<12.6f} {lazy_size:<12} "
+              f"{indexed_time:<12.6f} {indexed_size:<12}")
+
+
+def run_priority_collision_experiment() -> None:
+    """
+    Эксперимент: приоритетная очередь при массовых совпадениях
+    приоритетов. Время извлечения не должно расти при уменьшении числа
+    различных приоритетов.
+    """
+    n = 20000
+    print(f"\nЭксперимент 4: Совпадающие приоритеты ({n} элементов)")
+    print("=" * 70)
+    print(f"{'distinct':<10} {'enqueue (s)':<14} {'dequeue (s)':<14} "
+          f"{'enqueue_many':<14} {'dequeue_many':<14}")
+    print("-" * 70)
+
+    for distinct in [1, 10, 100, n]:
+        enqueue_time, dequeue_time = measure_priority_queue(n, distinct)
+        batch_enqueue, batch_dequeue = measure_priority_queue(
+            n, distinct, batch=True)
+        print(f"{distinct:<10} {enqueue_time:<14.6f} {dequeue_time:<14.6f} "
+              f"{batch_enqueue:<14.6f} {batch_dequeue:<14.6f}")
+
+
+def run_arity_experiment(sizes: Optional[List[int]] = None,
+                         ops: int = 100000) -> None:
+    """
+    Эксперимент: пропускная способность вставки и извлечения для Heap
+    и DaryHeap с арностью 2, 4 и 8 на кучах размером от 10^4 до 10^7.
+    """
+    if sizes is None:
+        sizes = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+    heaps: List[Tuple[str, Callable]] = [
+        ('Heap', lambda: Heap(is_min=True)),
+        ('d=2', lambda: DaryHeap(is_min=True, arity=2)),
+        ('d=4', lambda: DaryHeap(is_min=True, arity=4)),
+        ('d=8', lambda: DaryHeap(is_min=True, arity=8)),
+    ]
+
+    print(f"\nЭксперимент 5: Арность кучи ({ops} операций, тыс. оп/с)")
+    print("=" * 70)
+    print(f"{'n':<10} {'куча':<8} {'insert':<12} {'extract':<12}")
+    print("-" * 70)
+
+    for n in sizes:
+        for name, factory in heaps:
+            inserts, extracts = measure_heap_throughput(factory(), n, ops)
+            print(f"{n:<10} {name:<8} {inserts / 1000:<12.1f} "
+                  f"{extracts / 1000:<12.1f}")
+
+
+def run_mergeable_heaps_experiment() -> None:
+    """
+    Эксперимент: Heap (слияние перестроением), PairingHeap и LeftistHeap
+    на смешанной нагрузке вставка/извлечение/слияние.
+    """
+    heaps: List[Tuple[str, Callable, Callable]] = [
+        ('Heap', lambda: Heap(is_min=True), _meld_binary_heaps),
+        ('Pairing', lambda: PairingHeap(is_min=True),
+         lambda target, source: target.meld(source)),
+        ('Leftist', lambda: LeftistHeap(is_min=True),
+         lambda target, source: target.meld(source)),
+    ]
+
+    print("\nЭксперимент 6: Сливаемые кучи (50000 операций, 8 шардов)")
+    print("=" * 60)
+    print(f"{'слияния':<10} " + " ".join(f"{name + ' (s)':<14}"
+                                         for name, _, _ in heaps))
+    print("-" * 60)
+
+    for merge_ratio in [0.0, 0.01, 0.05, 0.2]:
+        times = [measure_mergeable_workload(factory, meld,
+                                            merge_ratio=merge_ratio)
+                 for _, factory, meld in heaps]
+        print(f"{merge_ratio:<10} "
+              + " ".join(f"{elapsed:<14.6f}" for elapsed in times))
+
+
+def run_streaming_experiment() -> None:
+    """
+    Эксперимент: top_k и k_way_merge против полной сортировки.
+
+    top_k читает генератор, не сохраняя поток; сортировке поток
+    приходится материализовать целиком. Для слияния серий выигрыш
+    k_way_merge - в памяти O(m) и ленивой выдаче, а не во времени:
+    встроенная сортировка сама находит готовые серии и сливает их в C.
+    """
+    k = 100
+    print(f"\nЭксперимент 7: top_k (k={k}) против сортировки")
+    print("=" * 60)
+    print(f"{'n':<10} {'top_k (s)':<14} {'sorted (s)':<14}")
+    print("-" * 60)
+
+    for n in [10 ** 4, 10 ** 5, 10 ** 6]:
+        start = time.perf_counter()
+        top_k((random.random() for _ in range(n)), k)
+        top_k_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sorted((random.random() for _ in range(n)), reverse=True)[:k]
+        sorted_time = time.perf_counter() - start
+
+        print(f"{n:<10} {top_k_time:<14.6f} {sorted_time:<14.6f}")
+
+    runs_count = 64
+    print(f"\nЭксперимент 8: слияние {runs_count} отсортированных серий")
+    print("=" * 60)
+    print(f"{'n':<10} {'k_way_merge (s)':<16} {'sorted (s)':<14}")
+    print("-" * 60)
+
+    for n in [10 ** 4, 10 ** 5, 10 ** 6]:
+        runs = [sorted(random.random() for _ in range(n // runs_count))
+                for _ in range(runs_count)]
+
+        start = time.perf_counter()
+        for _ in k_way_merge(*runs):
+            pass
+        merge_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sorted(value for run in runs for value in run)
+        sorted_time = time.perf_counter() - start
+
+        print(f"{n:<10} {merge_time:<16.6f} {sorted_time:<14.6f}")
+
+
+def run_inplace_heapsort_experiment() -> None:
+    """
+    Эксперимент: heapsort на месте против версии с копией в Heap.
+
+    Время замеряется при включенном tracemalloc, поэтому абсолютные
+    значения выше обычных, но соотношение сохраняется.
+    """
+    print("\nЭксперимент 9: heapsort на месте против копии в Heap")
+    print("=" * 70)
+    print(f"{'n':<10} {'in-place (s)':<14} {'пик, КБ':<10} "
+          f"{'copy (s)':<14} {'пик, КБ':<10}")
+    print("-" * 70)
+
+    for n in [1000, 10000, 100000]:
+        inplace_time, inplace_peak = measure_sort_memory(n, heapsort)
+        copy_time, copy_peak = measure_sort_memory(
+            n, heapsort_with_heap_copy)
+        print(f"{n:<10} {inplace_time:<14.6f} {inplace_peak / 1024:<10.1f} "
+              f"{copy_time:<14.6f} {copy_peak / 1024:<10.1f}")
+
+
+def run_producer_consumer_experiment() -> None:
+    """
+    Эксперимент: пропускная способность и время ожидания элементов
+    в ограниченных очередях при разном числе производителей и
+    потребителей.
+    """
+    print("\nЭксперимент 10: Производители и потребители (maxsize=100)")
+    print("=" * 76)
+    print(f"{'очередь':<10} {'P x C':<8} {'эл/с':<12} "
+          f"{'p50, мс':<10} {'p99, мс':<10}")
+    print("-" * 76)
+
+    for producers, consumers in [(1, 1), (4, 4), (8, 2), (2, 8)]:
+        for name, measure in [('threads', measure_blocking_queue),
+                              ('asyncio', measure_async_queue)]:
+            throughput, p50, p99 = measure(producers, consumers)
+            print(f"{name:<10} {f'{producers}x{consumers}':<8} "
+                  f"{throughput:<12.0f} {p50:<10.3f} {p99:<10.3f}")
+
+
+def run_timer_experiment() -> None:
+    """
+    Эксперимент: колесо таймеров против кучи с ленивым удалением при
+    отмене большей части задач.
+    """
+    print("\nЭксперимент 11: Таймеры (50000 задач)")
+    print("=" * 86)
+    print(f"{'отмена':<8} {'планировщик':<12} {'schedule/с':<12} "
+          f"{'cancel/с':<12} {'run_due (s)':<12} {'сработало':<10} "
+          f"{'размер':<8}")
+    print("-" * 86)
+
+    for cancel_ratio in [0.5, 0.9, 0.99]:
+        for name, scheduler in [('wheel', TimerScheduler(tick=1.0)),
+                                ('lazy heap', LazyHeapScheduler())]:
+            result = measure_scheduler(scheduler, cancel_ratio=cancel_ratio)
+            print(f"{cancel_ratio:<8} {name:<12} {result['schedule']:<12.0f} "
+                  f"{result['cancel']:<12.0f} {result['run_due']:<12.4f} "
+                  f"{result['fired']:<10} "
+                  f"{result['size_after_cancel']:<8}")
+
+
+def run_numeric_heap_experiment(
+        sizes: Optional[List[int]] = None) -> None:
+    """
+    Эксперимент: построение кучи из массива float64 - Heap на списке
+    объектов Python против NumericHeap на array.array.
+    """
+    if sizes is None:
+        sizes = [10**5, 10**6, 10**7]
+    rng = np.random.default_rng(42)
+
+    print("\nЭксперимент 12: Куча на типизированном массиве (float64)")
+    print("=" * 70)
+    print(f"{'n':<10} {'Heap (s)':<10} {'байт/эл':<9} {'пик':<9} "
+          f"{'Numeric (s)':<12} {'байт/эл':<9} {'пик':<9}")
+    print("-" * 70)
+
+    for n in sizes:
+        values = rng.random(n)
+        heap_time, heap_bytes, heap_peak = measure_numeric_build(
+            values, numeric=False)
+        numeric_time, numeric_bytes, numeric_peak = measure_numeric_build(
+            values, numeric=True)
+        print(f"{n:<10} {heap_time:<10.3f} {heap_bytes:<9.1f} "
+              f"{heap_peak:<9.1f} {numeric_time:<12.3f} "
+              f"{numeric_bytes:<9.1f} {numeric_peak:<9.1f}")
+
+
 def plot_results(
     sizes: List[int],
     insert_times: List[float],
@@ -227,6 +886,15 @@ if __name__ == '__main__':
     sizes_sort, heapsort_times, quicksort_times, mergesort_times = (
         run_sorting_comparison_experiment()
     )
+    run_rescheduling_experiment()
+    run_priority_collision_experiment()
+    run_arity_experiment()
+    run_mergeable_heaps_experiment()
+    run_streaming_experiment()
+    run_inplace_heapsort_experiment()
+    run_producer_consumer_experiment()
+    run_timer_experiment()
+    run_numeric_heap_experiment()
     plot_results(
         sizes, insert_times, build_heap_times,
         heapsort_times, quicksort_times, mergesort_times
@@ -1,5 +1,6 @@
 """Реализация приоритетной очереди на основе кучи."""
-from typing import Any, Dict, List, Optional, Tuple, Union
+from itertools import count
+from typing import Any, Iterable, List, Optional, Tuple, Union
 from heap import Heap
 
 
@@ -7,9 +8,15 @@ class PriorityQueue:
     """
     Приоритетная очередь на основе кучи.
 
+    В куче хранятся записи (ключ, номер, элемент). Ключ равен приоритету
+    для min-очереди и приоритету со знаком минус для max-очереди, поэтому
+    куча всегда минимальная. Номер вставки растет монотонно: элементы
+    с одинаковым приоритетом извлекаются в порядке добавления, а сами
+    элементы никогда не сравниваются.
+
     Attributes:
-        heap (Heap): Куча для хранения приоритетов.
-        items (Dict): Словарь для хранения элементов по приоритетам.
+        heap (Heap): Куча записей (ключ, номер, элемент).
+        is_min (bool): True для min-очереди, False для max-очереди.
     """
 
     def __init__(self, is_min: bool = True) -> None:
@@ -19,8 +26,21 @@ class PriorityQueue:
         Args:
             is_min (bool): True для min-heap, False для max-heap.
         """
-        self.heap = Heap(is_min=is_min)
-        self.items: Dict[Union[int, float], List[Any]] = {}
+        self.heap = Heap(is_min=True)
+        self.is_min = is_min
+        self._counter = count()
+
+    def _entry(self, item: Any,
+               priority: Union[int, float]) -> Tuple[Any, int, Any]:
+        """Запись кучи для элемента с приоритетом."""
+        key = priority if self.is_min else -priority
+        return (key, next(self._counter), item)
+
+    def _result(self, entry: Tuple[Any, int, Any]
+                ) -> Tuple[Union[int, float], Any]:
+        """Кортеж (приоритет, элемент) из записи кучи."""
+        key, _, item = entry
+        return (key if self.is_min else -key, item)
 
     def enqueue(self, item: Any, priority: Union[int, float]) -> None:
         """
@@ -30,35 +50,58 @@ class PriorityQueue:
             item (Any): Элемент для добавления.
             priority (Union[int, float]): Приоритет элемента.
         """
-        self.heap.insert(priority)
+        self.heap.insert(self._entry(item, priority))
+
+    def enqueue_many(self,
+                     pairs: Iterable[Tuple[Any, Union[int, float]]]) -> None:
+        """
+        Пакетное добавление пар (элемент, приоритет).
 
-        if priority not in self.items:
-            self.items[priority] = []
-        self.items[priority].append(item)
+        Если пакет больше текущей очереди, куча перестраивается целиком
+        за O(n + k), иначе элементы вставляются по одному за O(k log n).
+        Порядок элементов с равным приоритетом соответствует порядку
+        в пакете.
 
-    def dequeue(self) -> Optional[Tuple[Union[int, float], Any]]:
+        Args:
+            pairs: Пары (элемент, приоритет).
+        """
+        entries = [self._entry(item, priority) for item, priority in pairs]
+        if len(entries) > len(self.heap):
+            self.heap.build_heap(self.heap.heap + entries)
+        else:
+            for entry in entries:
+                self.heap.insert(entry)
+
+    def dequeue(self) -> Tuple[Union[int, float], Any]:
         """
         Извлечение элемента с наивысшим приоритетом.
 
-        Временная сложность: O(log n) + O(k), где k - количество элементов
+        Временная сложность: O(log n) независимо от количества элементов
         с одинаковым приоритетом.
 
         Returns:
-            Optional[Tuple[Union[int, float], Any]]:
-            Кортеж (приоритет, элемент)
-            или None, если очередь пуста.
+            Tuple[Union[int, float], Any]: Кортеж (приоритет, элемент).
+
+        Raises:
+            IndexError: Если очередь пуста.
         """
-        priority = self.heap.extract()
-        if priority is None:
-            return None
+        return self._result(self.heap.extract())
 
-        if (priority in self.items and self.items[priority]):
-            item = self.items[priority].pop(0)
-            if not self.items[priority]:
-                del self.items[priority]
-            return (priority, item)
+    def dequeue_many(self, k: int) -> List[Tuple[Union[int, float], Any]]:
+        """
+        Извлечение до k элементов с наивысшим приоритетом.
 
-        return None
+        Временная сложность: O(k log n).
+
+        Args:
+            k: Максимальное количество элементов.
+
+        Returns:
+            List: Кортежи (приоритет, элемент) в порядке извлечения.
+        """
+        extract = self.heap.extract
+        result = self._result
+        return [result(extract()) for _ in range(min(k, len(self.heap)))]
 
     def peek(self) -> Optional[Tuple[Union[int, float], Any]]:
         """
@@ -71,14 +114,10 @@ class PriorityQueue:
             Кортеж (приоритет, элемент)
             или None, если очередь пуста.
         """
-        priority = self.heap.peek()
-        if priority is None or priority not in self.items:
+        entry = self.heap.peek()
+        if entry is None:
             return None
-
-        if self.items[priority]:
-            return (priority, self.items[priority][0])
-
-        return None
+        return self._result(entry)
 
     def __len__(self) -> int:
         """
@@ -105,4 +144,4 @@ class PriorityQueue:
         Returns:
             str: Строка с информацией о размере очереди.
         """
-        return f"PriorityQueue(size={len(self)}, is_min={self.heap.is_min})"
+        return f"PriorityQueue(size={len(self)}, is_min={self.is_min})"
@@ -0,0 +1,259 @@
+"""Планировщик отложенных задач: иерархическое колесо таймеров и куча."""
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+from indexed_heap import IndexedHeap
+
+
+class Timer:
+    """
+    Дескриптор запланированной задачи.
+
+    Attributes:
+        deadline (float): Момент срабатывания.
+        callback (Callable): Вызываемая функция.
+        args (tuple): Аргументы вызова.
+        active (bool): Задача запланирована и еще не сработала или не
+            отменена.
+    """
+
+    __slots__ = ('deadline', 'tick', 'callback', 'args', 'seq',
+                 'level', 'slot', 'active')
+
+    def __init__(self, deadline: float, tick: int, callback: Callable,
+                 args: tuple, seq: int):
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self.seq = seq
+        # Уровень колеса или -1 для кучи дальних задач
+        self.level = 0
+        self.slot = 0
+        self.active = True
+
+
+class TimerScheduler:
+    """
+    Планировщик с иерархическим колесом таймеров.
+
+    Время делится на тики длиной tick. Колесо состоит из levels уровней
+    по slots корзин: корзина уровня l охватывает slots^l тиков. Задача
+    кладется на самый низкий уровень, в пределах которого ее тик
+    совпадает с текущим по всем старшим разрядам. Когда текущий тик
+    доходит до корзины старшего уровня, ее задачи переносятся ниже
+    (каскадирование). Вставка и отмена в колесе - O(1).
+
+    Задачи дальше охвата колеса (slots^levels тиков) хранятся
+    в IndexedHeap и переходят в колесо при входе текущего времени в их
+    диапазон; отмена такой задачи - O(log n) без "мертвых" записей.
+
+    Attributes:
+        now (float): Время последнего вызова run_due.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 64, levels: int = 3,
+                 start: float = 0.0):
+        """
+        Инициализация планировщика.
+
+        Args:
+            tick (float): Длительность тика.
+            slots (int): Количество корзин на уровне (степень двойки).
+            levels (int): Количество уровней колеса.
+            start (float): Начальный момент времени.
+        """
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots должен быть степенью двойки")
+        if levels < 1:
+            raise ValueError("levels должен быть положительным")
+
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.now = start
+
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._span_bits = self._bits * levels
+        self._wheels: List[List[Dict[Timer, None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)]
+        self._far = IndexedHeap(is_min=True)
+        self._current = math.floor(start / tick)
+        self._wheel_count = 0
+        self._seq = 0
+
+    def _place(self, timer: Timer) -> None:
+        """
+        Размещение задачи в колесе или в куче. Временная сложность: O(1)
+        для колеса, O(log n) для кучи.
+        """
+        tick = timer.tick
+        current = self._current
+        if tick < current:
+            tick = current
+
+        bits = self._bits
+        for level in range(self.levels):
+            shift = bits * (level + 1)
+            if tick >> shift == current >> shift:
+                slot = (tick >> (bits * level)) & self._mask
+                timer.level = level
+                timer.slot = slot
+                self._wheels[level][slot][timer] = None
+                self._wheel_count += 1
+                return
+
+        timer.level = -1
+        self._far.insert(timer, timer.deadline)
+
+    def _cascade(self) -> None:
+        """
+        Перенос задач на нижние уровни при переходе текущего тика через
+        границу корзины старшего уровня.
+        """
+        current = self._current
+        bits = self._bits
+
+        if current & ((1 << self._span_bits) - 1) == 0:
+            # Начался новый полный оборот колеса
+            self._refill()
+
+        for level in range(self.levels - 1, 0, -1):
+            if current & ((1 << (bits * level)) - 1):
+                continue
+            slot = (current >> (bits * level)) & self._mask
+            bucket = self._wheels[level][slot]
+            if not bucket:
+                continue
+            self._wheels[level][slot] = {}
+            self._wheel_count -= len(bucket)
+            for timer in bucket:
+                self._place(timer)
+
+    def _fire(self, now: float) -> int:
+        """
+        Запуск задач текущего тика со сроком не позже now.
+
+        Задачи снимаются с колеса по одной непосредственно перед вызовом:
+        если обратный вызов бросит исключение, остальные задачи тика
+        останутся запланированными и сработают при следующем run_due.
+        Задачи, отмененные предыдущими обратными вызовами, пропускаются.
+        """
+        bucket = self._wheels[0][self._current & self._mask]
+        if not bucket:
+            return 0
+        due = [timer for timer in bucket if timer.deadline <= now]
+        due.sort(key=lambda timer: (timer.deadline, timer.seq))
+        fired = 0
+        for timer in due:
+            if not timer.active:
+                continue
+            del bucket[timer]
+            self._wheel_count -= 1
+            timer.active = False
+            fired += 1
+            timer.callback(*timer.args)
+        return fired
+
+    def schedule(self, delay: float, callback: Callable,
+                 *args: Any) -> Timer:
+        """
+        Планирование вызова callback(*args) через delay от now.
+
+        Временная сложность: O(1) для задач в пределах колеса,
+        O(log n) для дальних.
+
+        Returns:
+            Timer: Дескриптор для отмены.
+        """
+        deadline = self.now + delay
+        self._seq += 1
+        timer = Timer(deadline, math.floor(deadline / self.tick), callback,
+                      args, self._seq)
+        self._place(timer)
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """
+        Отмена задачи. Временная сложность: O(1) в колесе,
+        O(log n) в куче.
+
+        Returns:
+            bool: True, если задача была активна.
+        """
+        if not timer.active:
+            return False
+        timer.active = False
+        if timer.level < 0:
+            self._far.remove(timer)
+        else:
+            del self._wheels[timer.level][timer.slot][timer]
+            self._wheel_count -= 1
+        return True
+
+    def run_due(self, now: float) -> int:
+        """
+        Запуск всех задач со сроком не позже now в порядке сроков
+        в пределах тика.
+
+        Колесо проворачивается по тикам; если в колесе нет задач,
+        пустые тики пропускаются сразу.
+
+        Исключение из обратного вызова прерывает run_due; задачи, которые
+        еще не сработали, остаются запланированными.
+
+        Args:
+            now: Текущий момент времени (не меньше предыдущего).
+
+        Returns:
+            int: Количество сработавших задач.
+        """
+        if now < self.now:
+            raise ValueError("Время не может идти назад")
+        self.now = now
+        target = math.floor(now / self.tick)
+
+        fired = self._fire(now)
+        while self._current < target:
+            if self._wheel_count == 0:
+                # Колесо пусто: переходим сразу к целевому тику и
+                # забираем из кучи задачи его оборота
+                self._current = target
+                self._refill()
+            else:
+                self._current += 1
+                self._cascade()
+            fired += self._fire(now)
+        return fired
+
+    def _refill(self) -> None:
+        """
+        Перенос из кучи задач текущего оборота колеса (и просроченных,
+        если пустые тики были пропущены).
+        """
+        far = self._far
+        end = (self._current >> self._span_bits) + 1 << self._span_bits
+        while len(far) > 0 and far.peek()[0].tick < end:
+            self._place(far.extract()[0])
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Ближайший срок среди запланированных задач или None.
+
+        Временная сложность: O(n + slots * levels).
+        """
+        best = None
+        for wheel in self._wheels:
+            for bucket in wheel:
+                for timer in bucket:
+                    if best is None or timer.deadline < best:
+                        best = timer.deadline
+        far = self._far.peek()
+        if far is not None and (best is None or far[1] < best):
+            best = far[1]
+        return best
+
+    def __len__(self) -> int:
+        """Количество запланированных задач."""
+        return self._wheel_count + len(self._far)
@@ -0,0 +1,103 @@
+"""Unit-тесты для бенчмарка кучи и сортировок."""
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmark import (  # type: ignore # noqa: E402
+    CASES, FIELDS, compare_with_baseline, generate_input, load_json,
+    measure_case, run_benchmark, save_csv, save_json, summarize
+)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Тестирование бенчмарка."""
+
+    def test_generate_input_is_reproducible(self):
+        """Входные данные зависят только от зерна, n и распределения."""
+        self.assertEqual(generate_input(100, 'random', 1),
+                         generate_input(100, 'random', 1))
+        self.assertNotEqual(generate_input(100, 'random', 1),
+                            generate_input(100, 'random', 2))
+        data = generate_input(100, 'sorted')
+        self.assertEqual(data, sorted(data))
+        data = generate_input(100, 'reversed')
+        self.assertEqual(data, sorted(data, reverse=True))
+        self.assertLessEqual(len(set(generate_input(100, 'few_unique'))),
+                             10)
+        with self.assertRaises(ValueError):
+            generate_input(10, 'unknown')
+
+    def test_summarize(self):
+        """Медиана, перцентиль и разброс."""
+        stats = summarize([float(i) for i in range(1, 101)])
+        self.assertEqual(stats['median'], 50.5)
+        self.assertAlmostEqual(stats['p95'], 95.05)
+        self.assertEqual(stats['min'], 1.0)
+        self.assertGreater(stats['stdev'], 0)
+        single = summarize([2.0])
+        self.assertEqual((single['median'], single['p95'], single['stdev']),
+                         (2.0, 2.0, 0.0))
+
+    def test_measure_case_copies_input(self):
+        """Каждый запуск получает свою копию массива."""
+        data = generate_input(200)
+        original = data[:]
+        calls = []
+
+        def func(array):
+            calls.append(array == original)
+            array[:] = sorted(array)
+
+        stats = measure_case(func, data, repeats=3, warmup=2)
+        self.assertEqual(data, original)
+        # Прогрев, замеры и отдельный запуск под tracemalloc
+        self.assertEqual(calls, [True] * 6)
+        self.assertGreaterEqual(stats['p95'], stats['median'])
+        self.assertGreater(stats['peak_bytes'], 0)
+        with self.assertRaises(ValueError):
+            measure_case(func, data, repeats=0)
+
+    def test_run_and_save(self):
+        """Прогон всех случаев и сохранение в JSON и CSV."""
+        results = run_benchmark(sizes=[50], repeats=2, warmup=1)
+        self.assertEqual([entry['case'] for entry in results['results']],
+                         list(CASES))
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, 'result.json')
+            csv_path = os.path.join(directory, 'result.csv')
+            save_json(results, json_path)
+            save_csv(results, csv_path)
+            self.assertEqual(load_json(json_path), results)
+            with open(csv_path, encoding='utf-8') as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), len(CASES))
+        self.assertEqual(list(rows[0]), FIELDS)
+
+    def test_compare_with_baseline(self):
+        """Регрессии и улучшения относительно порога."""
+        def entry(case, median, peak):
+            return {'case': case, 'distribution': 'random', 'n': 10,
+                    'median': median, 'peak_bytes': peak}
+
+        baseline = {'results': [entry('heapsort', 1.0, 100),
+                                entry('quicksort', 1.0, 100)]}
+        current = {'results': [entry('heapsort', 1.2, 105),
+                               entry('quicksort', 0.5, 100),
+                               entry('mergesort', 9.0, 100)]}
+        comparison = compare_with_baseline(current, baseline, threshold=0.1)
+        statuses = {(row['case'], row['metric']): row['status']
+                    for row in comparison}
+        self.assertEqual(statuses, {
+            ('heapsort', 'median'): 'regression',
+            ('heapsort', 'peak_bytes'): 'ok',
+            ('quicksort', 'median'): 'improvement',
+            ('quicksort', 'peak_bytes'): 'ok',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
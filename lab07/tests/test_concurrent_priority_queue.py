@@ -0,0 +1,140 @@
+"""Unit-тесты для потокобезопасной и асинхронной приоритетных очередей."""
+import asyncio
+import queue
+import threading
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from concurrent_priority_queue import (  # type: ignore # noqa: E402
+    AsyncPriorityQueue, BlockingPriorityQueue
+)
+
+
+class TestBlockingPriorityQueue(unittest.TestCase):
+    """Тестирование потокобезопасной очереди."""
+
+    def test_priority_order(self):
+        """Тест порядка извлечения."""
+        pq = BlockingPriorityQueue(is_min=True)
+        pq.put("c", 3)
+        pq.put("a", 1)
+        pq.put("b", 2)
+        self.assertEqual([pq.get() for _ in range(3)],
+                         [(1, "a"), (2, "b"), (3, "c")])
+        self.assertTrue(pq.empty())
+
+    def test_timeouts(self):
+        """Тест таймаутов и операций без ожидания."""
+        pq = BlockingPriorityQueue(maxsize=1)
+        with self.assertRaises(queue.Empty):
+            pq.get(timeout=0.01)
+        with self.assertRaises(queue.Empty):
+            pq.get_nowait()
+        pq.put_nowait("a", 1)
+        self.assertTrue(pq.full())
+        with self.assertRaises(queue.Full):
+            pq.put("b", 2, timeout=0.01)
+        with self.assertRaises(queue.Full):
+            pq.put_nowait("b", 2)
+
+    def test_producers_consumers(self):
+        """Тест одновременной работы производителей и потребителей."""
+        pq = BlockingPriorityQueue(maxsize=8)
+        received = []
+        lock = threading.Lock()
+
+        def producer(start):
+            for i in range(start, start + 200):
+                pq.put(i, i % 7)
+
+        def consumer():
+            while True:
+                priority, item = pq.get()
+                if item is None:
+                    return
+                with lock:
+                    received.append(item)
+
+        producers = [threading.Thread(target=producer, args=(i * 200,))
+                     for i in range(4)]
+        consumers = [threading.Thread(target=consumer) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        for _ in consumers:
+            pq.put(None, float('inf'))
+        for thread in consumers:
+            thread.join(timeout=5)
+
+        self.assertEqual(sorted(received), list(range(800)))
+        self.assertEqual(len(pq), 0)
+
+
+class TestAsyncPriorityQueue(unittest.TestCase):
+    """Тестирование очереди для asyncio."""
+
+    def test_priority_order(self):
+        """Тест порядка извлечения в max-очереди."""
+        async def scenario():
+            pq = AsyncPriorityQueue(is_min=False)
+            for item, priority in [("a", 1), ("b", 3), ("c", 2)]:
+                await pq.put(item, priority)
+            return [await pq.get() for _ in range(3)]
+
+        self.assertEqual(asyncio.run(scenario()),
+                         [(3, "b"), (2, "c"), (1, "a")])
+
+    def test_backpressure(self):
+        """Тест ожидания put при заполненной очереди."""
+        async def scenario():
+            pq = AsyncPriorityQueue(maxsize=2)
+            await pq.put("a", 1)
+            await pq.put("b", 2)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(pq.put("c", 0), timeout=0.01)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(AsyncPriorityQueue().get(),
+                                       timeout=0.01)
+
+            waiting = asyncio.create_task(pq.put("c", 0))
+            await asyncio.sleep(0)
+            self.assertFalse(waiting.done())
+            self.assertEqual(await pq.get(), (1, "a"))
+            await waiting
+            return [await pq.get(), await pq.get()]
+
+        self.assertEqual(asyncio.run(scenario()), [(0, "c"), (2, "b")])
+
+    def test_producers_consumers(self):
+        """Тест нескольких производителей и потребителей."""
+        async def scenario():
+            pq = AsyncPriorityQueue(maxsize=4)
+            received = []
+
+            async def producer(start):
+                for i in range(start, start + 100):
+                    await pq.put(i, i % 5)
+
+            async def consumer():
+                while True:
+                    _, item = await pq.get()
+                    if item is None:
+                        return
+                    received.append(item)
+
+            consumers = [asyncio.create_task(consumer()) for _ in range(3)]
+            await asyncio.gather(*(producer(i * 100) for i in range(4)))
+            for _ in consumers:
+                await pq.put(None, float('inf'))
+            await asyncio.gather(*consumers)
+            return received
+
+        self.assertEqual(sorted(asyncio.run(scenario())), list(range(400)))
+
+
+if __name__ == '__main__':
+    unittest.main()
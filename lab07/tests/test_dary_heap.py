@@ -0,0 +1,69 @@
+"""Unit-тесты для класса DaryHeap."""
+import random
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dary_heap import DaryHeap  # type: ignore # noqa: E402
+
+
+class TestDaryHeap(unittest.TestCase):
+    """Тестирование d-арной кучи."""
+
+    def assert_heap_property(self, heap):
+        """Проверка свойства кучи для всех пар родитель-потомок."""
+        for i in range(1, len(heap.heap)):
+            parent = (i - 1) // heap.arity
+            if heap.is_min:
+                self.assertLessEqual(heap.heap[parent], heap.heap[i])
+            else:
+                self.assertGreaterEqual(heap.heap[parent], heap.heap[i])
+
+    def test_insert_extract(self):
+        """Тест вставки и извлечения для разных арностей."""
+        rng = random.Random(0)
+        data = [rng.randint(0, 1000) for _ in range(300)]
+        for arity in (2, 3, 4, 8):
+            for is_min in (True, False):
+                with self.subTest(arity=arity, is_min=is_min):
+                    heap = DaryHeap(is_min=is_min, arity=arity)
+                    for value in data:
+                        heap.insert(value)
+                    self.assert_heap_property(heap)
+                    result = [heap.extract() for _ in range(len(data))]
+                    self.assertEqual(result,
+                                     sorted(data, reverse=not is_min))
+                    with self.assertRaises(IndexError):
+                        heap.extract()
+
+    def test_build_heap(self):
+        """Тест построения кучи из массива."""
+        for arity in (2, 4, 8):
+            for n in (0, 1, 2, 9, 100):
+                with self.subTest(arity=arity, n=n):
+                    array = list(range(n, 0, -1))
+                    heap = DaryHeap(is_min=True, arity=arity)
+                    heap.build_heap(array)
+                    self.assertEqual(array, list(range(n, 0, -1)))
+                    self.assert_heap_property(heap)
+                    self.assertEqual(len(heap), n)
+
+    def test_peek_and_str(self):
+        """Тест просмотра корня и строкового представления."""
+        heap = DaryHeap(arity=4)
+        self.assertIsNone(heap.peek())
+        self.assertEqual(str(heap), "[]")
+        heap.insert(5)
+        heap.insert(2)
+        self.assertEqual(heap.peek(), 2)
+
+    def test_invalid_arity(self):
+        """Тест проверки арности."""
+        with self.assertRaises(ValueError):
+            DaryHeap(arity=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -113,6 +113,15 @@ class TestHeap(unittest.TestCase):
                 self.assertTrue(prev <= current)
             prev = current
 
+    def test_replace(self):
+        """Тест замены корня."""
+        heap = Heap(is_min=True)
+        with self.assertRaises(IndexError):
+            heap.replace(1)
+        heap.build_heap([4, 2, 6])
+        self.assertEqual(heap.replace(5), 2)
+        self.assertEqual([heap.extract() for _ in range(3)], [4, 5, 6])
+
     def test_len_and_str(self):
         """Тест методов __len__ и __str__."""
         heap = Heap(is_min=True)
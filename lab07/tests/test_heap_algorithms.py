@@ -0,0 +1,86 @@
+"""Unit-тесты для top_k и k_way_merge."""
+import random
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from heap_algorithms import k_way_merge, top_k  # type: ignore # noqa: E402
+
+
+class TestTopK(unittest.TestCase):
+    """Тестирование отбора k лучших элементов."""
+
+    def test_matches_sorted(self):
+        """Тест совпадения с полной сортировкой."""
+        rng = random.Random(0)
+        data = [rng.randint(0, 100) for _ in range(1000)]
+        for k in (0, 1, 10, 999, 1000, 2000):
+            with self.subTest(k=k):
+                self.assertEqual(top_k(data, k),
+                                 sorted(data, reverse=True)[:k])
+                self.assertEqual(top_k(data, k, largest=False),
+                                 sorted(data)[:k])
+
+    def test_key_and_stability(self):
+        """Тест функции ключа и порядка равных ключей."""
+        records = [("a", 3), ("b", 1), ("c", 3), ("d", 2), ("e", 3)]
+        self.assertEqual(top_k(records, 2, key=lambda r: r[1]),
+                         [("a", 3), ("c", 3)])
+        self.assertEqual(top_k(records, 2, key=lambda r: r[1],
+                               largest=False),
+                         [("b", 1), ("d", 2)])
+        items = [{"v": i % 3} for i in range(9)]
+        result = top_k(items, 4, key=lambda item: item["v"])
+        ids = [id(item) for item in items]
+        self.assertEqual([ids.index(id(item)) for item in result],
+                         [2, 5, 8, 1])
+
+    def test_stream(self):
+        """Тест работы с генератором."""
+        self.assertEqual(top_k((x * x for x in range(100)), 3),
+                         [9801, 9604, 9409])
+
+
+class TestKWayMerge(unittest.TestCase):
+    """Тестирование слияния отсортированных потоков."""
+
+    def test_matches_sorted(self):
+        """Тест совпадения с сортировкой объединения."""
+        rng = random.Random(1)
+        runs = [sorted(rng.randint(0, 1000) for _ in range(rng.randint(0, 50)))
+                for _ in range(16)]
+        merged = list(k_way_merge(*runs))
+        self.assertEqual(merged, sorted(x for run in runs for x in run))
+
+        descending = [run[::-1] for run in runs]
+        self.assertEqual(list(k_way_merge(*descending, reverse=True)),
+                         merged[::-1])
+
+    def test_stability_and_key(self):
+        """Тест порядка равных ключей и функции ключа."""
+        first = [(1, "a"), (2, "a")]
+        second = [(1, "b"), (2, "b")]
+        self.assertEqual(
+            list(k_way_merge(first, second, key=lambda pair: pair[0])),
+            [(1, "a"), (1, "b"), (2, "a"), (2, "b")])
+
+    def test_lazy(self):
+        """Тест ленивого чтения потоков."""
+        consumed = []
+
+        def stream(name, values):
+            for value in values:
+                consumed.append(name)
+                yield value
+
+        merged = k_way_merge(stream("x", [1, 4, 7]), stream("y", [2, 5]))
+        self.assertEqual(next(merged), 1)
+        self.assertEqual(consumed, ["x", "y"])
+        self.assertEqual(list(merged), [2, 4, 5, 7])
+        self.assertEqual(list(k_way_merge()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 """Unit-тесты для функции heapsort."""
+import random
 import unittest
+from array import array
 
 import os
 import sys
@@ -7,6 +9,11 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from heapsort import heapsort  # type: ignore  # noqa: E402
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestHeapsort(unittest.TestCase):
     """Тестирование сортировки кучей."""
@@ -66,6 +73,40 @@ class TestHeapsort(unittest.TestCase):
         heapsort(arr)
         self.assertEqual(id(arr), original_id)
 
+    def test_in_place_buffers(self):
+        """Тест сортировки array.array и массивов NumPy на месте."""
+        rng = random.Random(0)
+        data = [rng.randint(-1000, 1000) for _ in range(200)]
+
+        buffer = array('i', data)
+        heapsort(buffer)
+        self.assertEqual(list(buffer), sorted(data))
+
+        if np is not None:
+            values = np.array(data, dtype=np.int64)
+            heapsort(values, ascending=False)
+            self.assertEqual(values.tolist(), sorted(data, reverse=True))
+
+    def test_key(self):
+        """Тест сортировки по ключу."""
+        words = ["кот", "я", "собака", "ёж", "лошадь"]
+        heapsort(words, key=len)
+        self.assertEqual([len(word) for word in words], [1, 2, 3, 6, 6])
+
+        records = [(i, -i) for i in range(50)]
+        random.Random(1).shuffle(records)
+        heapsort(records, ascending=False, key=lambda record: record[1])
+        self.assertEqual(records, [(i, -i) for i in range(50)])
+
+    def test_random_arrays(self):
+        """Тест на случайных массивах разной длины."""
+        rng = random.Random(2)
+        for n in range(0, 70):
+            arr = [rng.randint(0, 20) for _ in range(n)]
+            expected = sorted(arr)
+            heapsort(arr)
+            self.assertEqual(arr, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
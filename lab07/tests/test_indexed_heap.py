@@ -0,0 +1,107 @@
+"""Unit-тесты для класса IndexedHeap."""
+import random
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from indexed_heap import IndexedHeap  # type: ignore # noqa: E402
+
+
+class TestIndexedHeap(unittest.TestCase):
+    """Тестирование индексированной кучи."""
+
+    def assert_heap_property(self, heap):
+        """Проверка свойства кучи и согласованности индексов."""
+        for i, key in enumerate(heap.keys):
+            self.assertEqual(heap.positions[key], i)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    self.assertFalse(heap._compare(heap.priorities[child],
+                                                   heap.priorities[i]))
+        self.assertEqual(len(heap.positions), len(heap))
+
+    def test_insert_extract(self):
+        """Тест извлечения ключей в порядке приоритетов."""
+        heap = IndexedHeap(is_min=True)
+        for key, priority in [('a', 5), ('b', 3), ('c', 8), ('d', 1)]:
+            heap.insert(key, priority)
+
+        self.assertEqual(heap.peek(), ('d', 1))
+        self.assertEqual([heap.extract() for _ in range(4)],
+                         [('d', 1), ('b', 3), ('a', 5), ('c', 8)])
+        self.assertIsNone(heap.peek())
+        with self.assertRaises(IndexError):
+            heap.extract()
+
+    def test_duplicate_key(self):
+        """Тест запрета повторной вставки ключа."""
+        heap = IndexedHeap()
+        heap.insert('a', 1)
+        with self.assertRaises(ValueError):
+            heap.insert('a', 2)
+
+    def test_decrease_increase_key(self):
+        """Тест изменения приоритета в min-heap и max-heap."""
+        heap = IndexedHeap(is_min=True)
+        for i in range(10):
+            heap.insert(i, i * 10)
+        heap.decrease_key(9, -1)
+        heap.increase_key(0, 100)
+        self.assert_heap_property(heap)
+        self.assertEqual(heap.extract(), (9, -1))
+        self.assertEqual(heap.priority(0), 100)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(1, 50)
+        with self.assertRaises(ValueError):
+            heap.increase_key(1, 0)
+
+        heap = IndexedHeap(is_min=False)
+        for i in range(10):
+            heap.insert(i, i)
+        heap.decrease_key(9, -5)
+        self.assertEqual(heap.extract(), (8, 8))
+        heap.increase_key(0, 20)
+        self.assertEqual(heap.extract(), (0, 20))
+
+    def test_remove_contains(self):
+        """Тест удаления произвольного ключа."""
+        heap = IndexedHeap()
+        for i in range(20):
+            heap.insert(f"k{i}", (i * 7) % 20)
+        self.assertTrue(heap.contains("k3"))
+        self.assertEqual(heap.remove("k3"), 1)
+        self.assertNotIn("k3", heap)
+        self.assert_heap_property(heap)
+        with self.assertRaises(KeyError):
+            heap.remove("k3")
+        self.assertEqual(len(heap), 19)
+
+    def test_random_operations(self):
+        """Тест случайной последовательности операций против эталона."""
+        rng = random.Random(1)
+        heap = IndexedHeap()
+        reference = {}
+        for step in range(2000):
+            action = rng.random()
+            key = rng.randrange(100)
+            if key not in reference and action < 0.5:
+                reference[key] = rng.randint(0, 1000)
+                heap.insert(key, reference[key])
+            elif key in reference and action < 0.8:
+                reference[key] = rng.randint(0, 1000)
+                heap.update(key, reference[key])
+            elif key in reference:
+                self.assertEqual(heap.remove(key), reference.pop(key))
+            if step % 100 == 0:
+                self.assert_heap_property(heap)
+
+        result = []
+        while heap:
+            result.append(heap.extract()[1])
+        self.assertEqual(result, sorted(reference.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unit-тесты для сливаемых куч."""
+import random
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mergeable_heaps import (  # type: ignore # noqa: E402
+    LeftistHeap, PairingHeap
+)
+
+HEAP_CLASSES = (PairingHeap, LeftistHeap)
+
+
+class TestMergeableHeaps(unittest.TestCase):
+    """Тестирование парной и левосторонней куч."""
+
+    def test_insert_extract(self):
+        """Тест вставки и извлечения в min-heap и max-heap."""
+        rng = random.Random(0)
+        data = [rng.randint(0, 1000) for _ in range(300)]
+        for cls in HEAP_CLASSES:
+            for is_min in (True, False):
+                with self.subTest(cls=cls.__name__, is_min=is_min):
+                    heap = cls(is_min=is_min)
+                    self.assertIsNone(heap.peek())
+                    for value in data:
+                        heap.insert(value)
+                    self.assertEqual(len(heap), len(data))
+                    result = [heap.extract() for _ in range(len(data))]
+                    self.assertEqual(result,
+                                     sorted(data, reverse=not is_min))
+                    with self.assertRaises(IndexError):
+                        heap.extract()
+
+    def test_build_heap(self):
+        """Тест построения кучи из массива."""
+        for cls in HEAP_CLASSES:
+            for n in (0, 1, 7, 100):
+                with self.subTest(cls=cls.__name__, n=n):
+                    array = list(range(n, 0, -1))
+                    heap = cls(is_min=True)
+                    heap.build_heap(array)
+                    self.assertEqual(len(heap), n)
+                    self.assertEqual(sorted(heap._values()), sorted(array))
+                    self.assertEqual([heap.extract() for _ in range(n)],
+                                     list(range(1, n + 1)))
+
+    def test_meld(self):
+        """Тест слияния куч."""
+        for cls in HEAP_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                first, second = cls(), cls()
+                first.build_heap([5, 1, 9])
+                second.build_heap([4, 0, 7, 3])
+                first.meld(second)
+                self.assertEqual(len(first), 7)
+                self.assertEqual(len(second), 0)
+                self.assertIsNone(second.peek())
+                self.assertEqual([first.extract() for _ in range(7)],
+                                 [0, 1, 3, 4, 5, 7, 9])
+
+                first.meld(cls())
+                self.assertEqual(len(first), 0)
+                with self.assertRaises(ValueError):
+                    first.meld(cls(is_min=False))
+
+    def test_mixed_operations(self):
+        """Тест случайной смеси вставок, извлечений и слияний."""
+        rng = random.Random(1)
+        for cls in HEAP_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                shards = [cls() for _ in range(4)]
+                reference = [[] for _ in range(4)]
+                for _ in range(2000):
+                    i = rng.randrange(4)
+                    action = rng.random()
+                    if action < 0.6:
+                        value = rng.randint(0, 100)
+                        shards[i].insert(value)
+                        reference[i].append(value)
+                    elif action < 0.95 and reference[i]:
+                        reference[i].remove(min(reference[i]))
+                        shards[i].extract()
+                    else:
+                        j = rng.randrange(4)
+                        if i != j:
+                            shards[i].meld(shards[j])
+                            reference[i].extend(reference[j])
+                            reference[j] = []
+                for shard, values in zip(shards, reference):
+                    self.assertEqual(len(shard), len(values))
+                    self.assertEqual(
+                        [shard.extract() for _ in range(len(values))],
+                        sorted(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
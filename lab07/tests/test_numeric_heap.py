@@ -0,0 +1,126 @@
+"""Unit-тесты для класса NumericHeap."""
+import random
+import unittest
+from unittest import mock
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np  # noqa: E402
+
+import numeric_heap  # type: ignore # noqa: E402
+from numeric_heap import NumericHeap  # type: ignore # noqa: E402
+
+
+class TestNumericHeap(unittest.TestCase):
+    """Тестирование кучи на типизированном массиве."""
+
+    def assert_heap_property(self, heap):
+        """Проверка свойства кучи для всех пар родитель-потомок."""
+        for i in range(1, len(heap)):
+            parent = (i - 1) // 2
+            if heap.is_min:
+                self.assertLessEqual(heap.data[parent], heap.data[i])
+            else:
+                self.assertGreaterEqual(heap.data[parent], heap.data[i])
+
+    def test_insert_extract(self):
+        """Тест вставки и извлечения для float64 и int64."""
+        rng = random.Random(0)
+        for typecode in ('d', 'q'):
+            data = [rng.randint(-1000, 1000) for _ in range(300)]
+            for is_min in (True, False):
+                with self.subTest(typecode=typecode, is_min=is_min):
+                    heap = NumericHeap(is_min=is_min, typecode=typecode)
+                    for value in data:
+                        heap.insert(value)
+                    self.assert_heap_property(heap)
+                    self.assertEqual(heap.peek(), min(data) if is_min
+                                     else max(data))
+                    result = [heap.extract() for _ in range(len(data))]
+                    self.assertEqual(result,
+                                     sorted(data, reverse=not is_min))
+                    self.assertIsNone(heap.peek())
+                    with self.assertRaises(IndexError):
+                        heap.extract()
+
+    def test_capacity_doubling(self):
+        """Емкость выделяется заранее и удваивается при заполнении."""
+        heap = NumericHeap(capacity=4)
+        self.assertEqual(heap.capacity, 4)
+        for value in range(4):
+            heap.insert(value)
+        self.assertEqual(heap.capacity, 4)
+        heap.insert(4)
+        self.assertEqual(heap.capacity, 8)
+        for value in range(5, 17):
+            heap.insert(value)
+        self.assertEqual(heap.capacity, 32)
+        self.assertEqual(heap.nbytes(), 32 * 8)
+        self.assertEqual(len(heap), 17)
+
+    def test_build_heap_numpy(self):
+        """Векторизованное построение из массива NumPy."""
+        rng = np.random.default_rng(1)
+        for n in (0, 1, 2, 3, 7, 8, 9, 100, 1023, 1024, 1025):
+            values = rng.random(n)
+            original = values.copy()
+            for is_min in (True, False):
+                with self.subTest(n=n, is_min=is_min):
+                    heap = NumericHeap(is_min=is_min)
+                    heap.build_heap(values)
+                    self.assert_heap_property(heap)
+                    np.testing.assert_array_equal(values, original)
+                    result = [heap.extract() for _ in range(n)]
+                    self.assertEqual(result, sorted(original.tolist(),
+                                                    reverse=not is_min))
+                    # После построения куча продолжает расти
+                    heap.insert(0.5)
+                    self.assertEqual(heap.extract(), 0.5)
+
+    def test_build_heap_int64(self):
+        """Построение целочисленной кучи из списка и массива NumPy."""
+        data = [5, 3, 8, 1, 9, 2, 7]
+        for values in (data, np.array(data, dtype=np.int64)):
+            heap = NumericHeap(typecode='q')
+            heap.build_heap(values)
+            self.assertEqual(str(heap), str(heap.data[:7].tolist()))
+            self.assertEqual([heap.extract() for _ in range(7)],
+                             sorted(data))
+
+    def test_build_heap_rejects_floats_for_int_typecode(self):
+        """Дробные значения не усекаются молча, как и при insert."""
+        for values in ([1.7, 0.2, 3.9], np.array([1.7, 0.2, 3.9])):
+            heap = NumericHeap(typecode='q')
+            with self.assertRaises(TypeError):
+                heap.build_heap(values)
+        with self.assertRaises(TypeError):
+            NumericHeap(typecode='q').insert(1.7)
+        with mock.patch.object(numeric_heap, 'np', None):
+            with self.assertRaises(TypeError):
+                NumericHeap(typecode='q').build_heap([1.7, 0.2, 3.9])
+
+        with self.assertRaises(OverflowError):
+            NumericHeap(typecode='b').build_heap([1, 300])
+        heap = NumericHeap(typecode='q')
+        heap.build_heap(iter([3, 1, 2]))
+        self.assertEqual([heap.extract() for _ in range(3)], [1, 2, 3])
+        heap = NumericHeap(typecode='q')
+        heap.build_heap([])
+        self.assertEqual(len(heap), 0)
+
+    def test_build_heap_without_numpy(self):
+        """Построение без NumPy выполняется алгоритмом Флойда."""
+        rng = random.Random(2)
+        data = [rng.random() for _ in range(200)]
+        with mock.patch.object(numeric_heap, 'np', None):
+            heap = NumericHeap(is_min=False)
+            heap.build_heap(data)
+        self.assert_heap_property(heap)
+        self.assertEqual([heap.extract() for _ in range(200)],
+                         sorted(data, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
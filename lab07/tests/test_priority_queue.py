@@ -88,6 +88,45 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertTrue(pq.is_empty())
         self.assertEqual(len(pq), 0)
 
+    def test_same_priority_fifo_max(self):
+        """Тест порядка добавления при равных приоритетах в max-очереди."""
+        pq = PriorityQueue(is_min=False)
+
+        for i in range(50):
+            pq.enqueue(f"задача {i}", i % 3)
+
+        order = [pq.dequeue() for _ in range(50)]
+        expected = ([(2, f"задача {i}") for i in range(2, 50, 3)]
+                    + [(1, f"задача {i}") for i in range(1, 50, 3)]
+                    + [(0, f"задача {i}") for i in range(0, 50, 3)])
+        self.assertEqual(order, expected)
+
+    def test_unorderable_items(self):
+        """Тест элементов, которые нельзя сравнивать между собой."""
+        pq = PriorityQueue(is_min=True)
+
+        first, second = {"id": 1}, {"id": 2}
+        pq.enqueue(first, 1)
+        pq.enqueue(second, 1)
+
+        self.assertIs(pq.dequeue()[1], first)
+        self.assertIs(pq.dequeue()[1], second)
+
+    def test_enqueue_many_dequeue_many(self):
+        """Тест пакетных операций."""
+        pq = PriorityQueue(is_min=True)
+        pq.enqueue("первая", 1)
+
+        pq.enqueue_many([("a", 2), ("b", 1), ("c", 2), ("d", 0)])
+        self.assertEqual(len(pq), 5)
+        pq.enqueue_many([("e", 1)])
+
+        self.assertEqual(pq.dequeue_many(4),
+                         [(0, "d"), (1, "первая"), (1, "b"), (1, "e")])
+        self.assertEqual(pq.dequeue_many(10), [(2, "a"), (2, "c")])
+        self.assertEqual(pq.dequeue_many(3), [])
+        self.assertTrue(pq.is_empty())
+
     def test_mixed_operations(self):
         """Тест смешанных операций."""
         pq = PriorityQueue(is_min=True)
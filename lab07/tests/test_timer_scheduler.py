@@ -0,0 +1,134 @@
+"""Unit-тесты для планировщика TimerScheduler."""
+import random
+import unittest
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from timer_scheduler import TimerScheduler  # type: ignore # noqa: E402
+
+
+class TestTimerScheduler(unittest.TestCase):
+    """Тестирование колеса таймеров."""
+
+    def test_fire_in_order(self):
+        """Тест срабатывания задач в порядке сроков."""
+        scheduler = TimerScheduler(tick=1.0, slots=8, levels=2)
+        fired = []
+        for delay in [5.5, 0.2, 3.0, 100.0, 1000.0]:
+            scheduler.schedule(delay, fired.append, delay)
+
+        self.assertEqual(scheduler.run_due(0.1), 0)
+        self.assertEqual(scheduler.run_due(5.4), 2)
+        self.assertEqual(fired, [0.2, 3.0])
+        self.assertEqual(scheduler.run_due(5.5), 1)
+        self.assertEqual(scheduler.next_deadline(), 100.0)
+        scheduler.run_due(2000)
+        self.assertEqual(fired, [0.2, 3.0, 5.5, 100.0, 1000.0])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_cancel(self):
+        """Тест отмены задач в колесе и в куче."""
+        scheduler = TimerScheduler(tick=1.0, slots=4, levels=2)
+        fired = []
+        near = scheduler.schedule(2, fired.append, "near")
+        far = scheduler.schedule(500, fired.append, "far")
+        kept = scheduler.schedule(3, fired.append, "kept")
+        self.assertEqual(len(scheduler), 3)
+
+        self.assertTrue(scheduler.cancel(near))
+        self.assertTrue(scheduler.cancel(far))
+        self.assertFalse(scheduler.cancel(near))
+        self.assertEqual(len(scheduler), 1)
+
+        scheduler.run_due(1000)
+        self.assertEqual(fired, ["kept"])
+        self.assertFalse(scheduler.cancel(kept))
+
+    def test_callback_exception_keeps_timers(self):
+        """Тест: исключение в обратном вызове не теряет остальные задачи."""
+        scheduler = TimerScheduler(tick=1.0, slots=8, levels=2)
+        fired = []
+
+        def fail():
+            raise RuntimeError("ошибка задачи")
+
+        scheduler.schedule(1.1, fired.append, "before")
+        scheduler.schedule(1.2, fail)
+        scheduler.schedule(1.3, fired.append, "same tick")
+        scheduler.schedule(4.0, fired.append, "later tick")
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run_due(10)
+        self.assertEqual(fired, ["before"])
+        self.assertEqual(len(scheduler), 2)
+
+        self.assertEqual(scheduler.run_due(10), 2)
+        self.assertEqual(fired, ["before", "same tick", "later tick"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_cancel_from_callback(self):
+        """Тест отмены задачи того же тика из обратного вызова."""
+        scheduler = TimerScheduler(tick=1.0, slots=8, levels=2)
+        fired = []
+        second = None
+
+        def cancel_second():
+            fired.append("first")
+            self.assertTrue(scheduler.cancel(second))
+
+        scheduler.schedule(1.1, cancel_second)
+        second = scheduler.schedule(1.2, fired.append, "second")
+        self.assertEqual(scheduler.run_due(2), 1)
+        self.assertEqual(fired, ["first"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_time_cannot_go_back(self):
+        """Тест запрета движения времени назад."""
+        scheduler = TimerScheduler()
+        scheduler.run_due(10)
+        with self.assertRaises(ValueError):
+            scheduler.run_due(5)
+
+    def test_random_against_reference(self):
+        """Тест случайной нагрузки: каждая задача срабатывает один раз
+        не раньше своего срока, отмененные не срабатывают."""
+        for seed in range(10):
+            rng = random.Random(seed)
+            scheduler = TimerScheduler(tick=1.0, slots=4, levels=2)
+            fired = []
+            expected = {}
+            timers = []
+            now = 0.0
+            for _ in range(400):
+                action = rng.random()
+                if action < 0.5:
+                    delay = rng.choice([rng.uniform(0, 5),
+                                        rng.uniform(0, 40),
+                                        rng.uniform(0, 500)])
+                    index = len(timers)
+                    timers.append(scheduler.schedule(
+                        delay, lambda i: fired.append((i, scheduler.now)),
+                        index))
+                    expected[index] = now + delay
+                elif action < 0.7 and timers:
+                    index = rng.randrange(len(timers))
+                    if scheduler.cancel(timers[index]):
+                        del expected[index]
+                else:
+                    now += rng.choice([0.3, 2.5, 17, 130])
+                    scheduler.run_due(now)
+                    for index, fire_time in fired:
+                        self.assertLessEqual(expected[index], fire_time)
+                    self.assertFalse([i for i, deadline in expected.items()
+                                      if deadline <= now
+                                      and i not in dict(fired)])
+
+            scheduler.run_due(now + 10000)
+            self.assertEqual(sorted(i for i, _ in fired), sorted(expected))
+            self.assertEqual(len(scheduler), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()